@@ -1,17 +1,10 @@
 #!/usr/bin/env python3
-import base64
 import signal
-import time
 
 import cv2
 import numpy as np
-from fastapi import Response
 
-from nicegui import Client, app, core, run, ui
-
-# In case you don't have a webcam, this will provide a black placeholder image.
-black_1px = 'iVBORw0KGgoAAAANSUhEUgAAAAEAAAABCAYAAAAfFcSJAAAAAXNSR0IArs4c6QAAAA1JREFUGFdjYGBg+A8AAQQBAHAgZQsAAAAASUVORK5CYII='
-placeholder = Response(content=base64.b64decode(black_1px.encode('ascii')), media_type='image/png')
+from nicegui import Client, FrameStream, app, core, run, ui
 
 
 def convert(frame: np.ndarray) -> bytes:
@@ -28,26 +21,24 @@ def setup() -> None:
     # OpenCV is used to access the webcam.
     video_capture = cv2.VideoCapture(0)
 
-    @app.get('/video/frame')
-    # Thanks to FastAPI's `app.get` it is easy to create a web route which always provides the latest image from OpenCV.
-    async def grab_video_frame() -> Response:
+    # A frame stream sends each frame only once to every connected browser and drops stale frames for slow connections.
+    stream = FrameStream()
+
+    async def grab_video_frame() -> None:
         if not video_capture.isOpened():
-            return placeholder
+            return
         # The `video_capture.read` call is a blocking function.
         # So we run it in a separate thread (default executor) to avoid blocking the event loop.
         _, frame = await run.io_bound(video_capture.read)
         if frame is None:
-            return placeholder
+            return
         # `convert` is a CPU-intensive function, so we run it in a separate process to avoid blocking the event loop and GIL.
-        jpeg = await run.cpu_bound(convert, frame)
-        return Response(content=jpeg, media_type='image/jpeg')
+        stream.push(await run.cpu_bound(convert, frame))
 
-    # For non-flickering image updates and automatic bandwidth adaptation an interactive image is much better than `ui.image()`.
-    video_image = ui.interactive_image().classes('w-full h-full')
-    # A timer constantly updates the source of the image.
-    # Because data from same paths is cached by the browser,
-    # we must force an update by adding the current timestamp to the source.
-    ui.timer(interval=0.1, callback=lambda: video_image.set_source(f'/video/frame?{time.time()}'))
+    # For non-flickering image updates an interactive image is much better than `ui.image()`.
+    ui.interactive_image(stream).classes('w-full h-full')
+    # A timer constantly grabs new frames from the webcam.
+    ui.timer(interval=0.1, callback=grab_video_frame)
 
     async def disconnect() -> None:
         """Disconnect all clients from current running server."""
@@ -64,6 +55,8 @@ def setup() -> None:
         # This prevents ugly stack traces when auto-reloading on code change,
         # because otherwise disconnected clients try to reconnect to the newly started server.
         await disconnect()
+        # End the open stream responses so that the server can shut down.
+        stream.close()
         # Release the webcam hardware so it can be used by other applications again.
         video_capture.release()
 
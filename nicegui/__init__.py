@@ -4,6 +4,7 @@ from .app.app import App
 from .client import Client
 from .context import context
 from .element_filter import ElementFilter
+from .frame_stream import FrameStream
 from .nicegui import app
 from .tailwind import Tailwind
 from .version import __version__
@@ -13,6 +14,7 @@ __all__ = [
     'App',
     'Client',
     'ElementFilter',
+    'FrameStream',
     'Tailwind',
     '__version__',
     'app',
@@ -7,12 +7,13 @@ from enum import Enum
 from pathlib import Path
 from typing import Any, Awaitable, Callable, Iterator, List, Optional, Union
 
-from fastapi import FastAPI, HTTPException, Request, Response
+from fastapi import FastAPI, Request, Response
 from fastapi.responses import FileResponse
 
 from .. import background_tasks, helpers
 from ..client import Client
 from ..logging import log
+from ..loop_monitor import LoopMonitor
 from ..native import NativeConfig
 from ..observables import ObservableSet
 from ..server import Server
@@ -36,6 +37,7 @@ class App(FastAPI):
         super().__init__(**kwargs, docs_url=None, redoc_url=None, openapi_url=None)
         self.native = NativeConfig()
         self.storage = Storage()
+        self.loop_monitor = LoopMonitor()
         self.urls = ObservableSet()
         self._state: State = State.STOPPED
         self.config = AppConfig()
@@ -226,11 +228,8 @@ class App(FastAPI):
         :param local_directory: local folder with files to serve as media content
         """
         @self.get(url_path + '/{filename:path}')
-        def read_item(request: Request, filename: str, nicegui_chunk_size: int = 8192) -> Response:
-            filepath = Path(local_directory) / filename
-            if not filepath.is_file():
-                raise HTTPException(status_code=404, detail='Not Found')
-            return get_range_response(filepath, request, chunk_size=nicegui_chunk_size)
+        def read_item(request: Request, filename: str, nicegui_chunk_size: Optional[int] = None) -> Response:
+            return get_range_response(Path(local_directory) / filename, request, chunk_size=nicegui_chunk_size)
 
     def add_media_file(self, *,
                        local_file: Union[str, Path],
@@ -260,7 +259,7 @@ class App(FastAPI):
         path = f'/_nicegui/auto/media/{helpers.hash_file_path(file)}/{file.name}' if url_path is None else url_path
 
         @self.get(path)
-        def read_item(request: Request, nicegui_chunk_size: int = 8192) -> Response:
+        def read_item(request: Request, nicegui_chunk_size: Optional[int] = None) -> Response:
             if single_use:
                 self.remove_route(path)
             return get_range_response(file, request, chunk_size=nicegui_chunk_size)
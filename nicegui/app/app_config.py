@@ -9,6 +9,11 @@ from ..language import Language
 @dataclass(**KWONLY_SLOTS)
 class AppConfig:
     endpoint_documentation: Literal['none', 'internal', 'page', 'all'] = 'none'
+    asset_cache_size: int = 0
+    max_event_rate: float = 0.0
+    task_introspection: bool = False
+    loop_monitor: bool = False
+    metrics: bool = False
     socket_io_js_query_params: Dict = field(default_factory=dict)
     socket_io_js_extra_headers: Dict = field(default_factory=dict)
     socket_io_js_transports: List[Literal['websocket', 'polling']] = \
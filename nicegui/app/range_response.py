@@ -1,58 +1,178 @@
+import functools
 import hashlib
 import mimetypes
-from datetime import datetime
+import os
+import secrets
+import stat
+from email.utils import formatdate
 from pathlib import Path
-from typing import Generator
+from typing import Dict, List, Optional, Tuple
 
-from fastapi import Request
-from fastapi.responses import Response, StreamingResponse
+import anyio
+from fastapi import HTTPException, Request
+from fastapi.responses import Response
+from starlette.types import Receive, Scope, Send
 
 mimetypes.init()
 
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+MAX_RANGES = 16
 
-def get_range_response(file: Path, request: Request, chunk_size: int) -> Response:
-    """Get a Response for the given file, supporting range-requests, E-Tag and Last-Modified."""
-    file_size = file.stat().st_size
-    last_modified_time = datetime.utcfromtimestamp(file.stat().st_mtime)
-    start = 0
-    end = file_size - 1
-    status_code = 200
-    e_tag = hashlib.md5((str(last_modified_time) + str(file_size)).encode()).hexdigest()
-    if_match_header = request.headers.get('If-None-Match')
-    if if_match_header and if_match_header == e_tag:
-        return Response(status_code=304)  # Not Modified
+
+class FileInfo:
+
+    def __init__(self, path: str, mtime: float, size: int) -> None:
+        self.size = size
+        self.e_tag = '"' + hashlib.md5(f'{mtime}-{size}'.encode()).hexdigest() + '"'
+        self.last_modified = formatdate(mtime, usegmt=True)
+        self.media_type = mimetypes.guess_type(path)[0] or 'application/octet-stream'
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_file_info(path: str, mtime_ns: int, size: int) -> FileInfo:
+    # NOTE: the modification time and size are part of the cache key, so changed files are picked up automatically
+    return FileInfo(path, mtime_ns / 1e9, size)
+
+
+def get_range_response(file: Path, request: Request, chunk_size: Optional[int] = None) -> Response:
+    """Get a Response for the given file, supporting (multi-)range-requests, If-Range, E-Tag and Last-Modified.
+
+    The file is only stat'ed once per request; E-Tag, Last-Modified and media type are cached until the file changes.
+    If the ASGI server supports the "pathsend" or "zerocopy" extensions, the file content is sent without copying.
+
+    :param file: path of the file to serve
+    :param request: the incoming request
+    :param chunk_size: size of the chunks to read (default: adaptive between 64 KiB and 1 MiB)
+    """
+    try:
+        stat_result = os.stat(file)
+    except OSError as e:
+        raise HTTPException(status_code=404, detail='Not Found') from e
+    if not stat.S_ISREG(stat_result.st_mode):
+        raise HTTPException(status_code=404, detail='Not Found')
+    info = _get_file_info(str(file), stat_result.st_mtime_ns, stat_result.st_size)
     headers = {
-        'E-Tag': e_tag,
-        'Last-Modified': last_modified_time.strftime(r'%a, %d %b %Y %H:%M:%S GMT'),
-    }
-    range_header = request.headers.get('range')
-    media_type = mimetypes.guess_type(str(file))[0] or 'application/octet-stream'
-    if range_header is not None:
-        byte1, byte2 = range_header.split('=')[1].split('-')
-        start = int(byte1)
-        if byte2:
-            end = int(byte2)
-        status_code = 206  # Partial Content
-    content_length = end - start + 1
-    headers.update({
-        'Content-Length': str(content_length),
-        'Content-Range': f'bytes {start}-{end}/{file_size}',
+        'ETag': info.e_tag,
+        'Last-Modified': info.last_modified,
         'Accept-Ranges': 'bytes',
-    })
-
-    def content_reader(file: Path, start: int, end: int) -> Generator[bytes, None, None]:
-        with open(file, 'rb') as data:
-            data.seek(start)
-            remaining_bytes = end - start + 1
-            while remaining_bytes > 0:
-                chunk = data.read(min(chunk_size, remaining_bytes))
-                if not chunk:
-                    break
-                yield chunk
-                remaining_bytes -= len(chunk)
-    return StreamingResponse(
-        content_reader(file, start, end),
-        media_type=media_type,
-        headers=headers,
-        status_code=status_code,
-    )
+    }
+    if _matches(request.headers.get('If-None-Match'), info.e_tag):
+        return Response(status_code=304, headers=headers)  # Not Modified
+
+    range_header = request.headers.get('Range')
+    if_range_header = request.headers.get('If-Range')
+    if range_header is None or (if_range_header is not None and if_range_header not in (info.e_tag, info.last_modified)):
+        ranges = None
+    else:
+        try:
+            ranges = _parse_ranges(range_header, info.size)
+        except ValueError:
+            ranges = None  # NOTE: invalid range headers are ignored (RFC 9110, section 14.2)
+        if ranges == []:
+            return Response(status_code=416, headers={**headers, 'Content-Range': f'bytes */{info.size}'})
+    return RangeResponse(file, info, headers, ranges, chunk_size)
+
+
+def _matches(if_none_match: Optional[str], e_tag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    tags = [tag[2:] if tag.startswith('W/') else tag for tag in tags]
+    return '*' in tags or e_tag in tags or e_tag.strip('"') in tags
+
+
+def _parse_ranges(header: str, size: int) -> Optional[List[Tuple[int, int]]]:
+    """Parse a range header into a list of inclusive byte ranges.
+
+    Returns None if the range should be ignored and an empty list if it is not satisfiable.
+    """
+    unit, _, specs = header.partition('=')
+    if unit.strip().lower() != 'bytes':
+        return None
+    ranges: List[Tuple[int, int]] = []
+    for spec in specs.split(','):
+        first, dash, last = spec.strip().partition('-')
+        if not dash:
+            raise ValueError(f'Invalid range: {spec}')
+        if first:
+            start, end = int(first), int(last) if last else size - 1
+            if last and end < start:
+                raise ValueError(f'Invalid range: {spec}')
+        else:
+            start, end = max(size - int(last), 0), size - 1
+            if int(last) == 0:
+                continue
+        if start < size:
+            ranges.append((start, min(end, size - 1)))
+    if len(ranges) > MAX_RANGES:
+        return None
+    return ranges
+
+
+class RangeResponse(Response):
+
+    def __init__(self,
+                 file: Path,
+                 info: FileInfo,
+                 headers: Dict[str, str],
+                 ranges: Optional[List[Tuple[int, int]]],
+                 chunk_size: Optional[int] = None,
+                 ) -> None:
+        self.file = file
+        self.ranges = ranges or [(0, info.size - 1)]
+        self.parts: List[Tuple[bytes, int, int]] = []
+        self.trailer = b''
+        if ranges is None:
+            headers['Content-Length'] = str(info.size)
+            super().__init__(status_code=200, headers=headers, media_type=info.media_type)
+        elif len(ranges) == 1:
+            start, end = ranges[0]
+            headers['Content-Length'] = str(end - start + 1)
+            headers['Content-Range'] = f'bytes {start}-{end}/{info.size}'
+            super().__init__(status_code=206, headers=headers, media_type=info.media_type)
+        else:
+            boundary = secrets.token_hex(16)
+            for start, end in ranges:
+                part_header = f'--{boundary}\r\nContent-Type: {info.media_type}\r\nContent-Range: bytes {start}-{end}/{info.size}\r\n\r\n'
+                self.parts.append((part_header.encode(), start, end))
+            self.trailer = f'\r\n--{boundary}--\r\n'.encode()
+            content_length = sum(len(part_header) + end - start + 1 for part_header, start, end in self.parts) + \
+                2 * (len(self.parts) - 1) + len(self.trailer)
+            headers['Content-Length'] = str(content_length)
+            super().__init__(status_code=206, headers=headers, media_type=f'multipart/byteranges; boundary={boundary}')
+        total = sum(end - start + 1 for start, end in self.ranges)
+        self.chunk_size = chunk_size or min(max(total // 8, MIN_CHUNK_SIZE), MAX_CHUNK_SIZE)
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        extensions = scope.get('extensions') or {}
+        await send({'type': 'http.response.start', 'status': self.status_code, 'headers': self.raw_headers})
+        if self.status_code == 200 and 'http.response.pathsend' in extensions:
+            await send({'type': 'http.response.pathsend', 'path': str(self.file)})
+            return
+        async with await anyio.open_file(self.file, 'rb') as f:
+            if not self.parts:
+                start, end = self.ranges[0]
+                await self._send_range(send, f, start, end, more_body=False, zerocopy='http.response.zerocopy' in extensions)
+                return
+            for i, (part_header, start, end) in enumerate(self.parts):
+                await send({'type': 'http.response.body', 'body': (b'\r\n' if i else b'') + part_header, 'more_body': True})
+                await self._send_range(send, f, start, end, more_body=True, zerocopy='http.response.zerocopy' in extensions)
+            await send({'type': 'http.response.body', 'body': self.trailer, 'more_body': False})
+
+    async def _send_range(self, send: Send, f: anyio.AsyncFile, start: int, end: int, *,
+                          more_body: bool, zerocopy: bool) -> None:
+        if zerocopy:
+            await send({'type': 'http.response.zerocopy', 'file': f.wrapped, 'offset': start, 'count': end - start + 1,
+                        'more_body': more_body})
+            return
+        await f.seek(start)
+        remaining_bytes = end - start + 1
+        while remaining_bytes > 0:
+            chunk = await f.read(min(self.chunk_size, remaining_bytes))
+            if not chunk:
+                break
+            remaining_bytes -= len(chunk)
+            await send({'type': 'http.response.body', 'body': chunk, 'more_body': True})
+        if not more_body:
+            await send({'type': 'http.response.body', 'body': b'', 'more_body': False})
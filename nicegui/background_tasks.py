@@ -2,32 +2,159 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Awaitable, Dict, Set
+import time
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Awaitable, Deque, Dict, List, Optional, Set, Tuple
 
 from . import core
+from .dataclasses import KWONLY_SLOTS
 
 running_tasks: Set[asyncio.Task] = set()
 lazy_tasks_running: Dict[str, asyncio.Task] = {}
 lazy_tasks_waiting: Dict[str, Awaitable] = {}
 
 
-def create(coroutine: Awaitable, *, name: str = 'unnamed task') -> asyncio.Task:
+@dataclass(**KWONLY_SLOTS)
+class TaskInfo:
+    group: Optional[str]
+    client_id: Optional[str]
+    created: float
+    started: Optional[float] = None
+
+
+task_infos: Dict[asyncio.Task, TaskInfo] = {}
+
+
+class TaskGroup:
+
+    def __init__(self, name: str) -> None:
+        """Task Group
+
+        Limits how many tasks of the group run at the same time, in total and per client.
+        Tasks exceeding a limit wait until another task of the group is done.
+        Tasks without a group, like the outbox loops of the clients, are never delayed.
+
+        :param name: name of the group
+        """
+        self.name = name
+        self.limit = 0
+        """maximum number of running tasks (0 means unlimited)"""
+        self.client_limit = 0
+        """maximum number of running tasks per client (0 means unlimited)"""
+        self.running = 0
+        self._running_per_client: Dict[str, int] = defaultdict(int)
+        self._waiters: Deque[Tuple[asyncio.Future, Optional[str]]] = deque()
+
+    @property
+    def waiting(self) -> int:
+        """Number of tasks waiting to be started."""
+        return sum(1 for future, _ in self._waiters if not future.done())
+
+    async def acquire(self, client_id: Optional[str]) -> None:
+        """Wait until a task of the given client may run."""
+        if self._can_start(client_id):
+            self._start(client_id)
+            return
+        future = asyncio.get_running_loop().create_future()
+        entry = (future, client_id)
+        self._waiters.append(entry)
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.cancelled():
+                if entry in self._waiters:
+                    self._waiters.remove(entry)
+            else:
+                self.release(client_id)  # NOTE: the task was started right before being cancelled
+            raise
+
+    def release(self, client_id: Optional[str]) -> None:
+        """Mark a task of the given client as done and start waiting tasks."""
+        self.running -= 1
+        if client_id is not None:
+            self._running_per_client[client_id] -= 1
+            if not self._running_per_client[client_id]:
+                del self._running_per_client[client_id]
+        for entry in list(self._waiters):
+            if self.limit and self.running >= self.limit:
+                break
+            future, waiting_client_id = entry
+            if future.done():
+                self._waiters.remove(entry)
+            elif self._can_start(waiting_client_id):
+                self._waiters.remove(entry)
+                self._start(waiting_client_id)
+                future.set_result(None)
+
+    def _can_start(self, client_id: Optional[str]) -> bool:
+        if self.limit and self.running >= self.limit:
+            return False
+        if client_id is not None and self.client_limit and self._running_per_client[client_id] >= self.client_limit:
+            return False
+        return True
+
+    def _start(self, client_id: Optional[str]) -> None:
+        self.running += 1
+        if client_id is not None:
+            self._running_per_client[client_id] += 1
+
+
+groups: Dict[str, TaskGroup] = {}
+
+
+def configure_group(name: str, *, limit: Optional[int] = None, client_limit: Optional[int] = None) -> TaskGroup:
+    """Configure the concurrency limits of a task group.
+
+    :param name: name of the group (e.g. "event handlers", "timers", "refreshables" or "storage")
+    :param limit: maximum number of running tasks of the group (0 means unlimited)
+    :param client_limit: maximum number of running tasks of the group per client (0 means unlimited)
+    """
+    group = get_group(name)
+    if limit is not None:
+        group.limit = limit
+    if client_limit is not None:
+        group.client_limit = client_limit
+    return group
+
+
+def get_group(name: str) -> TaskGroup:
+    """Return the task group with the given name, creating it if necessary."""
+    if name not in groups:
+        groups[name] = TaskGroup(name)
+    return groups[name]
+
+
+def create(coroutine: Awaitable, *,
+           name: str = 'unnamed task',
+           group: Optional[str] = None,
+           client_id: Optional[str] = None,
+           ) -> asyncio.Task:
     """Wraps a loop.create_task call and ensures there is an exception handler added to the task.
 
     If the task raises an exception, it is logged and handled by the global exception handlers.
     Also a reference to the task is kept until it is done, so that the task is not garbage collected mid-execution.
     See https://docs.python.org/3/library/asyncio-task.html#asyncio.create_task.
+
+    If a group is given, the task waits until the concurrency limits of the group allow it to run (*added in version 2.15.0*).
     """
     assert core.loop is not None
     coroutine = coroutine if asyncio.iscoroutine(coroutine) else asyncio.wait_for(coroutine, None)
+    info = TaskInfo(group=group, client_id=client_id, created=time.time())
+    if group is None:
+        info.started = info.created
+    else:
+        coroutine = _run_in_group(coroutine, get_group(group), info)
     task: asyncio.Task = core.loop.create_task(coroutine, name=name)
     task.add_done_callback(_handle_task_result)
     running_tasks.add(task)
+    task_infos[task] = info
     task.add_done_callback(running_tasks.discard)
+    task.add_done_callback(_discard_info)
     return task
 
 
-def create_lazy(coroutine: Awaitable, *, name: str) -> None:
+def create_lazy(coroutine: Awaitable, *, name: str, group: Optional[str] = None) -> None:
     """Wraps a create call and ensures a second task with the same name is delayed until the first one is done.
 
     If a third task with the same name is created while the first one is still running, the second one is discarded.
@@ -41,12 +168,41 @@ def create_lazy(coroutine: Awaitable, *, name: str) -> None:
     def finalize(name: str) -> None:
         lazy_tasks_running.pop(name)
         if name in lazy_tasks_waiting:
-            create_lazy(lazy_tasks_waiting.pop(name), name=name)
-    task = create(coroutine, name=name)
+            create_lazy(lazy_tasks_waiting.pop(name), name=name, group=group)
+    task = create(coroutine, name=name, group=group)
     lazy_tasks_running[name] = task
     task.add_done_callback(lambda _: finalize(name))
 
 
+def get_task_infos() -> List[Dict[str, Any]]:
+    """Return name, group, client ID, age and state of all tasks, oldest first."""
+    now = time.time()
+    return [{
+        'name': task.get_name(),
+        'group': info.group,
+        'client_id': info.client_id,
+        'age': now - info.created,
+        'state': 'waiting' if info.started is None else 'running',
+    } for task, info in sorted(task_infos.items(), key=lambda item: item[1].created)]
+
+
+async def _run_in_group(coroutine: Any, group: TaskGroup, info: TaskInfo) -> Any:
+    try:
+        await group.acquire(info.client_id)
+    except BaseException:
+        coroutine.close()
+        raise
+    info.started = time.time()
+    try:
+        return await coroutine
+    finally:
+        group.release(info.client_id)
+
+
+def _discard_info(task: asyncio.Task) -> None:
+    task_infos.pop(task, None)
+
+
 def _handle_task_result(task: asyncio.Task) -> None:
     try:
         task.result()
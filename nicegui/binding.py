@@ -25,7 +25,7 @@ from typing import (
 
 from typing_extensions import dataclass_transform
 
-from . import core
+from . import core, metrics
 from .logging import log
 
 if TYPE_CHECKING:
@@ -63,7 +63,9 @@ def _set_attribute(obj: Union[object, Mapping], name: str, value: Any) -> None:
 async def refresh_loop() -> None:
     """Refresh all bindings in an endless loop."""
     while True:
-        _refresh_step()
+        with core.app.loop_monitor.measure('binding refresh', f'{len(active_links)} active links'), \
+                metrics.binding_refresh_duration.time():
+            _refresh_step()
         await asyncio.sleep(core.app.config.binding_refresh_interval)
 
 
@@ -1,7 +1,6 @@
 from __future__ import annotations
 
 import asyncio
-import inspect
 import time
 import uuid
 from collections import defaultdict
@@ -14,10 +13,12 @@ from fastapi.responses import Response
 from fastapi.templating import Jinja2Templates
 from typing_extensions import Self
 
-from . import background_tasks, binding, core, helpers, json, storage
+from . import background_tasks, binding, core, helpers, json, metrics, storage
 from .awaitable_response import AwaitableResponse
 from .dependencies import generate_resources
 from .element import Element
+from .element_index import ElementIndex
+from .event_limiter import EventLimiter
 from .favicon import get_favicon_url
 from .javascript_request import JavaScriptRequest
 from .logging import log
@@ -55,6 +56,7 @@ class Client:
         self.instances[self.id] = self
 
         self.elements: Dict[int, Element] = {}
+        self.element_index = ElementIndex()
         self.next_element_id: int = 0
         self._waiting_for_connection: asyncio.Event = asyncio.Event()
         self.is_waiting_for_connection: bool = False
@@ -70,6 +72,7 @@ class Client:
 
         self.page = page
         self.outbox = Outbox(self)
+        self.event_limiter = EventLimiter(self)
 
         with Element('q-layout', _client=self).props('view="hhh lpr fff"').classes('nicegui-layout') as self.layout:
             with Element('q-page-container') as self.page_container:
@@ -291,10 +294,14 @@ class Client:
         with self:
             sender = self.elements.get(msg['id'])
             if sender is not None and not sender.is_ignoring_events:
+                listener = sender._event_listeners.get(msg['listener_id'])  # pylint: disable=protected-access
+                if listener is not None and not self.event_limiter.admit(listener, msg):
+                    return
                 msg['args'] = [None if arg is None else json.loads(arg) for arg in msg.get('args', [])]
                 if len(msg['args']) == 1:
                     msg['args'] = msg['args'][0]
-                sender._handle_event(msg)  # pylint: disable=protected-access
+                with metrics.time_event():
+                    sender._handle_event(msg)  # pylint: disable=protected-access
 
     def handle_javascript_response(self, msg: Dict) -> None:
         """Store the result of a JavaScript command."""
@@ -307,15 +314,15 @@ class Client:
                 async def func_with_client():
                     with self:
                         await func
-                background_tasks.create(func_with_client())
+                background_tasks.create(func_with_client(), group='event handlers', client_id=self.id)
             else:
                 with self:
-                    result = func(self) if len(inspect.signature(func).parameters) == 1 else func()
+                    result = func(self) if len(helpers.get_signature(func).parameters) == 1 else func()
                 if helpers.is_coroutine_function(func):
                     async def result_with_client():
                         with self:
                             await result
-                    background_tasks.create(result_with_client())
+                    background_tasks.create(result_with_client(), group='event handlers', client_id=self.id)
         except Exception as e:
             core.app.handle_exception(e)
 
@@ -323,11 +330,13 @@ class Client:
         """Remove the given elements from the client."""
         element_list = list(elements)  # NOTE: we need to iterate over the elements multiple times
         binding.remove(element_list)
+        self.event_limiter.forget(element_list)
         for element in element_list:
             element._handle_delete()  # pylint: disable=protected-access
             element._deleted = True  # pylint: disable=protected-access
             self.outbox.enqueue_delete(element)
             self.elements.pop(element.id, None)
+            self.element_index.remove(element)
 
     def remove_all_elements(self) -> None:
         """Remove all elements from the client."""
@@ -340,6 +349,7 @@ class Client:
         Normally this should never happen, but has been observed (see #1826).
         """
         self.remove_all_elements()
+        self.event_limiter.clear()
         self.outbox.stop()
         del Client.instances[self.id]
         self._deleted = True
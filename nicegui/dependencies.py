@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 from typing import TYPE_CHECKING, Dict, Iterable, List, Set, Tuple
 
@@ -8,6 +8,7 @@ import vbuild
 
 from .dataclasses import KWONLY_SLOTS
 from .helpers import hash_file_path
+from .staticfiles import ContentHash
 from .version import __version__
 
 if TYPE_CHECKING:
@@ -19,12 +20,21 @@ class Component:
     key: str
     name: str
     path: Path
+    _content_hash: ContentHash = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._content_hash = ContentHash(self.path)
 
     @property
     def tag(self) -> str:
         """The tag of the component."""
         return f'nicegui-{self.name}'
 
+    @property
+    def content_hash(self) -> str:
+        """The hash of the component's content which is added to its URL to allow immutable caching."""
+        return self._content_hash.value
+
 
 @dataclass(**KWONLY_SLOTS)
 class VueComponent(Component):
@@ -50,6 +60,15 @@ class Library:
     name: str
     path: Path
     expose: bool
+    _content_hash: ContentHash = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self._content_hash = ContentHash(self.path)
+
+    @property
+    def content_hash(self) -> str:
+        """The hash of the library's content which is added to its URL to allow immutable caching."""
+        return self._content_hash.value
 
 
 vue_components: Dict[str, VueComponent] = {}
@@ -145,7 +164,7 @@ def generate_resources(prefix: str, elements: Iterable[Element]) -> Tuple[List[s
     # build the importmap structure for exposed libraries
     for key, library in libraries.items():
         if key not in done_libraries and library.expose:
-            imports[library.name] = f'{prefix}/_nicegui/{__version__}/libraries/{key}'
+            imports[library.name] = f'{prefix}/_nicegui/{__version__}/libraries/{key}?v={library.content_hash}'
             done_libraries.add(key)
 
     # build the none-optimized component (i.e. the Vue component)
@@ -162,14 +181,14 @@ def generate_resources(prefix: str, elements: Iterable[Element]) -> Tuple[List[s
         for library in element.libraries:
             if library.key not in done_libraries:
                 if not library.expose:
-                    url = f'{prefix}/_nicegui/{__version__}/libraries/{library.key}'
+                    url = f'{prefix}/_nicegui/{__version__}/libraries/{library.key}?v={library.content_hash}'
                     js_imports.append(f'import "{url}";')
                     js_imports_urls.append(url)
                 done_libraries.add(library.key)
         if element.component:
             js_component = element.component
             if js_component.key not in done_components and js_component.path.suffix.lower() == '.js':
-                url = f'{prefix}/_nicegui/{__version__}/components/{js_component.key}'
+                url = f'{prefix}/_nicegui/{__version__}/components/{js_component.key}?v={js_component.content_hash}'
                 js_imports.append(f'import {{ default as {js_component.name} }} from "{url}";')
                 js_imports.append(f'app.component("{js_component.tag}", {js_component.name});')
                 js_imports_urls.append(url)
@@ -67,6 +67,7 @@ class Element(Visibility):
         self._deleted: bool = False
 
         self.client.elements[self.id] = self
+        self.client.element_index.add(self)
         self.parent_slot: Optional[Slot] = None
         slot_stack = context.slot_stack
         if slot_stack:
@@ -202,12 +203,14 @@ class Element(Visibility):
                     'component': {
                         'key': self.component.key,
                         'name': self.component.name,
-                        'tag': self.component.tag
+                        'tag': self.component.tag,
+                        **({'hash': self.component.content_hash} if self.component.path.suffix == '.js' else {}),
                     } if self.component else None,
                     'libraries': [
                         {
                             'key': library.key,
                             'name': library.name,
+                            'hash': library.content_hash,
                         } for library in self.libraries
                     ],
                 }.items()
@@ -307,7 +310,11 @@ class Element(Visibility):
 
         :param markers: list of strings or single string with whitespace-delimited markers; replaces existing markers
         """
+        if not self.is_deleted:
+            self.client.element_index.remove_markers(self, self._markers)
         self._markers = [word for marker in markers for word in marker.split()]
+        if not self.is_deleted:
+            self.client.element_index.add_markers(self, self._markers)
         return self
 
     def tooltip(self, text: str) -> Self:
@@ -360,7 +367,7 @@ class Element(Visibility):
         listener = self._event_listeners[msg['listener_id']]
         storage.request_contextvar.set(listener.request)
         args = events.GenericEventArguments(sender=self, client=self.client, args=msg['args'])
-        events.handle_event(listener.handler, args)
+        events.handle_event(listener.handler, args, handler_expects_arguments=listener.handler_expects_arguments)
 
     def update(self) -> None:
         """Update the element on the client side."""
@@ -401,8 +408,10 @@ class Element(Visibility):
         """
         if include_self:
             yield self
-        if self.parent_slot:
-            yield from self.parent_slot.parent.ancestors(include_self=True)
+        parent_slot = self.parent_slot
+        while parent_slot:
+            yield parent_slot.parent
+            parent_slot = parent_slot.parent.parent_slot
 
     def descendants(self, *, include_self: bool = False) -> Iterator[Element]:
         """Iterate over the descendants of the element.
@@ -411,8 +420,14 @@ class Element(Visibility):
         """
         if include_self:
             yield self
-        for child in self:
-            yield from child.descendants(include_self=True)
+        stack = [iter(self)]  # NOTE: iterative pre-order traversal to support deeply nested trees
+        while stack:
+            child = next(stack[-1], None)
+            if child is None:
+                stack.pop()
+                continue
+            yield child
+            stack.append(iter(child))
 
     def clear(self) -> None:
         """Remove all child elements."""
@@ -473,6 +488,12 @@ class Element(Visibility):
         This method can be overridden in subclasses to perform cleanup tasks.
         """
 
+    def _handle_update_sent(self) -> None:
+        """Called when the outbox has serialized the element to send an update to all browsers of the client.
+
+        This method can be overridden in subclasses to remember the state the browsers have received.
+        """
+
     @property
     def is_deleted(self) -> bool:
         """Whether the element has been deleted."""
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from typing import Generic, Iterator, List, Optional, Type, TypeVar, Union, overload
+from typing import Dict, Generic, Iterable, Iterator, List, Optional, Type, TypeVar, Union, overload
 
 from typing_extensions import Self
 
@@ -92,7 +92,7 @@ class ElementFilter(Generic[T]):
         self._scope = context.slot.parent if local_scope else context.client.layout
 
     def __iter__(self) -> Iterator[T]:
-        for element in self._scope.descendants():
+        for element in self._iterate_candidates():
             if self._kind and not isinstance(element, self._kind):
                 continue
             if self._exclude_kinds and isinstance(element, tuple(self._exclude_kinds)):
@@ -130,6 +130,11 @@ class ElementFilter(Generic[T]):
                 if any(needle in str(haystack) for haystack in element_contents for needle in self._exclude_content):
                     continue
 
+            if not (self._within_instances or self._not_within_instances or self._within_kinds or
+                    self._not_within_kinds or self._within_markers or self._not_within_markers):
+                yield element  # type: ignore
+                continue
+
             ancestors = set(element.ancestors())
             if self._within_instances and not ancestors.issuperset(self._within_instances):
                 continue
@@ -147,6 +152,16 @@ class ElementFilter(Generic[T]):
 
             yield element  # type: ignore
 
+    def _iterate_candidates(self) -> Iterable[Element]:
+        """Return the elements within the scope that might match, using the client's element index if it narrows the search."""
+        client = self._scope.client
+        candidates = client.element_index.find(self._kind, self._markers)
+        if candidates is None or 2 * len(candidates) > len(client.elements):
+            return self._scope.descendants()
+        scope = self._scope
+        return _sort_by_tree_order([element for element in candidates
+                                    if not element.is_deleted and any(ancestor is scope for ancestor in element.ancestors())])
+
     def within(self, *,
                kind: Optional[Type[Element]] = None,
                marker: Optional[str] = None,
@@ -234,3 +249,21 @@ class ElementFilter(Generic[T]):
         for element in self:
             element.props(add, remove=remove)
         return self
+
+
+def _sort_by_tree_order(elements: List[Element]) -> List[Element]:
+    """Sort elements in the order in which they are visited by ``Element.descendants()``."""
+    positions: Dict[int, Dict[int, int]] = {}
+
+    def get_path(element: Element) -> List[int]:
+        path: List[int] = []
+        while element.parent_slot:
+            parent = element.parent_slot.parent
+            if id(parent) not in positions:
+                positions[id(parent)] = {id(child): i for i, child in enumerate(parent)}
+            path.append(positions[id(parent)].get(id(element), -1))
+            element = parent
+        path.reverse()
+        return path
+
+    return sorted(elements, key=get_path)
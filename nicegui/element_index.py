@@ -0,0 +1,67 @@
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Type
+
+if TYPE_CHECKING:
+    from .element import Element
+
+
+class ElementIndex:
+    """Indexes the elements of a client by type and by marker to speed up ``ElementFilter`` queries.
+
+    Elements are keyed by their object ID, which stays the same even if the element ID is taken over by another element.
+    """
+
+    def __init__(self) -> None:
+        self._by_type: Dict[type, Dict[int, Element]] = {}
+        self._by_marker: Dict[str, Dict[int, Element]] = {}
+
+    def add(self, element: Element) -> None:
+        """Add an element to the index."""
+        self._by_type.setdefault(type(element), {})[id(element)] = element
+        self.add_markers(element, element._markers)  # pylint: disable=protected-access
+
+    def remove(self, element: Element) -> None:
+        """Remove an element from the index."""
+        elements = self._by_type.get(type(element))
+        if elements is not None:
+            elements.pop(id(element), None)
+            if not elements:
+                del self._by_type[type(element)]
+        self.remove_markers(element, element._markers)  # pylint: disable=protected-access
+
+    def add_markers(self, element: Element, markers: Iterable[str]) -> None:
+        """Index the given markers of an element."""
+        for marker in markers:
+            self._by_marker.setdefault(marker, {})[id(element)] = element
+
+    def remove_markers(self, element: Element, markers: Iterable[str]) -> None:
+        """Remove the given markers of an element from the index."""
+        for marker in markers:
+            elements = self._by_marker.get(marker)
+            if elements is not None:
+                elements.pop(id(element), None)
+                if not elements:
+                    del self._by_marker[marker]
+
+    def find(self, kind: Optional[Type[Element]], markers: List[str]) -> Optional[List[Element]]:
+        """Return candidates having the given kind and all of the given markers or ``None`` if no criterion is given.
+
+        The candidates are not ordered and might include elements outside of the scope of a query.
+        """
+        groups: List[Dict[int, Element]] = []
+        for marker in markers:
+            group = self._by_marker.get(marker)
+            if group is None:
+                return []
+            groups.append(group)
+        if not groups and kind is None:
+            return None
+        if groups:
+            smallest = min(groups, key=len)
+            return [element for element in smallest.values()
+                    if (kind is None or isinstance(element, kind)) and
+                    all(id(element) in group for group in groups if group is not smallest)]
+        assert kind is not None
+        return [element for type_, group in self._by_type.items() if issubclass(type_, kind)
+                for element in group.values()]
@@ -96,6 +96,20 @@ export default {
       convertDynamicProperties(this.options, true);
       this.chart.setOption(this.options, { notMerge: this.chart.options?.series.length != this.options.series.length });
     },
+    patch_options(patches) {
+      for (const [operation, path, value] of patches) {
+        let target = this.options;
+        for (const key of path.slice(0, -1)) target = target[key];
+        const key = path[path.length - 1];
+        if (operation === "set") target[key] = value;
+        else if (operation === "append") for (const item of value) target[key].push(item);
+        else {
+          delete target[key];
+          if (typeof key === "string" && key.startsWith(":")) delete target[key.slice(1)];
+        }
+      }
+      this.update_chart();
+    },
     run_chart_method(name, ...args) {
       if (name.startsWith(":")) {
         name = name.slice(1);
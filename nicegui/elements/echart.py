@@ -1,7 +1,8 @@
-from typing import Callable, Dict, Literal, Optional, Union
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
 
 from typing_extensions import Self
 
+from .. import json as nicegui_json
 from .. import optional_features
 from ..awaitable_response import AwaitableResponse
 from ..element import Element
@@ -34,6 +35,8 @@ class EChart(Element,
         An element to create a chart using `ECharts <https://echarts.apache.org/>`_.
         Updates can be pushed to the chart by changing the `options` property.
         After data has changed, call the `update` method to refresh the chart.
+        Only the parts of the options which changed since they have last been sent are transmitted
+        (*added in version 2.15.0*).
 
         :param options: dictionary of EChart options
         :param on_click_point: callback that is invoked when a point is clicked
@@ -47,6 +50,8 @@ class EChart(Element,
         self._props['renderer'] = renderer
         self._props['theme'] = theme
         self._update_method = 'update_chart'
+        self._sent_options: Any = None
+        self._sent_state: Optional[str] = None
 
         if on_point_click:
             self.on_point_click(on_point_click)
@@ -108,6 +113,43 @@ class EChart(Element,
         """The options dictionary."""
         return self._props['options']
 
+    def append_data(self, series_index: int, data: List[Any]) -> None:
+        """Append data points to a series and send only the new points to the client.
+
+        *Added in version 2.15.0*
+
+        :param series_index: index of the series in the `options['series']` list
+        :param data: list of data points to append
+        """
+        self.options['series'][series_index].setdefault('data', []).extend(data)
+        self.update()
+
+    def update(self) -> None:
+        """Update the element on the client side.
+
+        Changes of the options are sent as patches if nothing else has changed since the last full update.
+        """
+        if self.is_deleted:
+            return
+        if self._sent_options is None or self.id in self.client.outbox.updates or self._get_state() != self._sent_state:
+            super().update()
+            return
+        options = nicegui_json.loads(nicegui_json.dumps(self._props['options']))
+        patches: List[List[Any]] = []
+        _diff(self._sent_options, options, [], patches)
+        self._sent_options = options
+        if patches:
+            self.run_method('patch_options', patches)
+
+    def _handle_update_sent(self) -> None:
+        # NOTE: remember what all browsers have received to send only the differences on the next update
+        self._sent_options = nicegui_json.loads(nicegui_json.dumps(self._props['options']))
+        self._sent_state = self._get_state()
+
+    def _get_state(self) -> str:
+        props = {key: value for key, value in self._props.items() if key != 'options'}
+        return nicegui_json.dumps([self._classes, self._style, props, list(self._event_listeners)])
+
     def run_chart_method(self, name: str, *args, timeout: float = 1) -> AwaitableResponse:
         """Run a method of the EChart instance.
 
@@ -123,3 +165,32 @@ class EChart(Element,
         :return: AwaitableResponse that can be awaited to get the result of the method call
         """
         return self.run_method('run_chart_method', name, *args, timeout=timeout)
+
+
+def _diff(old: Any, new: Any, path: List[Any], patches: List[List[Any]]) -> None:
+    """Collect "set", "delete" and "append" operations which turn the old into the new JSON-like value."""
+    if isinstance(old, dict) and isinstance(new, dict):
+        for key in old:
+            if key not in new:
+                patches.append(['delete', [*path, key]])
+        for key, value in new.items():
+            if key in old:
+                _diff(old[key], value, [*path, key], patches)
+            else:
+                patches.append(['set', [*path, key], value])
+    elif isinstance(old, list) and isinstance(new, list) and old and len(new) >= len(old):
+        if len(new) > len(old) and new[:len(old)] == old:
+            patches.append(['append', path, new[len(old):]])
+            return
+        item_patches: List[List[Any]] = []
+        for i, (old_item, new_item) in enumerate(zip(old, new)):
+            _diff(old_item, new_item, [*path, i], item_patches)
+        replaced_items = sum(1 for patch in item_patches if patch[0] == 'set' and len(patch[1]) == len(path) + 1)
+        if replaced_items > len(new) // 2:
+            patches.append(['set', path, new])  # NOTE: sending the whole list is cheaper than patching most of its items
+            return
+        patches.extend(item_patches)
+        if len(new) > len(old):
+            patches.append(['append', path, new[len(old):]])
+    elif old != new:
+        patches.append(['set', path, new])
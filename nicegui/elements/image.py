@@ -1,10 +1,14 @@
 import base64
+import hashlib
 import io
+import threading
 import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Union
+from typing import Optional, Tuple, Union
 
-from .. import optional_features
+from .. import background_tasks, core, optional_features, run
+from ..frame_stream import FrameStream
 from ..logging import log
 from .mixins.source_element import SourceElement
 
@@ -15,25 +19,66 @@ except ImportError:
     pass
 
 
+CACHE_MAX_SIZE = 16 * 1024 * 1024  # NOTE: total length of the cached data URLs
+CACHE_MAX_ENTRY_SIZE = 1024 * 1024
+SYNC_ENCODING_PIXELS = 256 * 256
+
+
+class _DataUrlCache:
+    """LRU cache of encoded images which is bounded by the total length of the data URLs."""
+
+    def __init__(self) -> None:
+        self._sources: OrderedDict[Tuple[str, str, Optional[int]], str] = OrderedDict()
+        self.size = 0
+        self._lock = threading.Lock()  # NOTE: images are encoded in multiple threads of the thread pool
+
+    def get(self, key: Tuple[str, str, Optional[int]]) -> Optional[str]:
+        with self._lock:
+            source = self._sources.get(key)
+            if source is not None:
+                self._sources.move_to_end(key)
+            return source
+
+    def store(self, key: Tuple[str, str, Optional[int]], source: str) -> None:
+        if len(source) > CACHE_MAX_ENTRY_SIZE:
+            return  # NOTE: large images like camera frames rarely repeat
+        with self._lock:
+            old_source = self._sources.pop(key, None)
+            if old_source is not None:
+                self.size -= len(old_source)
+            self._sources[key] = source
+            self.size += len(source)
+            while self.size > CACHE_MAX_SIZE:
+                _, evicted = self._sources.popitem(last=False)
+                self.size -= len(evicted)
+
+
+_cache = _DataUrlCache()
+
+
 class Image(SourceElement, component='image.js'):
     PIL_CONVERT_FORMAT = 'PNG'
+    PIL_CONVERT_QUALITY: Optional[int] = None
 
-    def __init__(self, source: Union[str, Path, 'PIL_Image'] = '') -> None:
+    def __init__(self, source: Union[str, Path, FrameStream, 'PIL_Image'] = '') -> None:
         """Image
 
         Displays an image.
         This element is based on Quasar's `QImg <https://quasar.dev/vue-components/img>`_ component.
 
-        :param source: the source of the image; can be a URL, local file path, a base64 string or a PIL image
+        :param source: the source of the image; can be a URL, local file path, a base64 string, a PIL image or a ``FrameStream`` (*added in version 2.15.0*)
         """
         super().__init__(source=source)
 
-    def set_source(self, source: Union[str, Path, 'PIL_Image']) -> None:
+    def set_source(self, source: Union[str, Path, FrameStream, 'PIL_Image']) -> None:
         return super().set_source(source)
 
-    def _set_props(self, source: Union[str, Path, 'PIL_Image']) -> None:
+    def _set_props(self, source: Union[str, Path, FrameStream, 'PIL_Image']) -> None:
         if optional_features.has('pillow') and isinstance(source, PIL_Image):
-            source = pil_to_base64(source, self.PIL_CONVERT_FORMAT)
+            converted = convert_pil_source(self, source, self.PIL_CONVERT_FORMAT, self.PIL_CONVERT_QUALITY)
+            if converted is None:
+                return
+            source = converted
         super()._set_props(source)
 
     def force_reload(self) -> None:
@@ -45,15 +90,62 @@ class Image(SourceElement, component='image.js'):
         self.update()
 
 
-def pil_to_base64(pil_image: 'PIL_Image', image_format: str) -> str:
+def convert_pil_source(element: SourceElement,
+                       pil_image: 'PIL_Image',
+                       image_format: str,
+                       quality: Optional[int] = None) -> Optional[str]:
+    """Convert a PIL image to a base64 source for the given element.
+
+    Small images are converted immediately.
+    Larger images are converted in a separate thread while the event loop is running;
+    in this case None is returned and the element's source is updated as soon as the conversion is done,
+    unless the source has been changed in the meantime.
+    """
+    if pil_image.width * pil_image.height <= SYNC_ENCODING_PIXELS or core.loop is None or not core.loop.is_running():
+        return pil_to_base64(pil_image, image_format, quality)
+
+    async def convert() -> None:
+        source = await run.io_bound(pil_to_base64, pil_image, image_format, quality)
+        if source is not None and element.source is pil_image and not element.is_deleted:
+            element._set_props(source)  # pylint: disable=protected-access
+            element.update()
+    element._props.setdefault('src', '')  # pylint: disable=protected-access
+    background_tasks.create_lazy(convert(), name=f'convert image {element.client.id} {element.id}')
+    return None
+
+
+def pil_to_base64(pil_image: 'PIL_Image', image_format: str, quality: Optional[int] = None) -> str:
     """Convert a PIL image to a base64 string which can be used as image source.
 
+    The results for the most recently converted images are cached by content (up to `CACHE_MAX_SIZE` characters),
+    so that showing the same image multiple times or on multiple clients encodes it only once.
+
     :param pil_image: the PIL image
-    :param image_format: the image format
+    :param image_format: the image format (e.g. "PNG", "JPEG" or "WEBP")
+    :param quality: the encoding quality for lossy formats (default: Pillow's default)
     :return: the base64 string
     """
+    key = (_get_content_hash(pil_image), image_format.upper(), quality)
+    cached_source = _cache.get(key)
+    if cached_source is not None:
+        return cached_source
     buffer = io.BytesIO()
-    pil_image.save(buffer, image_format)
+    if image_format.upper() in {'JPEG', 'JPG'} and pil_image.mode not in {'RGB', 'L'}:
+        pil_image = pil_image.convert('RGB')
+    if quality is None:
+        pil_image.save(buffer, image_format)
+    else:
+        pil_image.save(buffer, image_format, quality=quality)
     base64_encoded = base64.b64encode(buffer.getvalue())
     base64_string = base64_encoded.decode('utf-8')
-    return f'data:image/{image_format.lower()};base64,{base64_string}'
+    source = f'data:image/{image_format.lower()};base64,{base64_string}'
+    _cache.store(key, source)
+    return source
+
+
+def _get_content_hash(pil_image: 'PIL_Image') -> str:
+    content_hash = hashlib.md5(f'{pil_image.mode} {pil_image.size}'.encode())
+    if pil_image.mode == 'P':
+        content_hash.update(bytes(pil_image.getpalette() or []))
+    content_hash.update(pil_image.tobytes())
+    return content_hash.hexdigest()
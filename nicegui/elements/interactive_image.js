@@ -69,7 +69,8 @@ export default {
       if (new_src == this.computed_src) {
         return;
       }
-      if (this.loading) {
+      const is_streaming = this.computed_src?.includes("/_nicegui/frame_streams/"); // NOTE: streams never finish loading
+      if (this.loading && !is_streaming) {
         this.waiting_source = new_src;
       } else {
         this.computed_src = new_src;
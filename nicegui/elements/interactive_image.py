@@ -8,8 +8,9 @@ from typing_extensions import Self
 
 from .. import optional_features
 from ..events import GenericEventArguments, Handler, MouseEventArguments, handle_event
+from ..frame_stream import FrameStream
 from ..logging import log
-from .image import pil_to_base64
+from .image import convert_pil_source
 from .mixins.content_element import ContentElement
 from .mixins.source_element import SourceElement
 
@@ -23,9 +24,10 @@ except ImportError:
 class InteractiveImage(SourceElement, ContentElement, component='interactive_image.js'):
     CONTENT_PROP = 'content'
     PIL_CONVERT_FORMAT = 'PNG'
+    PIL_CONVERT_QUALITY: Optional[int] = None
 
     def __init__(self,
-                 source: Union[str, Path, 'PIL_Image'] = '', *,  # noqa: UP037
+                 source: Union[str, Path, FrameStream, 'PIL_Image'] = '', *,  # noqa: UP037
                  content: str = '',
                  size: Optional[Tuple[float, float]] = None,
                  on_mouse: Optional[Handler[MouseEventArguments]] = None,
@@ -50,7 +52,7 @@ class InteractiveImage(SourceElement, ContentElement, component='interactive_ima
         You can also pass a tuple of width and height instead of an image source.
         This will create an empty image with the given size.
 
-        :param source: the source of the image; can be an URL, local file path, a base64 string or just an image size
+        :param source: the source of the image; can be an URL, local file path, a base64 string, a ``FrameStream`` (*added in version 2.15.0*) or just an image size
         :param content: SVG content which should be overlaid; viewport has the same dimensions as the image
         :param size: size of the image (width, height) in pixels; only used if `source` is not set
         :param on_mouse: callback for mouse events (contains image coordinates `image_x` and `image_y` in pixels)
@@ -65,7 +67,7 @@ class InteractiveImage(SourceElement, ContentElement, component='interactive_ima
         if on_mouse:
             self.on_mouse(on_mouse)
 
-    def set_source(self, source: Union[str, Path, 'PIL_Image']) -> None:  # noqa: UP037
+    def set_source(self, source: Union[str, Path, FrameStream, 'PIL_Image']) -> None:  # noqa: UP037
         return super().set_source(source)
 
     def on_mouse(self, on_mouse: Handler[MouseEventArguments]) -> Self:
@@ -89,9 +91,12 @@ class InteractiveImage(SourceElement, ContentElement, component='interactive_ima
         self.on('mouse', handle_mouse)
         return self
 
-    def _set_props(self, source: Union[str, Path, 'PIL_Image']) -> None:  # noqa: UP037
+    def _set_props(self, source: Union[str, Path, FrameStream, 'PIL_Image']) -> None:  # noqa: UP037
         if optional_features.has('pillow') and isinstance(source, PIL_Image):
-            source = pil_to_base64(source, self.PIL_CONVERT_FORMAT)
+            converted = convert_pil_source(self, source, self.PIL_CONVERT_FORMAT, self.PIL_CONVERT_QUALITY)
+            if converted is None:
+                return
+            source = converted
         super()._set_props(source)
 
     def force_reload(self) -> None:
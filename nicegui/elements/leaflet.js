@@ -74,6 +74,8 @@ export default {
           sourceTarget: undefined,
           center: [e.target.getCenter().lat, e.target.getCenter().lng],
           zoom: e.target.getZoom(),
+          bounds: this.get_bounds(),
+          socket_id: window.socket.id,
         });
       });
     }
@@ -121,7 +123,7 @@ export default {
     }
     const connectInterval = setInterval(async () => {
       if (window.socket.id === undefined) return;
-      this.$emit("init", { socket_id: window.socket.id });
+      this.$emit("init", { socket_id: window.socket.id, bounds: this.get_bounds() });
       clearInterval(connectInterval);
     }, 100);
   },
@@ -138,6 +140,20 @@ export default {
     remove_layer(id) {
       this.map.eachLayer((layer) => layer.id === id && this.map.removeLayer(layer));
     },
+    update_layers(added, removed) {
+      if (removed.length) {
+        const ids = new Set(removed);
+        this.map.eachLayer((layer) => ids.has(layer.id) && this.map.removeLayer(layer));
+      }
+      for (const [layer, id] of added) this.add_layer(layer, id);
+    },
+    get_bounds() {
+      const bounds = this.map.getBounds();
+      return [
+        [bounds.getSouth(), bounds.getWest()],
+        [bounds.getNorth(), bounds.getEast()],
+      ];
+    },
     clear_layers() {
       this.map.eachLayer((layer) => this.map.removeLayer(layer));
     },
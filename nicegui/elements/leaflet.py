@@ -1,19 +1,21 @@
 import asyncio
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple, Union, cast
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple, Union, cast
 
 from typing_extensions import Self
 
-from .. import binding
+from .. import binding, core
 from ..awaitable_response import AwaitableResponse, NullResponse
 from ..element import Element
 from ..events import GenericEventArguments
-from .leaflet_layer import Layer
+from .leaflet_layer import Bounds, Layer
 
 
 class Leaflet(Element, component='leaflet.js', default_classes='nicegui-leaflet'):
     # pylint: disable=import-outside-toplevel
     from .leaflet_layers import GenericLayer as generic_layer
+    from .leaflet_layers import GeoJson as geo_json
     from .leaflet_layers import Marker as marker
     from .leaflet_layers import TileLayer as tile_layer
     from .leaflet_layers import WmsLayer as wms_layer
@@ -46,6 +48,11 @@ class Leaflet(Element, component='leaflet.js', default_classes='nicegui-leaflet'
 
         self.layers: List[Layer] = []
         self.is_initialized = False
+        self._viewports: Dict[str, Tuple[str, Optional[Bounds]]] = {}  # NOTE: document ID -> socket ID and bounds
+        self._layers_to_add: Dict[str, Layer] = {}
+        self._layers_to_remove: List[str] = []
+        self._batch_depth = 0
+        self._flush_scheduled = False
 
         self.center = center
         self.zoom = zoom
@@ -77,11 +84,79 @@ class Leaflet(Element, component='leaflet.js', default_classes='nicegui-leaflet'
             Layer.current_leaflet = self
         return attribute
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect all added and removed layers within this context and send them in a single message when leaving it.
+
+        Layer changes are always collected and sent once per event loop iteration.
+        Within this context they are held back even across `await` statements.
+
+        *Added in version 2.15.0*
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_layers()
+
+    def _queue_layer(self, layer: Layer) -> None:
+        if not self.is_initialized:
+            return
+        self._layers_to_add[layer.id] = layer
+        self._schedule_flush()
+
+    def _schedule_flush(self) -> None:
+        if self._batch_depth == 0 and not self._flush_scheduled and core.loop is not None:
+            self._flush_scheduled = True
+            core.loop.call_soon(self._flush_layers)
+
+    def _flush_layers(self) -> None:
+        self._flush_scheduled = False
+        if self._batch_depth or not (self._layers_to_add or self._layers_to_remove):
+            return
+        layers = list(self._layers_to_add.values())
+        removed = self._layers_to_remove
+        self._layers_to_add = {}
+        self._layers_to_remove = []
+        if not self.is_deleted:
+            super().run_method('update_layers', [[layer.to_dict(), layer.id] for layer in layers], removed)
+            self._update_viewports(list(self._viewports), layers)
+
     def _handle_init(self, e: GenericEventArguments) -> None:
         self.is_initialized = True
-        with self.client.individual_target(e.args['socket_id']):
+        self._flush_layers()  # NOTE: other maps of the client still need the pending changes
+        socket_id = e.args['socket_id']
+        viewer = self._get_viewer(socket_id)
+        self._forget_closed_viewers()
+        for layer in self.layers:
+            layer._forget_viewer(viewer)  # pylint: disable=protected-access
+        self._viewports[viewer] = (socket_id, _parse_bounds(e.args.get('bounds')))
+        # NOTE: layers which are still queued within a batch are added with the next flush
+        layers = [layer for layer in self.layers if layer.id not in self._layers_to_add]
+        with self.client.individual_target(socket_id):
+            super().run_method('update_layers', [[layer.to_dict(), layer.id] for layer in layers], [])
+        self._update_viewports([viewer], layers)
+
+    def _get_viewer(self, socket_id: str) -> str:
+        """Identify the browser tab of a socket, which keeps its map when reconnecting with a new socket."""
+        return self.client._socket_to_document_id.get(socket_id, socket_id)  # pylint: disable=protected-access
+
+    def _forget_closed_viewers(self) -> None:
+        connected = self.client._num_connections  # pylint: disable=protected-access
+        for viewer in [viewer for viewer in self._viewports if viewer not in connected]:
+            del self._viewports[viewer]
             for layer in self.layers:
-                self.run_method('add_layer', layer.to_dict(), layer.id)
+                layer._forget_viewer(viewer)  # pylint: disable=protected-access
+
+    def _update_viewports(self, viewers: List[str], layers: List[Layer]) -> None:
+        """Let the given layers send the content of the current viewport to each of the given browser tabs."""
+        for viewer in viewers:
+            socket_id, bounds = self._viewports[viewer]
+            with self.client.individual_target(socket_id):
+                for layer in layers:
+                    layer._handle_viewport_change(viewer, bounds)  # pylint: disable=protected-access
 
     async def initialized(self, timeout: float = 3.0) -> None:
         """Wait until the map is initialized.
@@ -97,15 +172,26 @@ class Leaflet(Element, component='leaflet.js', default_classes='nicegui-leaflet'
         self._send_update_on_value_change = False
         self.center = e.args['center']
         self._send_update_on_value_change = True
+        self._handle_viewport_change(e.args)
 
     def _handle_zoomend(self, e: GenericEventArguments) -> None:
         self._send_update_on_value_change = False
         self.zoom = e.args['zoom']
         self._send_update_on_value_change = True
+        self._handle_viewport_change(e.args)
+
+    def _handle_viewport_change(self, args: Dict) -> None:
+        viewer = self._get_viewer(args.get('socket_id') or '')
+        if viewer not in self._viewports:
+            return  # NOTE: the map of this browser tab has not been initialized yet
+        socket_id, bounds = self._viewports[viewer]
+        self._viewports[viewer] = (socket_id, _parse_bounds(args.get('bounds')) or bounds)
+        self._update_viewports([viewer], self.layers)
 
     def run_method(self, name: str, *args: Any, timeout: float = 1) -> AwaitableResponse:
         if not self.is_initialized:
             return NullResponse()
+        self._flush_layers()  # NOTE: make sure that queued layers exist before running other methods
         return super().run_method(name, *args, timeout=timeout)
 
     def set_center(self, center: Tuple[float, float]) -> None:
@@ -126,12 +212,26 @@ class Leaflet(Element, component='leaflet.js', default_classes='nicegui-leaflet'
 
     def remove_layer(self, layer: Layer) -> None:
         """Remove a layer from the map."""
-        self.layers.remove(layer)
-        self.run_method('remove_layer', layer.id)
+        self.remove_layers([layer])
+
+    def remove_layers(self, layers: Iterable[Layer]) -> None:
+        """Remove multiple layers from the map with a single message.
+
+        *Added in version 2.15.0*
+        """
+        for layer in list(layers):
+            self.layers.remove(layer)
+            if not self.is_initialized:
+                continue
+            if self._layers_to_add.pop(layer.id, None) is None:
+                self._layers_to_remove.append(layer.id)
+                self._schedule_flush()
 
     def clear_layers(self) -> None:
         """Remove all layers from the map."""
         self.layers.clear()
+        self._layers_to_add.clear()
+        self._layers_to_remove.clear()
         self.run_method('clear_layers')
 
     def run_map_method(self, name: str, *args, timeout: float = 1) -> AwaitableResponse:
@@ -168,3 +268,10 @@ class Leaflet(Element, component='leaflet.js', default_classes='nicegui-leaflet'
     def _handle_delete(self) -> None:
         binding.remove(self.layers)
         super()._handle_delete()
+
+
+def _parse_bounds(bounds: Optional[List[List[float]]]) -> Optional[Bounds]:
+    if bounds is None:
+        return None
+    (south, west), (north, east) = bounds
+    return (south, west), (north, east)
@@ -3,7 +3,7 @@ from __future__ import annotations
 import uuid
 from abc import abstractmethod
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING, Any, ClassVar, Optional
+from typing import TYPE_CHECKING, Any, ClassVar, Optional, Tuple
 
 from ..awaitable_response import AwaitableResponse
 from ..dataclasses import KWONLY_SLOTS
@@ -11,6 +11,8 @@ from ..dataclasses import KWONLY_SLOTS
 if TYPE_CHECKING:
     from .leaflet import Leaflet
 
+Bounds = Tuple[Tuple[float, float], Tuple[float, float]]
+
 
 @dataclass(**KWONLY_SLOTS)
 class Layer:
@@ -23,12 +25,21 @@ class Layer:
         assert self.current_leaflet is not None
         self.leaflet = self.current_leaflet
         self.leaflet.layers.append(self)
-        self.leaflet.run_method('add_layer', self.to_dict(), self.id)
+        self.leaflet._queue_layer(self)  # pylint: disable=protected-access
 
     @abstractmethod
     def to_dict(self) -> dict:
         """Return a dictionary representation of the layer."""
 
+    def _handle_viewport_change(self, viewer: str, bounds: Optional[Bounds]) -> None:
+        """Called when the layer has been added to the map of a browser tab or when this map has been moved or zoomed.
+
+        Messages sent from this method only reach the given browser tab.
+        """
+
+    def _forget_viewer(self, viewer: str) -> None:
+        """Called when the map of a browser tab has been initialized anew or has been closed."""
+
     def run_method(self, name: str, *args: Any, timeout: float = 1) -> AwaitableResponse:
         """Run a method of the Leaflet layer.
 
@@ -1,10 +1,11 @@
+import math
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 from typing_extensions import Self
 
 from ..dataclasses import KWONLY_SLOTS
-from .leaflet_layer import Layer
+from .leaflet_layer import Bounds, Layer
 
 
 @dataclass(**KWONLY_SLOTS)
@@ -19,6 +20,120 @@ class GenericLayer(Layer):
         }
 
 
+@dataclass(**KWONLY_SLOTS)
+class GeoJson(Layer):
+    """GeoJSON layer
+
+    If `tiled` is set, the features are indexed by map tiles at zoom level `tile_zoom`
+    and only features in the current viewport are sent to the client.
+    More features are sent as the map is moved or zoomed.
+    Each browser tab showing the map receives the features of its own viewport.
+
+    *Added in version 2.15.0*
+    """
+    data: Dict
+    options: Dict = field(default_factory=dict)
+    tiled: bool = False
+    tile_zoom: int = 8
+    _tiles: Dict[Tuple[int, int], List[int]] = field(init=False, repr=False)
+    _sent: Dict[str, Set[int]] = field(init=False, repr=False)  # NOTE: indices of the features sent to each browser tab
+
+    def __post_init__(self) -> None:
+        features = self._features()
+        self._tiles = {}
+        self._sent = {}
+        if self.tiled:
+            for i, feature in enumerate(features):
+                bbox = _get_bbox(feature.get('geometry'))
+                if bbox is not None:
+                    for tile in _get_tiles(bbox, self.tile_zoom):
+                        self._tiles.setdefault(tile, []).append(i)
+        Layer.__post_init__(self)  # NOTE: zero-argument super() does not work with slotted dataclasses
+
+    def to_dict(self) -> Dict:
+        if not self.tiled:
+            return {'type': 'geoJSON', 'args': [self.data, self.options]}
+        # NOTE: the visible features are sent to each browser tab individually (see `_handle_viewport_change`)
+        return {'type': 'geoJSON', 'args': [{'type': 'FeatureCollection', 'features': []}, self.options]}
+
+    def _handle_viewport_change(self, viewer: str, bounds: Optional[Bounds]) -> None:
+        if not self.tiled:
+            return
+        features = self._collect_visible_features(viewer, bounds)
+        if features['features']:
+            self.run_method('addData', features)
+
+    def _forget_viewer(self, viewer: str) -> None:
+        self._sent.pop(viewer, None)
+
+    def _features(self) -> List[Dict]:
+        return self.data['features'] if self.data.get('type') == 'FeatureCollection' else [self.data]
+
+    def _collect_visible_features(self, viewer: str, bounds: Optional[Bounds]) -> Dict:
+        """Collect the features within the given bounds which have not been sent to the given browser tab yet."""
+        indices: Set[int] = set()
+        if bounds is not None:
+            (south, west), (north, east) = bounds
+            x_range, y_range = _get_tile_ranges((west, south, east, north), self.tile_zoom)
+            if len(x_range) * len(y_range) > len(self._tiles):
+                tiles: Any = (tile for tile in self._tiles if tile[0] in x_range and tile[1] in y_range)
+            else:
+                tiles = ((x, y) for x in x_range for y in y_range)
+            for tile in tiles:
+                indices.update(self._tiles.get(tile, []))
+        sent = self._sent.setdefault(viewer, set())
+        indices -= sent
+        sent.update(indices)
+        features = self._features()
+        return {'type': 'FeatureCollection', 'features': [features[i] for i in sorted(indices)]}
+
+
+def _get_bbox(geometry: Optional[Dict]) -> Optional[Tuple[float, float, float, float]]:
+    """Get the bounding box (west, south, east, north) of a GeoJSON geometry."""
+    if not geometry:
+        return None
+    if geometry.get('type') == 'GeometryCollection':
+        boxes = [box for box in map(_get_bbox, geometry.get('geometries', [])) if box is not None]
+    else:
+        positions = list(_iterate_positions(geometry.get('coordinates', [])))
+        boxes = [(p[0], p[1], p[0], p[1]) for p in positions]
+    if not boxes:
+        return None
+    return min(b[0] for b in boxes), min(b[1] for b in boxes), max(b[2] for b in boxes), max(b[3] for b in boxes)
+
+
+def _iterate_positions(coordinates: Any) -> Iterator[List[float]]:
+    if coordinates and isinstance(coordinates[0], (int, float)):
+        yield coordinates
+    else:
+        for item in coordinates:
+            yield from _iterate_positions(item)
+
+
+def _get_tile_ranges(bbox: Tuple[float, float, float, float], zoom: int) -> Tuple[range, range]:
+    """Get the ranges of x and y indices of the map tiles covering a bounding box (west, south, east, north)."""
+    west, south, east, north = bbox
+    n = 2 ** zoom
+    if east - west >= 360:
+        west, east = -180, 180
+    x_min, y_min = _get_tile(north, west, n)
+    x_max, y_max = _get_tile(south, east, n)
+    return range(x_min, x_max + 1), range(y_min, y_max + 1)
+
+
+def _get_tiles(bbox: Tuple[float, float, float, float], zoom: int) -> Iterator[Tuple[int, int]]:
+    x_range, y_range = _get_tile_ranges(bbox, zoom)
+    return ((x, y) for x in x_range for y in y_range)
+
+
+def _get_tile(lat: float, lng: float, n: int) -> Tuple[int, int]:
+    """Get the Web Mercator tile indices of a location for a map with n x n tiles."""
+    lat = max(min(lat, 85.0511), -85.0511)
+    x = int((lng + 180) / 360 * n)
+    y = int((1 - math.asinh(math.tan(math.radians(lat))) / math.pi) / 2 * n)
+    return min(max(x, 0), n - 1), min(max(y, 0), n - 1)
+
+
 @dataclass(**KWONLY_SLOTS)
 class TileLayer(Layer):
     url_template: str
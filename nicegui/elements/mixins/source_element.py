@@ -6,6 +6,7 @@ from typing_extensions import Self
 from ... import core
 from ...binding import BindableProperty, bind, bind_from, bind_to
 from ...element import Element
+from ...frame_stream import FrameStream
 from ...helpers import is_file
 
 
@@ -91,9 +92,12 @@ class SourceElement(Element):
         self.update()
 
     def _set_props(self, source: Any) -> None:
+        if isinstance(source, FrameStream):
+            source = source.url
+        if self.auto_route:
+            core.app.remove_route(self.auto_route)
+            self.auto_route = None
         if is_file(source):
-            if self.auto_route:
-                core.app.remove_route(self.auto_route)
             if self.SOURCE_IS_MEDIA_FILE:
                 source = core.app.add_media_file(local_file=source)
             else:
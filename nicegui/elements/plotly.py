@@ -1,6 +1,7 @@
 from __future__ import annotations
 
-from typing import Dict, Union
+import base64
+from typing import Any, Dict, List, Optional, Union
 
 from .. import optional_features
 from ..element import Element
@@ -11,6 +12,15 @@ try:
 except ImportError:
     pass
 
+try:
+    import numpy as np
+    optional_features.register('numpy')
+except ImportError:
+    pass
+
+TYPED_ARRAY_DTYPES = {'f4', 'f8', 'i1', 'i2', 'i4', 'u1', 'u2', 'u4'}
+INT32_RANGE = (-2**31, 2**31 - 1)
+
 
 class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.min.js']):
 
@@ -25,6 +35,8 @@ class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.m
         * Pass a Python `dict` object with keys `data`, `layout`, `config` (optional), see https://plotly.com/javascript/
 
         For best performance, use the declarative `dict` approach for creating a Plotly chart.
+        To stream data into an existing chart, use `extend_traces`, `restyle` and `relayout`,
+        which only send the changes instead of the whole figure.
 
         :param figure: Plotly figure to be rendered. Can be either a `go.Figure` instance, or
                        a `dict` object with keys `data`, `layout`, `config` (optional).
@@ -35,6 +47,7 @@ class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.m
         super().__init__()
 
         self.figure = figure
+        self._json_cache: Dict[int, List[Any]] = {}  # NOTE: id -> [trace or layout, encoded JSON or None if changed]
         self.update()
         self._classes.append('js-plotly-plot')
         self._update_method = 'update'
@@ -48,14 +61,162 @@ class Plotly(Element, component='plotly.vue', dependencies=['lib/plotly/plotly.m
         self._props['options'] = self._get_figure_json()
         super().update()
 
+    def extend_traces(self, update: Dict[str, List[Any]], indices: List[int], max_points: Optional[int] = None) -> None:
+        """Extend traces with new data points.
+
+        The figure is extended on the server and only the new data points are sent to the client (see `Plotly.extendTraces`).
+        NumPy arrays are sent as binary typed arrays.
+
+        *Added in version 2.15.0*
+
+        :param update: dictionary mapping attributes (e.g. "x", "y" or "marker.color") to lists of new values, one per trace
+        :param indices: indices of the traces to extend
+        :param max_points: maximum number of points to keep per trace (default: ``None`` for no limit)
+        """
+        for key, values in update.items():
+            for index, added_values in zip(indices, values):
+                trace = self.figure.data[index] if isinstance(self.figure, go.Figure) else self.figure['data'][index]
+                old_values = trace[key] if isinstance(self.figure, go.Figure) else _get_path(trace, key)
+                new_values = _concat(old_values, added_values, max_points)
+                if isinstance(self.figure, go.Figure):
+                    trace[key] = new_values
+                else:
+                    _set_path(trace, key, new_values)
+        self._run_plotly_method('extend_traces', update, indices, max_points)
+
+    def restyle(self, update: Dict[str, Any], trace_indices: Optional[List[int]] = None) -> None:
+        """Change attributes of traces (see `Plotly.restyle`).
+
+        Like in Plotly.js, list values are distributed over the traces, e.g. ``{'y': [y1, y2]}`` for two traces.
+        NumPy arrays are sent as binary typed arrays.
+
+        *Added in version 2.15.0*
+
+        :param update: dictionary mapping attributes (e.g. "y" or "marker.color") to new values
+        :param trace_indices: indices of the traces to change (default: ``None`` for all traces)
+        """
+        if isinstance(self.figure, go.Figure):
+            self.figure.plotly_restyle(update, trace_indices)
+        else:
+            traces = self.figure['data']
+            for i, index in enumerate(range(len(traces)) if trace_indices is None else trace_indices):
+                for key, value in update.items():
+                    _set_path(traces[index], key, value[i % len(value)] if isinstance(value, (list, tuple)) else value)
+        self._run_plotly_method('restyle', update, trace_indices)
+
+    def relayout(self, update: Dict[str, Any]) -> None:
+        """Change attributes of the layout (see `Plotly.relayout`).
+
+        *Added in version 2.15.0*
+
+        :param update: dictionary mapping layout attributes (e.g. "title.text" or "xaxis.range") to new values
+        """
+        if isinstance(self.figure, go.Figure):
+            self.figure.plotly_relayout(update)
+        else:
+            layout = self.figure.setdefault('layout', {})
+            for key, value in update.items():
+                _set_path(layout, key, value)
+        self._run_plotly_method('relayout', update)
+
+    def _run_plotly_method(self, name: str, *args: Any) -> None:
+        if self.id in self.client.outbox.updates:
+            # NOTE: the pending update would render the figure including the changes, so we refresh it instead
+            self.update()
+            return
+        self.run_method(name, *(_encode(arg) for arg in args))
+
     def _get_figure_json(self) -> Dict:
         if isinstance(self.figure, go.Figure):
-            # convert go.Figure to dict object which is directly JSON serializable
-            # orjson supports NumPy array serialization
-            return self.figure.to_plotly_json()
+            # traces and layout which have not changed since the last update are not converted again
+            current_ids = {id(source) for source in [*self.figure.data, self.figure.layout]}
+            self._json_cache = {key: entry for key, entry in self._json_cache.items() if key in current_ids}
+            result = {
+                'data': [self._convert(trace) for trace in self.figure.data],
+                'layout': self._convert(self.figure.layout),
+            }
+            if self.figure.frames:
+                result['frames'] = [_encode(frame.to_plotly_json()) for frame in self.figure.frames]
+            return result
 
         if isinstance(self.figure, dict):
             # already a dict object with keys: data, layout, config (optional)
             return self.figure
 
         raise ValueError(f'Plotly figure is of unknown type "{self.figure.__class__.__name__}".')
+
+    def _convert(self, source: Any) -> Dict:
+        entry = self._json_cache.get(id(source))
+        if entry is None or entry[0] is not source:
+            # NOTE: Plotly notifies about all changes of the trace or layout, including nested properties
+            source.on_change(self._handle_figure_change, *source, append=True)
+            entry = self._json_cache[id(source)] = [source, None]
+        if entry[1] is None:
+            entry[1] = _encode(source.to_plotly_json())
+        return entry[1]
+
+    def _handle_figure_change(self, source: Any, *_: Any) -> None:
+        entry = self._json_cache.get(id(source))
+        if entry is not None and entry[0] is source:
+            entry[1] = None
+
+
+def _encode(value: Any) -> Any:
+    """Copy a JSON-like structure and convert NumPy arrays into Plotly's typed array specs."""
+    if isinstance(value, dict):
+        return {key: _encode(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_encode(item) for item in value]
+    if optional_features.has('numpy') and isinstance(value, np.ndarray):
+        return _to_typed_array(value)
+    return value
+
+
+def _to_typed_array(array: np.ndarray) -> Any:
+    if array.ndim > 2 or array.size == 0:
+        return array
+    if array.dtype.kind in 'iu' and array.dtype.itemsize == 8:
+        # NOTE: JavaScript has no 64-bit integer arrays, so we use 32-bit integers if possible
+        if array.min() < INT32_RANGE[0] or array.max() > INT32_RANGE[1]:
+            return array
+        array = array.astype(f'{array.dtype.kind}4')
+    dtype = f'{array.dtype.kind}{array.dtype.itemsize}'
+    if dtype not in TYPED_ARRAY_DTYPES:
+        return array
+    data = np.ascontiguousarray(array, dtype=array.dtype.newbyteorder('<'))
+    spec = {'dtype': dtype, 'bdata': base64.b64encode(data.tobytes()).decode('ascii')}
+    if array.ndim == 2:
+        spec['shape'] = f'{array.shape[0]}, {array.shape[1]}'
+    return spec
+
+
+def _concat(old_values: Any, new_values: Any, max_points: Optional[int]) -> Any:
+    if optional_features.has('numpy') and (isinstance(old_values, np.ndarray) or isinstance(new_values, np.ndarray)):
+        array = np.concatenate([np.asarray(old_values if old_values is not None else []), np.asarray(new_values)])
+        return _truncate(array, max_points)
+    return _truncate(list(old_values or []) + list(new_values), max_points)
+
+
+def _truncate(values: Any, max_points: Optional[int]) -> Any:
+    if max_points is not None and len(values) > max_points:
+        return values[len(values) - max_points:]
+    return values
+
+
+def _get_path(target: Dict, path: str) -> Any:
+    value: Any = target
+    for key in path.split('.'):
+        if not isinstance(value, dict):
+            return None
+        value = value.get(key)
+    return value
+
+
+def _set_path(target: Dict, path: str, value: Any) -> None:
+    *keys, last_key = path.split('.')
+    for key in keys:
+        target = target.setdefault(key, {})
+    if value is None:
+        target.pop(last_key, None)
+    else:
+        target[last_key] = value
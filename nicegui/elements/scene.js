@@ -50,15 +50,53 @@ function texture_material(texture) {
   });
 }
 
+function decode_floats(data) {
+  if (typeof data !== "string") return new Float32Array(data.flat());
+  const bytes = Uint8Array.from(atob(data), (c) => c.charCodeAt(0));
+  return new Float32Array(bytes.buffer);
+}
+
 function set_point_cloud_data(position, color, geometry) {
-  geometry.setAttribute("position", new THREE.Float32BufferAttribute(position.flat(), 3));
+  geometry.setAttribute("position", new THREE.BufferAttribute(decode_floats(position), 3));
   if (color === null) {
     geometry.deleteAttribute("color");
   } else {
-    geometry.setAttribute("color", new THREE.Float32BufferAttribute(color.flat(), 3));
+    geometry.setAttribute("color", new THREE.BufferAttribute(decode_floats(color), 3));
   }
 }
 
+function update_buffer_attribute(attribute, start, data) {
+  if (data === null || !attribute) return;
+  attribute.array.set(decode_floats(data), 3 * start);
+  attribute.needsUpdate = true;
+}
+
+const instance_geometries = {
+  box: THREE.BoxGeometry,
+  sphere: THREE.SphereGeometry,
+  cylinder: THREE.CylinderGeometry,
+  ring: THREE.RingGeometry,
+};
+
+function update_instance_matrices(mesh, start, end) {
+  const { positions, rotations, scales } = mesh.instance_data;
+  const object = new THREE.Object3D();
+  for (let i = start; i < end; ++i) {
+    object.position.fromArray(positions, 3 * i);
+    object.rotation.set(rotations[3 * i], rotations[3 * i + 1], rotations[3 * i + 2]);
+    object.scale.fromArray(scales, 3 * i);
+    object.updateMatrix();
+    mesh.setMatrixAt(i, object.matrix);
+  }
+  mesh.instanceMatrix.needsUpdate = true;
+}
+
+function set_instance_colors(mesh, start, colors) {
+  const color = new THREE.Color();
+  for (let i = 0; i < colors.length / 3; ++i) mesh.setColorAt(start + i, color.fromArray(colors, 3 * i));
+  mesh.instanceColor.needsUpdate = true;
+}
+
 export default {
   template: `
     <div style="position:relative" data-initializing>
@@ -278,6 +316,17 @@ export default {
         const material = new THREE.PointsMaterial({ size: args[2], transparent: true });
         set_point_cloud_data(args[0], args[1], geometry);
         mesh = new THREE.Points(geometry, material);
+      } else if (type == "instanced_mesh") {
+        const [geometry_type, geometry_args, count, positions, rotations, scales, colors] = args;
+        const geometry = new instance_geometries[geometry_type](...geometry_args);
+        mesh = new THREE.InstancedMesh(geometry, new THREE.MeshPhongMaterial({ transparent: true }), count);
+        mesh.instance_data = {
+          positions: decode_floats(positions),
+          rotations: decode_floats(rotations),
+          scales: decode_floats(scales),
+        };
+        update_instance_matrices(mesh, 0, count);
+        if (colors !== null) set_instance_colors(mesh, 0, decode_floats(colors));
       } else if (type == "gltf") {
         const url = args[0];
         mesh = new THREE.Group();
@@ -413,6 +462,25 @@ export default {
       const geometry = this.objects.get(object_id).geometry;
       set_point_cloud_data(position, color, geometry);
     },
+    update_points(object_id, start, position, color) {
+      if (!this.objects.has(object_id)) return;
+      const geometry = this.objects.get(object_id).geometry;
+      update_buffer_attribute(geometry.getAttribute("position"), start, position);
+      update_buffer_attribute(geometry.getAttribute("color"), start, color);
+    },
+    update_instances(object_id, start, positions, rotations, scales, colors) {
+      if (!this.objects.has(object_id)) return;
+      const mesh = this.objects.get(object_id);
+      let end = start;
+      for (const [name, data] of Object.entries({ positions, rotations, scales })) {
+        if (data === null) continue;
+        const values = decode_floats(data);
+        mesh.instance_data[name].set(values, 3 * start);
+        end = Math.max(end, start + values.length / 3);
+      }
+      update_instance_matrices(mesh, start, end);
+      if (colors !== null) set_instance_colors(mesh, start, decode_floats(colors));
+    },
     attach(object_id, parent_id, x, y, z, R) {
       if (!this.objects.has(object_id)) return;
       const object = this.objects.get(object_id);
@@ -503,37 +571,27 @@ export default {
       }
       this.camera.updateProjectionMatrix();
     },
+    apply_updates(updates) {
+      for (const [kind, [ids, values]] of Object.entries(updates)) {
+        if (kind === "move" || kind === "scale") {
+          ids.forEach((id, i) => this[kind](id, values[3 * i], values[3 * i + 1], values[3 * i + 2]));
+        } else if (kind === "rotate") {
+          ids.forEach((id, i) => {
+            const v = values.slice(9 * i, 9 * i + 9);
+            this.rotate(id, [v.slice(0, 3), v.slice(3, 6), v.slice(6, 9)]);
+          });
+        } else {
+          ids.forEach((id, i) => this[kind](id, ...values[i]));
+        }
+      }
+    },
     init_objects(data) {
       this.resize();
       this.$el.removeAttribute("data-initializing");
       this.is_initialized = true;
-      for (const [
-        type,
-        id,
-        parent_id,
-        args,
-        name,
-        color,
-        opacity,
-        side,
-        x,
-        y,
-        z,
-        R,
-        sx,
-        sy,
-        sz,
-        visible,
-        draggable,
-      ] of data) {
+      for (const [type, id, parent_id, args, properties] of data) {
         this.create(type, id, parent_id, ...args);
-        this.name(id, name);
-        this.material(id, color, opacity, side);
-        this.move(id, x, y, z);
-        this.rotate(id, R);
-        this.scale(id, sx, sy, sz);
-        this.visible(id, visible);
-        this.draggable(id, draggable);
+        for (const [method, values] of Object.entries(properties)) this[method](id, ...values);
       }
     },
   },
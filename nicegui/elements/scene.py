@@ -1,10 +1,12 @@
 import asyncio
+from contextlib import contextmanager
 from dataclasses import dataclass
-from typing import Any, Callable, Dict, List, Literal, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
 from typing_extensions import Self
 
-from .. import binding
+from .. import binding, core, json
+from ..awaitable_response import AwaitableResponse
 from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
 from ..events import (
@@ -60,6 +62,7 @@ class Scene(Element,
     from .scene_objects import Extrusion as extrusion
     from .scene_objects import Gltf as gltf
     from .scene_objects import Group as group
+    from .scene_objects import InstancedMesh as instanced_mesh
     from .scene_objects import Line as line
     from .scene_objects import PointCloud as point_cloud
     from .scene_objects import QuadraticBezierTube as quadratic_bezier_tube
@@ -111,6 +114,10 @@ class Scene(Element,
         self._props['camera_params'] = self.camera.params
         self.objects: Dict[str, Object3D] = {}
         self.stack: List[Union[Object3D, SceneObject]] = [SceneObject()]
+        self._pending_updates: Dict[str, Dict[str, Object3D]] = {}
+        self._batch_depth = 0
+        self._flush_scheduled = False
+        self._snapshot: Optional[str] = None
         self._click_handlers = [on_click] if on_click else []
         self._props['click_events'] = click_events[:]
         self._drag_start_handlers = [on_drag_start] if on_drag_start else []
@@ -170,10 +177,83 @@ class Scene(Element,
             Object3D.current_scene = self
         return attribute
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect all object updates within this context and send them as a single packed update when leaving it.
+
+        Changes of name, material, position, rotation, scale, visibility and draggability are always collected
+        and sent once per event loop iteration, only keeping the latest value per object.
+        Within this context they are held back even across `await` statements,
+        e.g. to update many objects of an animation frame at once.
+
+        *Added in version 2.15.0*
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                self._flush_updates()
+
+    def _queue_update(self, kind: str, obj: Object3D) -> None:
+        if core.loop is None:
+            return
+        self._snapshot = None
+        self._pending_updates.setdefault(kind, {})[obj.id] = obj
+        if self._batch_depth == 0 and not self._flush_scheduled:
+            self._flush_scheduled = True
+            core.loop.call_soon(self._flush_updates)
+
+    def _flush_updates(self) -> None:
+        self._flush_scheduled = False
+        if self._batch_depth or not self._pending_updates:
+            return
+        packed: Dict[str, List[Any]] = {}
+        for kind, updates in self._pending_updates.items():
+            objects = [obj for obj in updates.values() if obj.id in self.objects]
+            if kind == 'move':
+                values: List[Any] = [value for obj in objects for value in (obj.x, obj.y, obj.z)]
+            elif kind == 'scale':
+                values = [value for obj in objects for value in (obj.sx, obj.sy, obj.sz)]
+            elif kind == 'rotate':
+                values = [value for obj in objects for row in obj.R for value in row]
+            elif kind == 'material':
+                values = [[obj.color, obj.opacity, obj.side_] for obj in objects]
+            elif kind == 'name':
+                values = [[obj.name] for obj in objects]
+            elif kind == 'visible':
+                values = [[obj.visible_] for obj in objects]
+            else:
+                values = [[obj.draggable_] for obj in objects]
+            if objects:
+                packed[kind] = [[obj.id for obj in objects], values]
+        self._pending_updates = {}
+        if packed and not self.is_deleted:
+            super().run_method('apply_updates', packed)
+
+    def run_method(self, name: str, *args: Any, timeout: float = 1) -> AwaitableResponse:
+        self._flush_updates()  # NOTE: preserve the order of collected updates and other method calls
+        if name not in {'move_camera', 'get_camera'}:
+            self._snapshot = None
+        return super().run_method(name, *args, timeout=timeout)
+
+    def _get_snapshot(self) -> str:
+        """Get a compact JSON snapshot of all objects, which is cached until the scene changes.
+
+        Each object is represented by its type, ID, parent ID and arguments,
+        followed by a dictionary with only those properties which differ from their defaults.
+        """
+        if self._snapshot is None:
+            self._snapshot = json.dumps([_compact(obj.data) for obj in self.objects.values()])
+        return self._snapshot
+
     def _handle_init(self, e: GenericEventArguments) -> None:
+        self._flush_updates()
         with self.client.individual_target(e.args['socket_id']):
             self.move_camera(duration=0)
-            self.run_method('init_objects', [obj.data for obj in self.objects.values()])
+            if core.loop:
+                self.client.run_javascript(f'return runMethod({self.id}, "init_objects", [{self._get_snapshot()}])')
 
     async def initialized(self) -> None:
         """Wait until the scene is initialized."""
@@ -286,3 +366,28 @@ class Scene(Element,
         """Remove all objects from the scene."""
         super().clear()
         self.delete_objects()
+
+
+_DEFAULTS = {
+    'name': [None],
+    'material': ['#ffffff', 1.0, 'front'],
+    'move': [0, 0, 0],
+    'rotate': [[[1, 0, 0], [0, 1, 0], [0, 0, 1]]],
+    'scale': [1, 1, 1],
+    'visible': [True],
+    'draggable': [False],
+}
+
+
+def _compact(data: List[Any]) -> List[Any]:
+    type_, id_, parent_id, args, name, color, opacity, side, x, y, z, R, sx, sy, sz, visible, draggable = data
+    properties = {
+        'name': [name],
+        'material': [color, opacity, side],
+        'move': [x, y, z],
+        'rotate': [R],
+        'scale': [sx, sy, sz],
+        'visible': [visible],
+        'draggable': [draggable],
+    }
+    return [type_, id_, parent_id, args, {key: value for key, value in properties.items() if value != _DEFAULTS[key]}]
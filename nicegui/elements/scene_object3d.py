@@ -67,25 +67,25 @@ class Object3D:
         self.scene.run_method('create', self.type, self.id, self.parent.id, *self.args)
 
     def _name(self) -> None:
-        self.scene.run_method('name', self.id, self.name)
+        self.scene._queue_update('name', self)  # pylint: disable=protected-access
 
     def _material(self) -> None:
-        self.scene.run_method('material', self.id, self.color, self.opacity, self.side_)
+        self.scene._queue_update('material', self)  # pylint: disable=protected-access
 
     def _move(self) -> None:
-        self.scene.run_method('move', self.id, self.x, self.y, self.z)
+        self.scene._queue_update('move', self)  # pylint: disable=protected-access
 
     def _rotate(self) -> None:
-        self.scene.run_method('rotate', self.id, self.R)
+        self.scene._queue_update('rotate', self)  # pylint: disable=protected-access
 
     def _scale(self) -> None:
-        self.scene.run_method('scale', self.id, self.sx, self.sy, self.sz)
+        self.scene._queue_update('scale', self)  # pylint: disable=protected-access
 
     def _visible(self) -> None:
-        self.scene.run_method('visible', self.id, self.visible_)
+        self.scene._queue_update('visible', self)  # pylint: disable=protected-access
 
     def _draggable(self) -> None:
-        self.scene.run_method('draggable', self.id, self.draggable_)
+        self.scene._queue_update('draggable', self)  # pylint: disable=protected-access
 
     def _delete(self) -> None:
         self.scene.run_method('delete', self.id)
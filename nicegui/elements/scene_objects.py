@@ -1,9 +1,34 @@
+import base64
 import math
-from typing import List, Optional
+from array import array
+from typing import Any, List, Literal, Optional, Sequence
 
 from .scene_object3d import Object3D
 
 
+def _float_array(values: Any) -> 'array[float]':
+    """Convert a NumPy array or a nested list of numbers into a flat array of 32-bit floats."""
+    result = array('f')
+    if hasattr(values, 'astype'):  # NOTE: NumPy arrays are converted without iterating over the elements
+        result.frombytes(values.astype('float32').tobytes())
+    else:
+        result.extend(float(value) for row in values for value in row)
+    return result
+
+
+def _pack(values: Optional['array[float]']) -> Optional[str]:
+    """Pack a float array into a base64 string which is decoded into a Float32Array in the browser."""
+    return None if values is None else base64.b64encode(values.tobytes()).decode()
+
+
+def _update_range(target: 'array[float]', start: int, values: Any, width: int, name: str) -> 'array[float]':
+    update = _float_array(values)
+    if len(update) % width or start < 0 or start * width + len(update) > len(target):
+        raise ValueError(f'{name} must have {width} values per item and fit into the existing {len(target) // width} items')
+    target[start * width:start * width + len(update)] = update
+    return update
+
+
 class Group(Object3D):
 
     def __init__(self) -> None:
@@ -324,22 +349,135 @@ class PointCloud(Object3D):
 
         This element is based on Three.js' `Points <https://threejs.org/docs/index.html#api/en/objects/Points>`_ object.
 
+        Points and colors can be given as nested lists or as NumPy arrays of shape (n, 3).
+        They are transmitted as binary 32-bit float buffers.
+
         :param points: list of points
         :param colors: optional list of colors (one per point)
         :param point_size: size of the points (default: 1.0)
         """
-        super().__init__('point_cloud', points, colors, point_size)
+        self._points = _float_array(points)
+        self._colors = None if colors is None else _float_array(colors)
+        self._packed = True
+        super().__init__('point_cloud', _pack(self._points), _pack(self._colors), point_size)
         if colors is not None:
             self.material(color=None)
 
+    @property
+    def data(self) -> List[Any]:
+        if not self._packed:
+            self.args[0] = _pack(self._points)
+            self.args[1] = _pack(self._colors)
+            self._packed = True
+        return super().data
+
     def set_points(self, points: List[List[float]], colors: Optional[List[List[float]]] = None) -> None:
         """Change the points and colors of the point cloud."""
-        self.args[0] = points
-        self.args[1] = colors
-        self.scene.run_method('set_points', self.id, points, colors)
+        self._points = _float_array(points)
+        self._colors = None if colors is None else _float_array(colors)
+        self.args[0] = _pack(self._points)
+        self.args[1] = _pack(self._colors)
+        self._packed = True
+        self.scene.run_method('set_points', self.id, self.args[0], self.args[1])
         if colors is not None:
             self.material(color=None)
 
+    def update_points(self,
+                      start: int = 0,
+                      points: Optional[List[List[float]]] = None,
+                      colors: Optional[List[List[float]]] = None) -> None:
+        """Change a contiguous range of points and/or colors without re-sending the whole point cloud.
+
+        *Added in version 2.15.0*
+
+        :param start: index of the first point to change
+        :param points: new coordinates for the points starting at `start`
+        :param colors: new colors for the points starting at `start` (the point cloud must have been created with colors)
+        """
+        if colors is not None and self._colors is None:
+            raise ValueError('The point cloud has no colors which could be updated')
+        point_update = None if points is None else _update_range(self._points, start, points, 3, 'points')
+        color_update = None if colors is None else _update_range(self._colors, start, colors, 3, 'colors')  # type: ignore
+        self._packed = False
+        self.scene.run_method('update_points', self.id, start, _pack(point_update), _pack(color_update))
+
+
+class InstancedMesh(Object3D):
+
+    def __init__(self,
+                 geometry: Literal['box', 'sphere', 'cylinder', 'ring'] = 'box',
+                 geometry_args: Sequence[float] = (), *,
+                 positions: List[List[float]],
+                 rotations: Optional[List[List[float]]] = None,
+                 scales: Optional[List[List[float]]] = None,
+                 colors: Optional[List[List[float]]] = None,
+                 ) -> None:
+        """Instanced Mesh
+
+        This element is based on Three.js' `InstancedMesh <https://threejs.org/docs/index.html#api/en/objects/InstancedMesh>`_ object.
+        It renders many copies of the same geometry as a single object,
+        which is much more efficient than creating one object per copy.
+
+        Positions, rotations, scales and colors can be given as nested lists or as NumPy arrays of shape (n, 3).
+        They are transmitted as binary 32-bit float buffers.
+
+        *Added in version 2.15.0*
+
+        :param geometry: geometry of each instance ("box", "sphere", "cylinder" or "ring", default: "box")
+        :param geometry_args: arguments of the geometry, like the ones of ``scene.box`` or ``scene.sphere`` (without ``wireframe``)
+        :param positions: x, y and z coordinates of each instance
+        :param rotations: optional Euler angles (in radians) around the x, y and z axes of each instance
+        :param scales: optional scale factors along the x, y and z axes of each instance
+        :param colors: optional RGB colors (0..1) of each instance
+        """
+        self._positions = _float_array(positions)
+        self.count = len(self._positions) // 3
+        self._rotations = array('f', [0.0]) * (3 * self.count) if rotations is None else _float_array(rotations)
+        self._scales = array('f', [1.0]) * (3 * self.count) if scales is None else _float_array(scales)
+        self._colors = None if colors is None else _float_array(colors)
+        for name, values in [('rotations', self._rotations), ('scales', self._scales), ('colors', self._colors)]:
+            if values is not None and len(values) != 3 * self.count:
+                raise ValueError(f'{name} must have 3 values for each of the {self.count} instances')
+        self._packed = True
+        super().__init__('instanced_mesh', geometry, list(geometry_args), self.count,
+                         _pack(self._positions), _pack(self._rotations), _pack(self._scales), _pack(self._colors))
+
+    @property
+    def data(self) -> List[Any]:
+        if not self._packed:
+            self.args[3:7] = [_pack(self._positions), _pack(self._rotations), _pack(self._scales), _pack(self._colors)]
+            self._packed = True
+        return super().data
+
+    def update_instances(self,
+                         start: int = 0, *,
+                         positions: Optional[List[List[float]]] = None,
+                         rotations: Optional[List[List[float]]] = None,
+                         scales: Optional[List[List[float]]] = None,
+                         colors: Optional[List[List[float]]] = None,
+                         ) -> None:
+        """Change a contiguous range of instances without re-sending all of them.
+
+        :param start: index of the first instance to change
+        :param positions: new positions of the instances starting at `start`
+        :param rotations: new Euler angles of the instances starting at `start`
+        :param scales: new scale factors of the instances starting at `start`
+        :param colors: new colors of the instances starting at `start` (the mesh must have been created with colors)
+        """
+        if colors is not None and self._colors is None:
+            raise ValueError('The instanced mesh has no colors which could be updated')
+        updates = [
+            None if values is None else _update_range(target, start, values, 3, name)  # type: ignore
+            for name, target, values in [
+                ('positions', self._positions, positions),
+                ('rotations', self._rotations, rotations),
+                ('scales', self._scales, scales),
+                ('colors', self._colors, colors),
+            ]
+        ]
+        self._packed = False
+        self.scene.run_method('update_instances', self.id, start, *[_pack(update) for update in updates])
+
 
 class AxesHelper(Object3D):
 
@@ -1,11 +1,12 @@
 export default {
-  props: ["options"],
+  props: ["options", "serverSearch"],
   template: `
     <q-select
       ref="qRef"
       v-bind="$attrs"
       :options="filteredOptions"
       @filter="filterFn"
+      @virtual-scroll="onVirtualScroll"
     >
       <template v-for="(_, slot) in $slots" v-slot:[slot]="slotProps">
         <slot :name="slot" v-bind="slotProps || {}" />
@@ -20,8 +21,18 @@ export default {
   },
   methods: {
     filterFn(val, update, abort) {
+      if (this.serverSearch) {
+        this.pendingUpdate = update;
+        this.$emit("search", val);
+        return;
+      }
       update(() => (this.filteredOptions = val ? this.findFilteredOptions() : this.initialOptions));
     },
+    onVirtualScroll({ to }) {
+      if (!this.serverSearch || this.isLoadingMore || to < this.filteredOptions.length - 1) return;
+      this.isLoadingMore = true;
+      this.$emit("search_more");
+    },
     findFilteredOptions() {
       const needle = this.$el.querySelector("input[type=search]")?.value.toLocaleLowerCase();
       return needle
@@ -30,7 +41,7 @@ export default {
     },
   },
   updated() {
-    if (!this.$attrs.multiple) return;
+    if (!this.$attrs.multiple || this.serverSearch) return;
     const newFilteredOptions = this.findFilteredOptions();
     if (newFilteredOptions.length !== this.filteredOptions.length) {
       this.filteredOptions = newFilteredOptions;
@@ -41,6 +52,11 @@ export default {
       handler(newOptions) {
         this.initialOptions = newOptions;
         this.filteredOptions = newOptions;
+        this.isLoadingMore = false;
+        if (this.pendingUpdate) {
+          this.pendingUpdate();
+          this.pendingUpdate = null;
+        }
       },
       immediate: true,
     },
@@ -1,7 +1,10 @@
+import inspect
 from collections.abc import Generator, Iterable
 from copy import deepcopy
-from typing import Any, Callable, Dict, Iterator, List, Literal, Optional, Union
+from itertools import islice
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Literal, Optional, Tuple, Union
 
+from .. import core
 from ..events import GenericEventArguments, Handler, ValueChangeEventArguments
 from .choice_element import ChoiceElement
 from .mixins.disableable_element import DisableableElement
@@ -22,6 +25,9 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
                  clearable: bool = False,
                  validation: Optional[Union[ValidationFunction, ValidationDict]] = None,
                  key_generator: Optional[Union[Callable[[Any], Any], Iterator[Any]]] = None,
+                 search: Union[bool, Callable[[str], Union[Iterable, Awaitable[Iterable]]]] = False,
+                 search_limit: int = 100,
+                 search_debounce: float = 0.3,
                  ) -> None:
         """Dropdown Selection
 
@@ -42,6 +48,15 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
         Alternatively, you can pass a callable that returns an optional error message.
         To disable the automatic validation on every value change, you can use the `without_auto_validation` method.
 
+        For large numbers of options, the `search` parameter enables a server-side search mode (*added in version 2.15.0*):
+        Only the matching options are sent to the client, `search_limit` at a time.
+        More results are loaded when scrolling to the end of the list.
+        With ``search=True``, the options are filtered by their labels on the server.
+        Alternatively, `search` can be a (possibly async) callback which receives the search string
+        and returns an iterable of values or a dictionary mapping values to labels, e.g. from a database query.
+        Generators are only consumed as far as results are displayed.
+        Search mode cannot be combined with `new_value_mode`.
+
         :param options: a list ['value1', ...] or dictionary `{'value1':'label1', ...}` specifying the options
         :param label: the label to display above the selection
         :param value: the initial value
@@ -52,8 +67,19 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
         :param clearable: whether to add a button to clear the selection
         :param validation: dictionary of validation rules or a callable that returns an optional error message (default: None for no validation)
         :param key_generator: a callback or iterator to generate a dictionary key for new values
+        :param search: whether to search options on the server or a callback returning the matching options (default: False)
+        :param search_limit: maximum number of search results to send at once (default: 100)
+        :param search_debounce: time to wait after typing before searching in seconds (default: 0.3)
         """
         self.multiple = multiple
+        if search and new_value_mode is not None:
+            raise ValueError('new_value_mode is not supported in search mode')
+        self._search_mode = bool(search)
+        self._search_callback = search if callable(search) else None
+        self._search_limit = search_limit
+        self._search_results: List[Tuple[Any, Any]] = []
+        self._search_iterator: Optional[Iterator[Tuple[Any, Any]]] = None
+        self._search_count = 0
         if multiple:
             if value is None:
                 value = []
@@ -61,6 +87,9 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
                 value = [value]
             else:
                 value = value[:]  # NOTE: avoid modifying the original list which could be the list of options (#3014)
+        if self._search_mode:
+            initial_values = value if multiple else [] if value is None else [value]
+            self._search_results = [(v, options.get(v, v) if isinstance(options, dict) else v) for v in initial_values]
         super().__init__(label=label, options=options, value=value, on_change=on_change, validation=validation)
         if isinstance(key_generator, Generator):
             next(key_generator)  # prime the key generator, prepare it to receive the first value
@@ -76,6 +105,14 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
             self._props['hide-selected'] = not multiple
             self._props['fill-input'] = True
             self._props['input-debounce'] = 0
+        if self._search_mode:
+            self._props['server-search'] = True
+            self._props['use-input'] = True
+            self._props['hide-selected'] = not multiple
+            self._props['fill-input'] = True
+            self._props['input-debounce'] = round(search_debounce * 1000)
+            self.on('search', self._handle_search)
+            self.on('search_more', self._handle_search_more)
         self._props['multiple'] = multiple
         self._props['clearable'] = clearable
 
@@ -88,6 +125,61 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
         """Whether the options popup is currently shown."""
         return self._is_showing_popup
 
+    def _update_values_and_labels(self) -> None:
+        if not self._search_mode:
+            super()._update_values_and_labels()
+            return
+        values = [value for value, _ in self._search_results]
+        labels = [label for _, label in self._search_results]
+        value = getattr(self, 'value', None)  # NOTE: the value is not set yet during initialization
+        selected_values = (value or []) if self.multiple else ([] if value is None else [value])
+        for selected_value in selected_values:
+            if selected_value not in values:
+                values.append(selected_value)
+                labels.append(self._labels[self._values.index(selected_value)]
+                              if selected_value in self._values else self._get_option_label(selected_value))
+        self._values = values
+        self._labels = labels
+
+    def _get_option_label(self, value: Any) -> Any:
+        return self.options.get(value, value) if isinstance(self.options, dict) else value
+
+    def _search_options(self, query: str) -> Iterator[Tuple[Any, Any]]:
+        needle = query.lower()
+        items = self.options.items() if isinstance(self.options, dict) else ((option, option) for option in self.options)
+        return ((value, label) for value, label in items if needle in str(label).lower())
+
+    async def _handle_search(self, e: GenericEventArguments) -> None:
+        query = e.args or ''
+        if self._search_callback is None:
+            self._search_iterator = self._search_options(query)
+        else:
+            self._search_count += 1
+            search_count = self._search_count
+            try:
+                result = self._search_callback(query)
+                if inspect.isawaitable(result):
+                    result = await result
+            except Exception as ex:
+                core.app.handle_exception(ex)
+                result = []
+            if search_count != self._search_count:
+                return  # NOTE: the results of a newer search are on their way
+            self._search_iterator = iter(result.items()) if isinstance(result, dict) else \
+                ((value, self._get_option_label(value)) for value in result)
+        self._search_results = list(islice(self._search_iterator, self._search_limit))
+        self.update()
+
+    def _handle_search_more(self) -> None:
+        if self._search_iterator is None:
+            return
+        results = list(islice(self._search_iterator, self._search_limit))
+        if not results:
+            self._search_iterator = None
+            return
+        self._search_results.extend(results)
+        self.update()
+
     def _event_args_to_value(self, e: GenericEventArguments) -> Any:
         if self.multiple:
             if e.args is None:
@@ -110,6 +202,8 @@ class Select(LabelElement, ValidationElement, ChoiceElement, DisableableElement,
 
     def _value_to_model_value(self, value: Any) -> Any:
         # pylint: disable=no-else-return
+        if self._search_mode:
+            self._update_values_and_labels()  # NOTE: make sure that a newly set value has an index
         if self.multiple:
             result = []
             for item in value or []:
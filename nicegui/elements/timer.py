@@ -3,8 +3,8 @@ from typing import ContextManager
 
 from ..client import Client
 from ..element import Element
-from ..logging import log
 from ..timer import Timer as BaseTimer
+from ..timer import scheduler
 
 
 class Timer(BaseTimer, Element, component='timer.js'):
@@ -12,23 +12,15 @@ class Timer(BaseTimer, Element, component='timer.js'):
     def _get_context(self) -> ContextManager:
         return self.parent_slot or nullcontext()
 
-    async def _can_start(self) -> bool:
-        """Wait for the client connection before the timer callback can be allowed to manipulate the state.
+    def _is_paused(self) -> bool:
+        """Pause the timer while the client is not connected.
 
-        See https://github.com/zauberzeug/nicegui/issues/206 for details.
-        Returns True if the client is connected, False if the client is not connected and the timer should be cancelled.
+        This prevents the timer callback from manipulating the state before the client is connected
+        (see https://github.com/zauberzeug/nicegui/issues/206 for details)
+        and saves resources while the client is disconnected.
+        Clients which do not connect or reconnect are eventually deleted, which stops the timer.
         """
-        if self.client.shared:
-            return True
-
-        # ignore served pages which do not reconnect to backend (e.g. monitoring requests, scrapers etc.)
-        TIMEOUT = 60.0
-        try:
-            await self.client.connected(timeout=TIMEOUT)
-            return True
-        except TimeoutError:
-            log.error(f'Timer cancelled because client is not connected after {TIMEOUT} seconds')
-            return False
+        return not self.client.shared and not self.client.has_socket_connection
 
     def _should_stop(self) -> bool:
         return (
@@ -37,6 +29,10 @@ class Timer(BaseTimer, Element, component='timer.js'):
             super()._should_stop()
         )
 
+    def _handle_delete(self) -> None:
+        scheduler.unschedule(self)
+        super()._handle_delete()
+
     def _cleanup(self) -> None:
         super()._cleanup()
         if not self._deleted:
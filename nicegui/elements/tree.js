@@ -0,0 +1,99 @@
+export default {
+  template: `
+    <q-tree
+      ref="qRef"
+      v-bind="$attrs"
+      :nodes="nodes"
+      :node-key="nodeKey"
+      :children-key="childrenKey"
+      @lazy-load="onLazyLoad"
+    >
+      <template v-for="(_, slot) in $slots" v-slot:[slot]="slotProps">
+        <slot :name="slot" v-bind="slotProps || {}" />
+      </template>
+    </q-tree>
+  `,
+  props: {
+    nodes: Array,
+    nodeKey: String,
+    childrenKey: String,
+  },
+  created() {
+    this.pendingLoads = new Map();
+    this.index = null;
+  },
+  watch: {
+    nodes() {
+      this.index = null;
+    },
+  },
+  methods: {
+    onLazyLoad({ key, done, fail }) {
+      this.pendingLoads.set(key, { done, fail });
+      this.$emit("lazy_load", key);
+    },
+    finish_lazy_load(key, children) {
+      const load = this.pendingLoads.get(key);
+      if (!load) return;
+      this.pendingLoads.delete(key);
+      load.done(children);
+      if (this.index) this.indexNodes(children, key);
+    },
+    fail_lazy_load(key) {
+      const load = this.pendingLoads.get(key);
+      if (!load) return;
+      this.pendingLoads.delete(key);
+      load.fail();
+    },
+    getIndex() {
+      if (!this.index) {
+        this.index = new Map();
+        this.indexNodes(this.nodes, null);
+      }
+      return this.index;
+    },
+    indexNodes(nodes, parentKey) {
+      const stack = nodes.map((node) => [node, parentKey]);
+      while (stack.length) {
+        const [node, parent] = stack.pop();
+        this.index.set(node[this.nodeKey], { node, parent });
+        for (const child of node[this.childrenKey] || []) stack.push([child, node[this.nodeKey]]);
+      }
+    },
+    getSiblings(parentKey, create = false) {
+      if (parentKey === null) return this.nodes;
+      const parent = this.getIndex().get(parentKey)?.node;
+      if (!parent) return undefined;
+      if (!parent[this.childrenKey] && create) parent[this.childrenKey] = [];
+      return parent[this.childrenKey];
+    },
+    add_nodes(parentKey, nodes, position) {
+      const siblings = this.getSiblings(parentKey, true);
+      if (!siblings) return;
+      siblings.splice(position ?? siblings.length, 0, ...nodes);
+      this.indexNodes(nodes, parentKey);
+    },
+    remove_nodes(keys) {
+      const index = this.getIndex();
+      for (const key of keys) {
+        const entry = index.get(key);
+        if (!entry) continue;
+        const siblings = this.getSiblings(entry.parent) || [];
+        const i = siblings.indexOf(entry.node);
+        if (i >= 0) siblings.splice(i, 1);
+        const stack = [entry.node];
+        while (stack.length) {
+          const node = stack.pop();
+          index.delete(node[this.nodeKey]);
+          stack.push(...(node[this.childrenKey] || []));
+        }
+      }
+    },
+    update_node(key, data) {
+      const entry = this.getIndex().get(key);
+      if (!entry) return;
+      Object.assign(entry.node, data);
+      if (this.nodeKey in data || this.childrenKey in data) this.index = null;
+    },
+  },
+};
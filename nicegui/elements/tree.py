@@ -1,12 +1,14 @@
-from typing import Any, Dict, Iterator, List, Literal, Optional, Set
+import inspect
+from typing import Any, Awaitable, Callable, Dict, List, Literal, Optional, Set, Tuple, Union
 
 from typing_extensions import Self
 
+from .. import core
 from ..events import GenericEventArguments, Handler, ValueChangeEventArguments, handle_event
 from .mixins.filter_element import FilterElement
 
 
-class Tree(FilterElement):
+class Tree(FilterElement, component='tree.js'):
 
     def __init__(self,
                  nodes: List[Dict], *,
@@ -17,6 +19,7 @@ class Tree(FilterElement):
                  on_expand: Optional[Handler[ValueChangeEventArguments]] = None,
                  on_tick: Optional[Handler[ValueChangeEventArguments]] = None,
                  tick_strategy: Optional[Literal['leaf', 'leaf-filtered', 'strict']] = None,
+                 load_children: Optional[Callable[[Dict], Union[List[Dict], Awaitable[List[Dict]]]]] = None,
                  ) -> None:
         """Tree
 
@@ -26,6 +29,11 @@ class Tree(FilterElement):
 
         To use checkboxes and ``on_tick``, set the ``tick_strategy`` parameter to "leaf", "leaf-filtered" or "strict".
 
+        For large trees, nodes can be loaded lazily:
+        Nodes with ``'lazy': True`` get their children from the ``load_children`` callback when they are expanded for the first time.
+        Nodes can also be added, removed and updated with ``add_nodes``, ``remove_nodes`` and ``update_node``,
+        which only send the changed nodes to the client.
+
         :param nodes: hierarchical list of node objects
         :param node_key: property name of each node object that holds its unique id (default: "id")
         :param label_key: property name of each node object that holds its label (default: "label")
@@ -34,8 +42,9 @@ class Tree(FilterElement):
         :param on_expand: callback which is invoked when the node expansion changes
         :param on_tick: callback which is invoked when a node is ticked or unticked
         :param tick_strategy: whether and how to use checkboxes ("leaf", "leaf-filtered" or "strict"; default: ``None``)
+        :param load_children: callback which receives a lazy node and returns its children (can be async, *added in version 2.15.0*)
         """
-        super().__init__(tag='q-tree', filter=None)
+        super().__init__(filter=None)
         self._props['nodes'] = nodes
         self._props['node-key'] = node_key
         self._props['label-key'] = label_key
@@ -50,6 +59,8 @@ class Tree(FilterElement):
         self._select_handlers = [on_select] if on_select else []
         self._expand_handlers = [on_expand] if on_expand else []
         self._tick_handlers = [on_tick] if on_tick else []
+        self._load_children = load_children
+        self._node_index: Optional[Dict[Any, Tuple[Dict, Any]]] = None
 
         # https://github.com/zauberzeug/nicegui/issues/1385
         self._props.add_warning('default-expand-all',
@@ -59,7 +70,7 @@ class Tree(FilterElement):
         def update_prop(name: str, value: Any) -> None:
             if self._props[name] != value:
                 self._props[name] = value
-                self.update()
+                self._update_state()
 
         def handle_selected(e: GenericEventArguments) -> None:
             update_prop('selected', e.args)
@@ -79,6 +90,10 @@ class Tree(FilterElement):
                 handle_event(handler, ValueChangeEventArguments(sender=self, client=self.client, value=e.args))
         self.on('update:ticked', handle_ticked)
 
+        async def handle_lazy_load(e: GenericEventArguments) -> None:
+            await self._handle_lazy_load(e.args)
+        self.on('lazy_load', handle_lazy_load)
+
     def on_select(self, callback: Handler[ValueChangeEventArguments]) -> Self:
         """Add a callback to be invoked when the selection changes."""
         self._props.setdefault('selected', None)
@@ -93,7 +108,7 @@ class Tree(FilterElement):
         self._props.setdefault('selected', None)
         if self._props['selected'] != node_key:
             self._props['selected'] = node_key
-            self.update()
+            self._update_state()
         return self
 
     def deselect(self) -> Self:
@@ -120,7 +135,7 @@ class Tree(FilterElement):
         """
         self._props.setdefault('ticked', [])
         self._props['ticked'][:] = self._find_node_keys(node_keys).union(self._props['ticked'])
-        self.update()
+        self._update_state()
         return self
 
     def untick(self, node_keys: Optional[List[str]] = None) -> Self:
@@ -130,7 +145,7 @@ class Tree(FilterElement):
         """
         self._props.setdefault('ticked', [])
         self._props['ticked'][:] = set(self._props['ticked']).difference(self._find_node_keys(node_keys))
-        self.update()
+        self._update_state()
         return self
 
     def expand(self, node_keys: Optional[List[str]] = None) -> Self:
@@ -140,7 +155,7 @@ class Tree(FilterElement):
         """
         self._props.setdefault('expanded', [])
         self._props['expanded'][:] = self._find_node_keys(node_keys).union(self._props['expanded'])
-        self.update()
+        self._update_state()
         return self
 
     def collapse(self, node_keys: Optional[List[str]] = None) -> Self:
@@ -150,18 +165,127 @@ class Tree(FilterElement):
         """
         self._props.setdefault('expanded', [])
         self._props['expanded'][:] = set(self._props['expanded']).difference(self._find_node_keys(node_keys))
-        self.update()
+        self._update_state()
         return self
 
-    def _find_node_keys(self, node_keys: Optional[List[str]] = None) -> Set[str]:
-        if node_keys is not None:
-            return set(node_keys)
+    def add_nodes(self, nodes: List[Dict], parent_key: Optional[str] = None, position: Optional[int] = None) -> Self:
+        """Add nodes to the tree and send only these nodes to the client.
 
-        CHILDREN_KEY = self._props['children-key']
+        *Added in version 2.15.0*
+
+        :param nodes: list of node objects to add
+        :param parent_key: key of the parent node or ``None`` to add root nodes (default: ``None``)
+        :param position: index within the parent's children (default: append)
+        """
+        siblings = self._get_children(parent_key, create=True)
+        if position is None:
+            siblings.extend(nodes)
+        else:
+            siblings[position:position] = nodes
+        self._index_nodes(nodes, parent_key)
+        self._send_patch('add_nodes', parent_key, nodes, position)
+        return self
+
+    def remove_nodes(self, node_keys: List[str]) -> Self:
+        """Remove nodes including their descendants from the tree.
+
+        *Added in version 2.15.0*
+
+        :param node_keys: list of node keys to remove
+        """
+        index = self._get_node_index()
+        for node_key in node_keys:
+            if node_key not in index:
+                continue
+            node, parent_key = index[node_key]
+            siblings = self._get_children(parent_key)
+            siblings[:] = [sibling for sibling in siblings if sibling is not node]
+            stack = [node]
+            while stack:
+                node = stack.pop()
+                index.pop(node[self._props['node-key']], None)
+                stack.extend(node.get(self._props['children-key'], []))
+        self._send_patch('remove_nodes', node_keys)
+        return self
+
+    def update_node(self, node_key: str, data: Dict) -> Self:
+        """Update properties of a node and send only these properties to the client.
+
+        *Added in version 2.15.0*
+
+        :param node_key: key of the node to update
+        :param data: dictionary of node properties to set
+        """
+        node, _ = self._get_node_index()[node_key]
+        node.update(data)
+        if self._props['node-key'] in data or self._props['children-key'] in data:
+            self._node_index = None
+        self._send_patch('update_node', node_key, data)
+        return self
+
+    def update(self) -> None:
+        """Update the element on the client side.
+
+        Call this method after changing the nodes in place to also refresh the node index.
+        """
+        self._node_index = None  # NOTE: nodes might have been changed in place
+        super().update()
+
+    def _update_state(self) -> None:
+        """Update the element after changing selection, expansion or ticks, which keep the node index valid."""
+        super().update()
+
+    def _send_patch(self, name: str, *args: Any) -> None:
+        if self.is_deleted or self.id in self.client.outbox.updates:
+            return  # NOTE: the pending full update already contains the change
+        self.run_method(name, *args)
+
+    async def _handle_lazy_load(self, node_key: str) -> None:
+        entry = self._get_node_index().get(node_key)
+        if entry is None or self._load_children is None:
+            self.run_method('fail_lazy_load', node_key)
+            return
+        node, _ = entry
+        try:
+            result = self._load_children(node)
+            if inspect.isawaitable(result):
+                result = await result
+            children = list(result)
+        except Exception as e:
+            core.app.handle_exception(e)
+            self.run_method('fail_lazy_load', node_key)
+            return
+        node[self._props['children-key']] = children
+        node.pop('lazy', None)  # NOTE: new clients receive the children with the node
+        self._index_nodes(children, node_key)
+        self.run_method('finish_lazy_load', node_key, children)
+
+    def _get_node_index(self) -> Dict[Any, Tuple[Dict, Any]]:
+        if self._node_index is None:
+            self._node_index = {}
+            self._index_nodes(self._props['nodes'], None)
+        return self._node_index
+
+    def _index_nodes(self, nodes: List[Dict], parent_key: Any) -> None:
+        if self._node_index is None:
+            return
         NODE_KEY = self._props['node-key']
+        CHILDREN_KEY = self._props['children-key']
+        stack = [(node, parent_key) for node in nodes]
+        while stack:
+            node, parent_key = stack.pop()
+            self._node_index[node[NODE_KEY]] = (node, parent_key)
+            stack.extend((child, node[NODE_KEY]) for child in node.get(CHILDREN_KEY, []))
 
-        def iterate_nodes(nodes: List[Dict]) -> Iterator[Dict]:
-            for node in nodes:
-                yield node
-                yield from iterate_nodes(node.get(CHILDREN_KEY, []))
-        return {node[NODE_KEY] for node in iterate_nodes(self._props['nodes'])}
+    def _get_children(self, parent_key: Any, *, create: bool = False) -> List[Dict]:
+        if parent_key is None:
+            return self._props['nodes']
+        parent, _ = self._get_node_index()[parent_key]
+        if create:
+            return parent.setdefault(self._props['children-key'], [])
+        return parent.get(self._props['children-key'], [])
+
+    def _find_node_keys(self, node_keys: Optional[List[str]] = None) -> Set[str]:
+        if node_keys is not None:
+            return set(node_keys)
+        return set(self._get_node_index())
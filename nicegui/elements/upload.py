@@ -1,14 +1,40 @@
-from typing import Dict, List, Optional, cast
+import time
+from tempfile import SpooledTemporaryFile
+from typing import BinaryIO, Dict, List, Optional, Tuple, cast
 
-from fastapi import Request
-from starlette.datastructures import UploadFile
+from fastapi import HTTPException, Request
+from python_multipart.multipart import MultipartParser, parse_options_header
+from starlette.datastructures import Headers, UploadFile
 from typing_extensions import Self
 
-from ..events import Handler, MultiUploadEventArguments, UiEventArguments, UploadEventArguments, handle_event
+from ..events import (
+    Handler,
+    MultiUploadEventArguments,
+    UiEventArguments,
+    UploadChunkEventArguments,
+    UploadEventArguments,
+    UploadProgressEventArguments,
+    handle_event,
+    wait_for_event,
+)
 from ..nicegui import app
 from .mixins.disableable_element import DisableableElement
 from .mixins.label_element import LabelElement
 
+PROGRESS_INTERVAL = 0.1
+SPOOL_MAX_SIZE = 1024 * 1024
+
+
+class _UploadPart:
+
+    def __init__(self, name: str, content_type: str, upload: Optional[UploadFile]) -> None:
+        self.name = name
+        self.content_type = content_type
+        self.upload = upload
+        self.size = 0
+        self.offset = 0
+        self.pending: Optional[bytes] = None
+
 
 class Upload(LabelElement, DisableableElement, component='upload.js'):
 
@@ -21,6 +47,8 @@ class Upload(LabelElement, DisableableElement, component='upload.js'):
                  on_upload: Optional[Handler[UploadEventArguments]] = None,
                  on_multi_upload: Optional[Handler[MultiUploadEventArguments]] = None,
                  on_rejected: Optional[Handler[UiEventArguments]] = None,
+                 on_chunk: Optional[Handler[UploadChunkEventArguments]] = None,
+                 on_progress: Optional[Handler[UploadProgressEventArguments]] = None,
                  label: str = '',
                  auto_upload: bool = False,
                  ) -> None:
@@ -38,6 +66,13 @@ class Upload(LabelElement, DisableableElement, component='upload.js'):
 
         - ``on_rejected``: One or more files have been rejected.
 
+        The request body is parsed while it is being received.
+        ``on_chunk`` handlers are called (and awaited) for every chunk of a file as soon as it arrives,
+        which allows processing large files without keeping them in memory or on disk.
+        Files are only buffered for ``on_upload`` and ``on_multi_upload`` handlers.
+        The limits ``max_file_size``, ``max_total_size`` and ``max_files`` are also enforced on the server,
+        so that oversized uploads are aborted early and ``on_rejected`` is called.
+
         :param multiple: allow uploading multiple files at once (default: `False`)
         :param max_file_size: maximum file size in bytes (default: `0`)
         :param max_total_size: maximum total size of all files in bytes (default: `0`)
@@ -46,6 +81,8 @@ class Upload(LabelElement, DisableableElement, component='upload.js'):
         :param on_upload: callback to execute for each uploaded file
         :param on_multi_upload: callback to execute after multiple files have been uploaded
         :param on_rejected: callback to execute when one or more files have been rejected during file selection
+        :param on_chunk: async-capable callback to execute for each received chunk of a file (*added in version 2.15.0*)
+        :param on_progress: callback to execute periodically while receiving the upload (*added in version 2.15.0*)
         :param label: label for the uploader (default: `''`)
         :param auto_upload: automatically upload files when they are selected (default: `False`)
         """
@@ -69,13 +106,15 @@ class Upload(LabelElement, DisableableElement, component='upload.js'):
         self._begin_upload_handlers = [on_begin_upload] if on_begin_upload else []
         self._upload_handlers = [on_upload] if on_upload else []
         self._multi_upload_handlers = [on_multi_upload] if on_multi_upload else []
+        self._chunk_handlers = [on_chunk] if on_chunk else []
+        self._progress_handlers = [on_progress] if on_progress else []
+        self._rejected_handlers: List[Handler[UiEventArguments]] = []
 
         @app.post(self._props['url'])
         async def upload_route(request: Request) -> Dict[str, str]:
             for begin_upload_handler in self._begin_upload_handlers:
                 handle_event(begin_upload_handler, UiEventArguments(sender=self, client=self.client))
-            form = await request.form()
-            uploads = [cast(UploadFile, data) for data in form.values()]
+            uploads = await self._receive(request)
             self.handle_uploads(uploads)
             return {'upload': 'success'}
 
@@ -106,6 +145,122 @@ class Upload(LabelElement, DisableableElement, component='upload.js'):
         for multi_upload_handler in self._multi_upload_handlers:
             handle_event(multi_upload_handler, multi_upload_args)
 
+    async def _receive(self, request: Request) -> List[UploadFile]:
+        """Parse the multipart request body while it is being received."""
+        content_type, params = parse_options_header(request.headers.get('Content-Type'))
+        if content_type != b'multipart/form-data' or b'boundary' not in params:
+            raise HTTPException(status_code=400, detail='Expected multipart/form-data')
+        content_length = request.headers.get('Content-Length', '')
+        total_bytes = int(content_length) if content_length.isdigit() else None
+        spool = bool(self._upload_handlers or self._multi_upload_handlers)
+
+        messages: List[Tuple[str, bytes]] = []
+        headers: Dict[bytes, bytes] = {}
+        header_field = bytearray()
+        header_value = bytearray()
+
+        def on_header_end() -> None:
+            headers[bytes(header_field).lower()] = bytes(header_value)
+            header_field.clear()
+            header_value.clear()
+
+        parser = MultipartParser(params[b'boundary'], {
+            'on_part_begin': headers.clear,
+            'on_header_field': lambda data, start, end: header_field.extend(data[start:end]),
+            'on_header_value': lambda data, start, end: header_value.extend(data[start:end]),
+            'on_header_end': on_header_end,
+            'on_headers_finished': lambda: messages.append(('headers', b'')),
+            'on_part_data': lambda data, start, end: messages.append(('data', data[start:end])),
+            'on_part_end': lambda: messages.append(('end', b'')),
+        })
+
+        uploads: List[UploadFile] = []
+        part: Optional[_UploadPart] = None
+        bytes_received = 0
+        total_size = 0
+        num_files = 0
+        last_progress = 0.0
+        try:
+            async for data in request.stream():
+                bytes_received += len(data)
+                parser.write(data)
+                for kind, payload in messages:
+                    if kind == 'headers':
+                        _, disposition = parse_options_header(headers.get(b'content-disposition'))
+                        if b'filename' not in disposition:
+                            part = None  # NOTE: plain form fields are ignored
+                            continue
+                        num_files += 1
+                        if self._props.get('max-files') is not None and num_files > self._props['max-files']:
+                            self._reject()
+                        name = disposition[b'filename'].decode(errors='replace')
+                        part_type = headers.get(b'content-type', b'').decode(errors='replace')
+                        upload: Optional[UploadFile] = None
+                        if spool:
+                            file = SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE)  # pylint: disable=consider-using-with
+                            upload = UploadFile(file=cast(BinaryIO, file), size=0, filename=name,
+                                                headers=Headers({'content-type': part_type}))
+                        part = _UploadPart(name, part_type, upload)
+                        if upload is not None:
+                            uploads.append(upload)
+                    elif kind == 'data' and part is not None:
+                        part.size += len(payload)
+                        total_size += len(payload)
+                        max_file_size = self._props.get('max-file-size')
+                        max_total_size = self._props.get('max-total-size')
+                        if (max_file_size is not None and part.size > max_file_size) or \
+                                (max_total_size is not None and total_size > max_total_size):
+                            self._reject()
+                        if part.upload is not None:
+                            await part.upload.write(payload)
+                        if part.pending is not None:
+                            await self._emit_chunk(part, part.pending, final=False)
+                        part.pending = payload  # NOTE: hold back the latest chunk to be able to mark the final one
+                    elif kind == 'end' and part is not None:
+                        await self._emit_chunk(part, part.pending or b'', final=True)
+                        if part.upload is not None:
+                            await part.upload.seek(0)
+                        part = None
+                messages.clear()
+                if self._progress_handlers and time.time() > last_progress + PROGRESS_INTERVAL:
+                    last_progress = time.time()
+                    self._emit_progress(bytes_received, total_bytes)
+            parser.finalize()
+        except BaseException:
+            for upload in uploads:
+                await upload.close()
+            raise
+        if self._progress_handlers:
+            self._emit_progress(bytes_received, total_bytes)
+        return uploads
+
+    async def _emit_chunk(self, part: _UploadPart, chunk: bytes, *, final: bool) -> None:
+        for chunk_handler in self._chunk_handlers:
+            await wait_for_event(chunk_handler, UploadChunkEventArguments(
+                sender=self,
+                client=self.client,
+                chunk=chunk,
+                offset=part.offset,
+                final=final,
+                name=part.name,
+                type=part.content_type,
+            ))
+        part.offset += len(chunk)
+
+    def _emit_progress(self, bytes_received: int, total_bytes: Optional[int]) -> None:
+        for progress_handler in self._progress_handlers:
+            handle_event(progress_handler, UploadProgressEventArguments(
+                sender=self,
+                client=self.client,
+                bytes_received=bytes_received,
+                total_bytes=total_bytes,
+            ))
+
+    def _reject(self) -> None:
+        for rejected_handler in self._rejected_handlers:
+            handle_event(rejected_handler, UiEventArguments(sender=self, client=self.client))
+        raise HTTPException(status_code=413, detail='Upload exceeds the configured limits')
+
     def on_begin_upload(self, callback: Handler[UiEventArguments]) -> Self:
         """Add a callback to be invoked when the upload begins."""
         self._begin_upload_handlers.append(callback)
@@ -121,9 +276,26 @@ class Upload(LabelElement, DisableableElement, component='upload.js'):
         self._multi_upload_handlers.append(callback)
         return self
 
+    def on_chunk(self, callback: Handler[UploadChunkEventArguments]) -> Self:
+        """Add a callback to be invoked for each received chunk of a file.
+
+        *Added in version 2.15.0*
+        """
+        self._chunk_handlers.append(callback)
+        return self
+
+    def on_progress(self, callback: Handler[UploadProgressEventArguments]) -> Self:
+        """Add a callback to be invoked periodically while receiving an upload.
+
+        *Added in version 2.15.0*
+        """
+        self._progress_handlers.append(callback)
+        return self
+
     def on_rejected(self, callback: Handler[UiEventArguments]) -> Self:
-        """Add a callback to be invoked when one or more files have been rejected during file selection."""
+        """Add a callback to be invoked when one or more files have been rejected during file selection or upload."""
         self.on('rejected', lambda: handle_event(callback, UiEventArguments(sender=self, client=self.client)), args=[])
+        self._rejected_handlers.append(callback)
         return self
 
     def reset(self) -> None:
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+from . import core
+
+if TYPE_CHECKING:
+    from .client import Client
+    from .element import Element
+    from .event_listener import EventListener
+
+COALESCED_EVENT_TYPES = {'update:modelValue'}
+
+
+class EventLimiter:
+    """Limits the events of a client on the server side.
+
+    Each listener gets a token bucket which refills with twice the rate allowed by its ``throttle``
+    (because the browser sends both leading and trailing events)
+    or with the rate given by ``app.config.max_event_rate``, whichever is lower.
+    Events exceeding the rate are dropped, except for value updates, of which the latest one is delivered later.
+    """
+    BURST = 5
+    """Number of events a listener may send at once before being limited"""
+
+    total_dropped = 0
+    """Number of events dropped for all clients"""
+
+    total_coalesced = 0
+    """Number of value updates superseded by later ones for all clients"""
+
+    def __init__(self, client: Client) -> None:
+        self.client = client
+        self.dropped = 0
+        """Number of events dropped for this client"""
+        self.coalesced = 0
+        """Number of value updates superseded by later ones for this client"""
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # NOTE: listener ID -> (tokens, time of last update)
+        self._pending: Dict[str, Dict] = {}
+        self._handles: Dict[str, asyncio.TimerHandle] = {}
+
+    def admit(self, listener: EventListener, msg: Dict) -> bool:
+        """Decide whether an event message should be handled now.
+
+        Value updates exceeding the rate are stored and handled as soon as the rate allows.
+        """
+        rate = self._get_rate(listener)
+        if not rate:
+            return True
+        if listener.id in self._pending:  # NOTE: keep the order of value updates by queuing behind the pending one
+            self._pending[listener.id] = msg
+            self.coalesced += 1
+            EventLimiter.total_coalesced += 1
+            return False
+        delay = self._acquire(listener.id, rate)
+        if delay == 0:
+            return True
+        if listener.type in COALESCED_EVENT_TYPES and core.loop is not None:
+            self._pending[listener.id] = msg
+            self._handles[listener.id] = core.loop.call_later(delay, self._flush, listener.id)
+        else:
+            self.dropped += 1
+            EventLimiter.total_dropped += 1
+        return False
+
+    def forget(self, elements: List[Element]) -> None:
+        """Remove the state of all listeners of the given elements."""
+        for element in elements:
+            for listener_id in element._event_listeners:  # pylint: disable=protected-access
+                self._buckets.pop(listener_id, None)
+                self._pending.pop(listener_id, None)
+                handle = self._handles.pop(listener_id, None)
+                if handle is not None:
+                    handle.cancel()
+
+    def clear(self) -> None:
+        """Remove the state of all listeners."""
+        for handle in self._handles.values():
+            handle.cancel()
+        self._buckets.clear()
+        self._pending.clear()
+        self._handles.clear()
+
+    @staticmethod
+    def _get_rate(listener: EventListener) -> float:
+        rates = [2 / listener.throttle] if listener.throttle > 0 else []
+        if core.app.config.max_event_rate > 0:
+            rates.append(core.app.config.max_event_rate)
+        return min(rates, default=0.0)
+
+    def _acquire(self, listener_id: str, rate: float) -> float:
+        """Take a token and return 0 or return the time until the next token is available."""
+        now = time.monotonic()
+        tokens, updated = self._buckets.get(listener_id, (self.BURST, now))
+        tokens = min(self.BURST, tokens + (now - updated) * rate)
+        if tokens >= 1:
+            self._buckets[listener_id] = (tokens - 1, now)
+            return 0.0
+        self._buckets[listener_id] = (tokens, now)
+        return (1 - tokens) / rate
+
+    def _flush(self, listener_id: str) -> None:
+        self._handles.pop(listener_id, None)
+        msg = self._pending.pop(listener_id, None)
+        if msg is not None:
+            self.client.handle_event(msg)
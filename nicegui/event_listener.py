@@ -4,6 +4,7 @@ from typing import Any, Callable, Dict, Optional, Sequence
 
 from fastapi import Request
 
+from . import events
 from .dataclasses import KWONLY_SLOTS
 
 
@@ -19,9 +20,11 @@ class EventListener:
     leading_events: bool
     trailing_events: bool
     request: Optional[Request]
+    handler_expects_arguments: bool = field(init=False)
 
     def __post_init__(self) -> None:
         self.id = str(uuid.uuid4())
+        self.handler_expects_arguments = self.handler is not None and events.expects_arguments(self.handler)
 
     def to_dict(self) -> Dict[str, Any]:
         """Return a dictionary representation of the event listener."""
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 from contextlib import nullcontext
 from dataclasses import dataclass
-from inspect import Parameter, signature
+from inspect import Parameter
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -14,12 +14,13 @@ from typing import (
     List,
     Literal,
     Optional,
+    Tuple,
     TypeVar,
     Union,
     cast,
 )
 
-from . import background_tasks, core
+from . import background_tasks, core, helpers, metrics
 from .awaitable_response import AwaitableResponse
 from .dataclasses import KWONLY_SLOTS
 from .slot import Slot
@@ -39,6 +40,9 @@ class EventArguments:
 @dataclass(**KWONLY_SLOTS)
 class ObservableChangeEventArguments(EventArguments):
     sender: ObservableCollection
+    path: Tuple[Any, ...] = ()
+    operation: Literal['set', 'delete', 'insert', 'replace'] = 'replace'
+    keys: Tuple[Any, ...] = ()
 
 
 @dataclass(**KWONLY_SLOTS)
@@ -137,6 +141,21 @@ class UploadEventArguments(UiEventArguments):
     type: str
 
 
+@dataclass(**KWONLY_SLOTS)
+class UploadChunkEventArguments(UiEventArguments):
+    chunk: bytes
+    offset: int
+    final: bool
+    name: str
+    type: str
+
+
+@dataclass(**KWONLY_SLOTS)
+class UploadProgressEventArguments(UiEventArguments):
+    bytes_received: int
+    total_bytes: Optional[int]
+
+
 @dataclass(**KWONLY_SLOTS)
 class MultiUploadEventArguments(UiEventArguments):
     contents: List[BinaryIO]
@@ -406,7 +425,16 @@ EventT = TypeVar('EventT', bound=EventArguments)
 Handler = Union[Callable[[EventT], Any], Callable[[], Any]]
 
 
-def handle_event(handler: Optional[Handler[EventT]], arguments: EventT) -> None:
+def expects_arguments(handler: Callable) -> bool:
+    """Check whether the given handler expects event arguments."""
+    return any(p.default is Parameter.empty and
+               p.kind is not Parameter.VAR_POSITIONAL and
+               p.kind is not Parameter.VAR_KEYWORD
+               for p in helpers.get_signature(handler).parameters.values())
+
+
+def handle_event(handler: Optional[Handler[EventT]], arguments: EventT, *,
+                 handler_expects_arguments: Optional[bool] = None) -> None:
     """Call the given event handler.
 
     The handler is called within the context of the parent slot of the sender.
@@ -416,37 +444,76 @@ def handle_event(handler: Optional[Handler[EventT]], arguments: EventT) -> None:
 
     :param handler: the event handler
     :param arguments: the event arguments
+    :param handler_expects_arguments: whether the handler expects arguments (default: inspect the handler's signature)
     """
     if handler is None:
         return
     try:
-        expects_arguments = any(p.default is Parameter.empty and
-                                p.kind is not Parameter.VAR_POSITIONAL and
-                                p.kind is not Parameter.VAR_KEYWORD
-                                for p in signature(handler).parameters.values())
-
         parent_slot: Union[Slot, nullcontext]
+        element: Optional[str] = None
+        route: Optional[str] = None
         if isinstance(arguments, UiEventArguments):
             parent_slot = arguments.sender.parent_slot or arguments.sender.client.layout.default_slot
+            element = type(arguments.sender).__name__
+            route = arguments.sender.client.page.path
         else:
             parent_slot = nullcontext()
+        monitor = core.app.loop_monitor
+        name = monitor.get_name(handler)
 
-        with parent_slot:
-            if expects_arguments:
+        with parent_slot, monitor.measure('event', name, element=element, route=route):
+            if handler_expects_arguments is None:
+                handler_expects_arguments = expects_arguments(handler)
+            if handler_expects_arguments:
                 result = cast(Callable[[EventT], Any], handler)(arguments)
             else:
                 result = cast(Callable[[], Any], handler)()
         if isinstance(result, Awaitable) and not isinstance(result, AwaitableResponse):
             # NOTE: await an awaitable result even if the handler is not a coroutine (like a lambda statement)
+            finish_event = metrics.defer_event()
+
             async def wait_for_result():
                 with parent_slot:
                     try:
-                        await result
+                        await monitor.measure_steps(result, 'event', name, element=element, route=route)
                     except Exception as e:
                         core.app.handle_exception(e)
+                    finally:
+                        finish_event()
             if core.loop and core.loop.is_running():
-                background_tasks.create(wait_for_result(), name=str(handler))
+                client_id = arguments.sender.client.id if isinstance(arguments, UiEventArguments) else None
+                background_tasks.create(wait_for_result(), name=str(handler),
+                                        group='event handlers', client_id=client_id)
             else:
                 core.app.on_startup(wait_for_result())
     except Exception as e:
         core.app.handle_exception(e)
+
+
+async def wait_for_event(handler: Optional[Handler[EventT]], arguments: EventT) -> None:
+    """Call the given event handler and wait until it has finished.
+
+    In contrast to `handle_event`, an async handler is awaited instead of being scheduled as a background task.
+    This is useful for events which need to be processed in order, like chunks of a streamed upload.
+    Exceptions are caught and handled globally.
+
+    :param handler: the event handler
+    :param arguments: the event arguments
+    """
+    if handler is None:
+        return
+    parent_slot: Union[Slot, nullcontext]
+    if isinstance(arguments, UiEventArguments):
+        parent_slot = arguments.sender.parent_slot or arguments.sender.client.layout.default_slot
+    else:
+        parent_slot = nullcontext()
+    with parent_slot:
+        try:
+            if expects_arguments(handler):
+                result = cast(Callable[[EventT], Any], handler)(arguments)
+            else:
+                result = cast(Callable[[], Any], handler)()
+            if isinstance(result, Awaitable) and not isinstance(result, AwaitableResponse):
+                await result
+        except Exception as e:
+            core.app.handle_exception(e)
@@ -0,0 +1,141 @@
+import asyncio
+import io
+import uuid
+import weakref
+from typing import AsyncGenerator, ClassVar, Optional, Union, cast
+
+from . import background_tasks, core, optional_features, run
+
+try:
+    from PIL.Image import Image as PIL_Image
+    optional_features.register('pillow')
+except ImportError:
+    pass
+
+BOUNDARY = 'nicegui-frame'
+
+
+class FrameStream:
+    instances: ClassVar['weakref.WeakValueDictionary[str, FrameStream]'] = weakref.WeakValueDictionary()
+
+    def __init__(self, *, image_format: str = 'JPEG', quality: int = 85) -> None:
+        """Frame Stream
+
+        A stream of image frames which can be used as source for `ui.image` and `ui.interactive_image`.
+
+        The frames are served as a single long-lived MJPEG-style response ("multipart/x-mixed-replace"),
+        which is rendered natively by the browser.
+        In contrast to updating the image source with base64 data URLs or timestamped URLs,
+        frames are neither embedded in JSON messages nor re-requested over HTTP.
+        Each frame is encoded only once, no matter how many clients are watching.
+        If a client cannot keep up, stale frames are dropped and it always receives the latest frame.
+
+        *Added in version 2.15.0*
+
+        :param image_format: format to encode PIL images with (default: "JPEG")
+        :param quality: encoding quality for lossy formats (default: 85)
+        """
+        self.id = str(uuid.uuid4())  # NOTE: random IDs prevent other visitors from guessing the stream URL
+        FrameStream.instances[self.id] = self
+        self.image_format = image_format
+        self.quality = quality
+        self.frame: Optional[bytes] = None
+        self.frame_count = 0
+        self.dropped_frames = 0
+        self.viewers = 0
+        self._closed = False
+        self._new_frame: Optional[asyncio.Event] = None
+
+    @property
+    def url(self) -> str:
+        """URL of the stream."""
+        return f'/_nicegui/frame_streams/{self.id}'
+
+    @property
+    def media_type(self) -> str:
+        """Media type of the frames."""
+        return f'image/{self.image_format.lower()}'
+
+    def push(self, frame: Union[bytes, 'PIL_Image']) -> None:
+        """Push a new frame to all viewers.
+
+        This method can be called from producer threads; the frame is handed over to the event loop.
+        PIL images are encoded in a separate thread while the event loop is running.
+        If new images are pushed faster than they can be encoded, intermediate images are skipped.
+
+        :param frame: an encoded image (matching the stream's image format) or a PIL image which is encoded once
+        """
+        loop = core.loop
+        if loop is not None and loop.is_running() and not _is_running_in(loop):
+            loop.call_soon_threadsafe(self.push, frame)
+            return
+        if optional_features.has('pillow') and isinstance(frame, PIL_Image):
+            if loop is not None and loop.is_running():
+                background_tasks.create_lazy(self._push_image(frame), name=f'encode frame {self.id}')
+                return
+            self._set_frame(encode(frame, self.image_format, self.quality))
+            return
+        self._set_frame(cast(bytes, frame))
+
+    async def _push_image(self, image: 'PIL_Image') -> None:
+        frame = await run.io_bound(encode, image, self.image_format, self.quality)
+        if frame is not None and not self._closed:
+            self._set_frame(frame)
+
+    def _set_frame(self, frame: bytes) -> None:
+        self.frame = frame
+        self.frame_count += 1
+        self._notify()
+
+    def close(self) -> None:
+        """Close the stream and end all responses."""
+        self._closed = True
+        self._notify()
+        FrameStream.instances.pop(self.id, None)
+
+    def _notify(self) -> None:
+        if self._new_frame is not None:
+            self._new_frame.set()
+            self._new_frame = None
+
+    async def iterate(self) -> AsyncGenerator[bytes, None]:
+        """Iterate over the multipart chunks of the stream, skipping frames which are superseded before being sent."""
+        self.viewers += 1
+        try:
+            sent_count = 0
+            while not self._closed:
+                if self.frame is None or self.frame_count == sent_count:
+                    if self._new_frame is None:
+                        self._new_frame = asyncio.Event()
+                    await self._new_frame.wait()
+                    continue
+                if sent_count:
+                    self.dropped_frames += self.frame_count - sent_count - 1
+                sent_count = self.frame_count
+                frame = self.frame
+                yield (f'--{BOUNDARY}\r\nContent-Type: {self.media_type}\r\nContent-Length: {len(frame)}\r\n\r\n'.encode()
+                       + frame + b'\r\n')
+        finally:
+            self.viewers -= 1
+
+
+def _is_running_in(loop: asyncio.AbstractEventLoop) -> bool:
+    try:
+        return asyncio.get_running_loop() is loop
+    except RuntimeError:
+        return False  # NOTE: no event loop is running in the current thread
+
+
+def encode(image: 'PIL_Image', image_format: str, quality: int) -> bytes:
+    """Encode a PIL image.
+
+    :param image: the PIL image
+    :param image_format: the image format
+    :param quality: the encoding quality for lossy formats
+    :return: the encoded image
+    """
+    buffer = io.BytesIO()
+    if image_format.upper() in {'JPEG', 'JPG'} and image.mode not in {'RGB', 'L'}:
+        image = image.convert('RGB')
+    image.save(buffer, image_format, quality=quality)
+    return buffer.getvalue()
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+from collections import deque
 from dataclasses import dataclass, field
-from typing import Any, Awaitable, Callable, ClassVar, Dict, Generic, List, Optional, Tuple, TypeVar, cast
+from typing import Any, Awaitable, Callable, ClassVar, Deque, Dict, Generic, List, Optional, Tuple, TypeVar, cast
 
 from typing_extensions import Concatenate, ParamSpec, Self
 
-from .. import background_tasks, core
+from .. import background_tasks, binding, core
+from .. import json as nicegui_json
 from ..client import Client
+from ..context import context
 from ..dataclasses import KWONLY_SLOTS
 from ..element import Element
 from ..helpers import is_coroutine_function
@@ -52,12 +55,20 @@ class RefreshableTarget:
 
 
 class RefreshableContainer(Element, component='refreshable.js'):
-    pass
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._target: Optional[RefreshableTarget] = None
+
+    def _handle_delete(self) -> None:
+        if self._target is not None:
+            self._target.refreshable._remove_target(self._target)  # pylint: disable=protected-access
+        super()._handle_delete()
 
 
 class refreshable(Generic[_P, _T]):
 
-    def __init__(self, func: Callable[_P, _T]) -> None:
+    def __init__(self, func: Callable[_P, _T], *, reconcile: bool = False) -> None:
         """Refreshable UI functions
 
         The ``@ui.refreshable`` decorator allows you to create functions that have a ``refresh`` method.
@@ -65,10 +76,22 @@ class refreshable(Generic[_P, _T]):
 
         For decorating refreshable methods in classes, there is a ``@ui.refreshable_method`` decorator,
         which is equivalent but prevents static type checking errors.
+
+        With ``reconcile=True`` (e.g. via ``@functools.partial(ui.refreshable, reconcile=True)``),
+        a refresh of a synchronous function reuses the elements of the previous run (*added in version 2.15.0*):
+        New elements are matched with old ones by their type, tag and markers in order of appearance,
+        take over their IDs and are only sent to the client if something about them has changed.
+        Use distinct markers (e.g. ``.mark(f'row-{item.id}')``) to keep matching rows when items are inserted or reordered.
+        Elements with JavaScript dependencies (like charts, maps or 3D scenes) are always recreated.
+
+        :param func: function creating the UI elements
+        :param reconcile: whether to reuse unchanged elements when refreshing (default: ``False``)
         """
         self.func = func
+        self.reconcile = reconcile
         self.instance = None
-        self.targets: List[RefreshableTarget] = []
+        self._targets: Dict[str, Dict[int, RefreshableTarget]] = {}
+        """Maps client IDs to the targets of each client, which are removed when their container is deleted"""
 
     def __get__(self, instance, _) -> Self:
         self.instance = instance
@@ -76,31 +99,59 @@ class refreshable(Generic[_P, _T]):
 
     def __getattribute__(self, __name: str) -> Any:
         attribute = object.__getattribute__(self, __name)
-        if __name == 'refresh':
+        if __name in {'refresh', 'refresh_current_client'}:
             def refresh(*args: Any, _instance=self.instance, **kwargs: Any) -> None:
                 self.instance = _instance
                 attribute(*args, **kwargs)
             return refresh
         return attribute
 
+    @property
+    def targets(self) -> List[RefreshableTarget]:
+        """All targets of this refreshable."""
+        return [target for targets in self._targets.values() for target in targets.values()]
+
     def __call__(self, *args: _P.args, **kwargs: _P.kwargs) -> _T:
-        self.prune()
         target = RefreshableTarget(container=RefreshableContainer(), refreshable=self, instance=self.instance,
                                    args=args, kwargs=kwargs)
-        self.targets.append(target)
+        target.container._target = target  # pylint: disable=protected-access
+        self._targets.setdefault(target.container.client.id, {})[id(target)] = target
         return target.run(self.func)
 
+    def _remove_target(self, target: RefreshableTarget) -> None:
+        targets = self._targets.get(target.container.client.id)
+        if targets is not None:
+            targets.pop(id(target), None)
+            if not targets:
+                del self._targets[target.container.client.id]
+
     def refresh(self, *args: Any, **kwargs: Any) -> None:
         """Refresh the UI elements created by this function.
 
         This method accepts the same arguments as the function itself or a subset of them.
         It will combine the arguments passed to the function with the arguments passed to this method.
         """
-        self.prune()
-        for target in self.targets:
-            if target.instance != self.instance:
+        self._refresh(self.targets, args, kwargs)
+
+    def refresh_current_client(self, *args: Any, **kwargs: Any) -> None:
+        """Refresh the UI elements created by this function for the current client only.
+
+        This method accepts the same arguments as ``refresh``.
+        Only the targets of the current client are visited, no matter how many other clients use this function.
+
+        *Added in version 2.15.0*
+        """
+        self._refresh(list(self._targets.get(context.client.id, {}).values()), args, kwargs)
+
+    def _refresh(self, targets: List[RefreshableTarget], args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> None:
+        reconcile = self.reconcile and not is_coroutine_function(self.func)
+        for target in targets:
+            if target.instance != self.instance or target.container.is_deleted:
                 continue
-            target.container.clear()
+            if reconcile:
+                reconciliation = _Reconciliation(target.container)
+            else:
+                target.container.clear()
             target.args = args or target.args
             target.kwargs.update(kwargs)
             try:
@@ -112,34 +163,128 @@ class refreshable(Generic[_P, _T]):
                     raise TypeError(f'{parameter} needs to be consistently passed to {function} '
                                     'either as positional or as keyword argument') from e
                 raise
+            finally:
+                if reconcile:
+                    reconciliation.apply()
             if is_coroutine_function(self.func):
                 assert isinstance(result, Awaitable)
                 if core.loop and core.loop.is_running():
-                    background_tasks.create(result)
+                    background_tasks.create(result, name=str(self.func), group='refreshables',
+                                            client_id=target.container.client.id)
                 else:
                     core.app.on_startup(result)
 
     def prune(self) -> None:
-        """Remove all targets that are no longer on a page with a client connection.
+        """Remove all targets of clients which do not exist anymore.
 
-        This method is called automatically before each refresh.
+        Targets are removed automatically when their container is deleted, so calling this method is usually not necessary.
         """
-        self.targets = [
-            target
-            for target in self.targets
-            if target.container.client.id in Client.instances and target.container.id in target.container.client.elements
-        ]
+        for client_id in [client_id for client_id in self._targets if client_id not in Client.instances]:
+            del self._targets[client_id]
 
 
 class refreshable_method(Generic[_S, _P, _T], refreshable[_P, _T]):
 
-    def __init__(self, func: Callable[Concatenate[_S, _P], _T]) -> None:
+    def __init__(self, func: Callable[Concatenate[_S, _P], _T], *, reconcile: bool = False) -> None:
         """Refreshable UI methods
 
         The `@ui.refreshable_method` decorator allows you to create methods that have a `refresh` method.
         This method will automatically delete all elements created by the function and recreate them.
+
+        :param func: method creating the UI elements
+        :param reconcile: whether to reuse unchanged elements when refreshing (default: ``False``, *added in version 2.15.0*)
         """
-        super().__init__(func)  # type: ignore
+        super().__init__(func, reconcile=reconcile)  # type: ignore
+
+
+class _Reconciliation:
+    """Matches the elements of a rebuilt container with the previous ones and only sends what has changed."""
+
+    def __init__(self, container: Element) -> None:
+        self.container = container
+        self.was_pending = container.id in container.client.outbox.updates
+        self.container_dict = _serialize(container)
+        self.old_children = container.default_slot.children
+        container.default_slot.children = []
+
+    def apply(self) -> None:
+        """Reuse the IDs of matching old elements, remove the others and enqueue updates for changed elements."""
+        client = self.container.client
+        pairs: List[Tuple[Element, Element]] = []
+        _match(self.old_children, self.container.default_slot.children, pairs)
+        reused = {id(old) for old, _ in pairs}
+        old_elements = [element for child in self.old_children for element in child.descendants(include_self=True)]
+        client.remove_elements(element for element in old_elements if id(element) not in reused)
+
+        changes = [(old, new, old.id in client.outbox.updates, _serialize(old)) for old, new in pairs]
+        retired = [old for old, _ in pairs]
+        binding.remove(retired)
+        for old in retired:
+            old._handle_delete()  # pylint: disable=protected-access
+            old._deleted = True  # pylint: disable=protected-access
+            client.element_index.remove(old)
+        for old, new, _, _ in changes:
+            _adopt_id(old, new)
+        client.event_limiter.forget(retired)
+        for _, new, is_pending, old_dict in changes:
+            if is_pending or _serialize(new) != old_dict:
+                client.outbox.enqueue_update(new)
+
+        if not self.was_pending and _serialize(self.container) == self.container_dict:
+            client.outbox.updates.pop(self.container.id, None)
+        else:
+            client.outbox.enqueue_update(self.container)
+
+
+def _serialize(element: Element) -> Optional[str]:
+    try:
+        return nicegui_json.dumps(element._to_dict())  # pylint: disable=protected-access
+    except Exception:
+        return None  # NOTE: elements which cannot be compared are considered changed
+
+
+def _get_key(element: Element) -> Tuple[Any, ...]:
+    return type(element), element.tag, tuple(element._markers)  # pylint: disable=protected-access
+
+
+def _match(old_children: List[Element], new_children: List[Element], pairs: List[Tuple[Element, Element]]) -> None:
+    candidates: Dict[Tuple[Any, ...], Deque[Element]] = {}
+    for element in old_children:
+        candidates.setdefault(_get_key(element), deque()).append(element)
+    for element in new_children:
+        if element.libraries or element.extra_libraries or element.exposed_libraries:
+            continue  # NOTE: the client-side state of such elements is usually initialized only once
+        matches = candidates.get(_get_key(element))
+        if not matches:
+            continue
+        old_element = matches.popleft()
+        pairs.append((old_element, element))
+        for name, slot in element.slots.items():
+            if name in old_element.slots:
+                _match(old_element.slots[name].children, slot.children, pairs)
+
+
+def _adopt_id(old: Element, new: Element) -> None:
+    client = new.client
+    client.elements.pop(new.id, None)
+    client.outbox.updates.pop(new.id, None)
+    new.id = old.id
+    client.elements[new.id] = new
+
+    old_listeners = list(old._event_listeners.values())  # pylint: disable=protected-access
+    listeners = {}
+    for listener in new._event_listeners.values():  # pylint: disable=protected-access
+        listener.element_id = new.id
+        signature = {**listener.to_dict(), 'listener_id': None}
+        for old_listener in old_listeners:
+            if {**old_listener.to_dict(), 'listener_id': None} == signature:
+                listener.id = old_listener.id
+                old_listeners.remove(old_listener)
+                break
+        listeners[listener.id] = listener
+    new._event_listeners = listeners  # pylint: disable=protected-access
+    # NOTE: the old element keeps only the listeners which have not been adopted, so that their state can be forgotten
+    old._event_listeners = {listener.id: listener for listener in old_listeners}  # pylint: disable=protected-access
 
 
 def state(value: Any) -> Tuple[Any, Callable[[Any], None]]:
@@ -160,7 +305,8 @@ def state(value: Any) -> Tuple[Any, Callable[[Any], None]]:
         if target.locals[index] == new_value:
             return
         target.locals[index] = new_value
-        target.refreshable.refresh()
+        target.refreshable.instance = target.instance
+        target.refreshable._refresh([target], (), {})  # pylint: disable=protected-access
 
     target.next_index += 1
 
@@ -1,17 +1,21 @@
 import asyncio
 import functools
 import hashlib
+import inspect
 import os
 import socket
 import threading
 import time
+import weakref
 import webbrowser
 from pathlib import Path
-from typing import Any, Optional, Set, Tuple, Union
+from typing import Any, Callable, Optional, Set, Tuple, Union
 
 from .logging import log
 
 _shown_warnings: Set[str] = set()
+_signatures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_method_signatures: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
 
 
 def warn_once(message: str, *, stack_info: bool = False) -> None:
@@ -37,6 +41,25 @@ def is_coroutine_function(obj: Any) -> bool:
     return asyncio.iscoroutinefunction(obj)
 
 
+def get_signature(func: Callable) -> inspect.Signature:
+    """Return the signature of a callable.
+
+    Signatures are cached for all weakly referenceable callables.
+    Bound methods are cached by their underlying function, because they are created anew on every attribute access.
+    """
+    cache, key = (_method_signatures, func.__func__) if inspect.ismethod(func) else (_signatures, func)
+    try:
+        return cache[key]
+    except (KeyError, TypeError):  # NOTE: TypeError is raised for keys that are not hashable or weakly referenceable
+        pass
+    signature = inspect.signature(func)
+    try:
+        cache[key] = signature
+    except TypeError:
+        pass
+    return signature
+
+
 def is_file(path: Optional[Union[str, Path]]) -> bool:
     """Check if the path is a file that exists."""
     if not path:
@@ -0,0 +1,164 @@
+from __future__ import annotations
+
+import asyncio
+import heapq
+import itertools
+import time
+import types
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, ContextManager, Deque, Dict, Generator, Iterator, List, Optional, Tuple
+
+from . import background_tasks
+from .dataclasses import KWONLY_SLOTS
+from .logging import log
+
+
+@dataclass(**KWONLY_SLOTS)
+class SlowCallback:
+    kind: str
+    name: str
+    element: Optional[str]
+    route: Optional[str]
+    duration: float
+    timestamp: float
+
+
+class LoopMonitor:
+
+    def __init__(self) -> None:
+        """Loop Monitor
+
+        Samples how late the event loop wakes up a sleeping task ("loop lag")
+        and times event handlers, timer callbacks, binding refreshes and page builds.
+        Callbacks blocking the loop longer than ``slow_callback_threshold`` are logged and the slowest ones are kept.
+        For async callbacks the longest step between two ``await`` statements is measured.
+
+        The monitor is started by ``ui.run(loop_monitor=True)`` and can also be started and stopped at runtime.
+        """
+        self.sample_interval = 0.1
+        """time between two lag samples in seconds"""
+        self.slow_callback_threshold = 0.05
+        """minimum duration in seconds for a callback to be logged and recorded"""
+        self.max_slow_callbacks = 20
+        """number of slowest callbacks to keep"""
+        self.is_running = False
+        self._task: Optional[asyncio.Task] = None
+        self._lags: Deque[float] = deque(maxlen=600)
+        self._max_lag = 0.0
+        self._slow_callbacks: List[Tuple[float, int, SlowCallback]] = []  # NOTE: min-heap of the slowest callbacks
+        self._sequence = itertools.count()
+        self._has_recorded_inner = False
+
+    @staticmethod
+    def get_name(callback: Any) -> str:
+        """Return a readable name of a callback."""
+        return getattr(callback, '__qualname__', None) or str(callback)
+
+    def start(self) -> None:
+        """Start sampling the loop lag and timing callbacks."""
+        self.is_running = True
+        if self._task is None or self._task.done():
+            self._task = background_tasks.create(self._sample(), name='loop monitor')
+
+    def stop(self) -> None:
+        """Stop sampling the loop lag and timing callbacks."""
+        self.is_running = False
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+
+    def reset(self) -> None:
+        """Forget all lag samples and recorded callbacks."""
+        self._lags.clear()
+        self._max_lag = 0.0
+        self._slow_callbacks.clear()
+
+    @property
+    def lag(self) -> float:
+        """Most recent loop lag in seconds."""
+        return self._lags[-1] if self._lags else 0.0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return the loop lag statistics and the slowest callbacks, slowest first."""
+        lags = sorted(self._lags)
+        return {
+            'lag': self.lag,
+            'mean_lag': sum(lags) / len(lags) if lags else 0.0,
+            'p99_lag': lags[int(0.99 * (len(lags) - 1))] if lags else 0.0,
+            'max_lag': self._max_lag,
+            'samples': len(lags),
+            'slow_callbacks': [asdict(callback) for _, _, callback in sorted(self._slow_callbacks, reverse=True)],
+        }
+
+    def measure(self, kind: str, name: str, *,
+                element: Optional[str] = None, route: Optional[str] = None) -> ContextManager:
+        """Time the enclosed code and record it if it is slow."""
+        return self._measure(kind, name, element, route) if self.is_running else nullcontext()
+
+    @contextmanager
+    def _measure(self, kind: str, name: str, element: Optional[str], route: Optional[str]) -> Iterator[None]:
+        has_recorded_outer = self._has_recorded_inner
+        self._has_recorded_inner = False
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            # NOTE: nested measurements (like a handler called by a wrapping lambda) are attributed to the innermost one
+            duration = time.perf_counter() - start
+            has_recorded = self._has_recorded_inner or self._record(kind, name, element, route, duration)
+            self._has_recorded_inner = has_recorded_outer or has_recorded
+
+    def measure_steps(self, awaitable: Awaitable, kind: str, name: str, *,
+                      element: Optional[str] = None, route: Optional[str] = None) -> Awaitable:
+        """Wrap an awaitable to record its longest step between two suspensions if it is slow."""
+        if not self.is_running:
+            return awaitable
+        return self._run_steps(awaitable, kind, name, element, route)
+
+    @types.coroutine
+    def _run_steps(self, awaitable: Awaitable, kind: str, name: str,
+                   element: Optional[str], route: Optional[str]) -> Generator[Any, Any, Any]:
+        iterator = awaitable.__await__()
+        longest = 0.0
+        value: Any = None
+        error: Optional[BaseException] = None
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    yielded = iterator.send(value) if error is None else iterator.throw(error)
+                except StopIteration as e:
+                    return e.value
+                finally:
+                    longest = max(longest, time.perf_counter() - start)
+                try:
+                    value, error = (yield yielded), None
+                except BaseException as e:  # pylint: disable=broad-exception-caught
+                    value, error = None, e
+        finally:
+            self._record(kind, name, element, route, longest)
+
+    def _record(self, kind: str, name: str, element: Optional[str], route: Optional[str], duration: float) -> bool:
+        if duration < self.slow_callback_threshold:
+            return False
+        where = ', '.join(f'{key} {value}' for key, value in [('element', element), ('route', route)] if value)
+        log.warning(f'{kind} "{name}" blocked the event loop for {duration:.3f} s' + (f' ({where})' if where else ''))
+        callback = SlowCallback(kind=kind, name=name, element=element, route=route,
+                                duration=duration, timestamp=time.time())
+        entry = (duration, next(self._sequence), callback)
+        if len(self._slow_callbacks) < self.max_slow_callbacks:
+            heapq.heappush(self._slow_callbacks, entry)
+        else:
+            heapq.heappushpop(self._slow_callbacks, entry)
+        return True
+
+    async def _sample(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(self.sample_interval)
+            lag = max(loop.time() - start - self.sample_interval, 0.0)
+            self._lags.append(lag)
+            self._max_lag = max(self._max_lag, lag)
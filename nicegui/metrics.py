@@ -0,0 +1,236 @@
+"""Runtime metrics in the Prometheus text exposition format.
+
+The metrics are served at ``/metrics`` if ``ui.run(metrics=True)`` is set.
+They do not require the ``prometheus_client`` package.
+"""
+from __future__ import annotations
+
+import bisect
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, List, Optional, Sequence, Tuple
+
+from fastapi import Request
+from fastapi.responses import PlainTextResponse
+
+from . import background_tasks, core
+
+CONTENT_TYPE = 'text/plain; version=0.0.4; charset=utf-8'
+LATENCY_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5)
+
+
+class Counter:
+
+    def __init__(self, name: str, documentation: str) -> None:
+        """Counter
+
+        A value that only increases, like the number of bytes sent.
+
+        :param name: metric name (should end with "_total")
+        :param documentation: help text
+        """
+        self.name = name
+        self.documentation = documentation
+        self.value = 0.0
+        _instruments.append(self)
+
+    def inc(self, amount: float = 1) -> None:
+        """Increase the counter by the given amount."""
+        self.value += amount
+
+    def render(self) -> List[str]:
+        """Return the lines of the exposition format."""
+        return [*_header(self.name, self.documentation, 'counter'), f'{self.name} {_format(self.value)}']
+
+
+class Histogram:
+
+    def __init__(self, name: str, documentation: str, buckets: Sequence[float] = LATENCY_BUCKETS) -> None:
+        """Histogram
+
+        Counts observations, like durations, in cumulative buckets.
+
+        :param name: metric name
+        :param documentation: help text
+        :param buckets: upper bounds of the buckets (default: latencies from 0.5 ms to 2.5 s)
+        """
+        self.name = name
+        self.documentation = documentation
+        self.buckets = sorted(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)  # NOTE: the last bucket counts observations above all bounds
+        self.sum = 0.0
+        _instruments.append(self)
+
+    def observe(self, value: float) -> None:
+        """Record an observation."""
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the enclosed code in seconds."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(time.perf_counter() - start)
+
+    def render(self) -> List[str]:
+        """Return the lines of the exposition format."""
+        lines = _header(self.name, self.documentation, 'histogram')
+        total = 0
+        for bound, count in zip([*self.buckets, float('inf')], self.counts):
+            total += count
+            lines.append(f'{self.name}_bucket{{le="{_format(bound)}"}} {total}')
+        lines.append(f'{self.name}_sum {_format(self.sum)}')
+        lines.append(f'{self.name}_count {total}')
+        return lines
+
+
+class CountingJson:
+    """Wraps a JSON module to count the bytes of all encoded Socket.IO packets."""
+
+    def __init__(self, json: Any) -> None:
+        self._json = json
+
+    def dumps(self, *args: Any, **kwargs: Any) -> str:
+        """Encode a packet and count its size."""
+        result = self._json.dumps(*args, **kwargs)
+        emitted_bytes.inc(len(result) if result.isascii() else len(result.encode()))
+        return result
+
+    def loads(self, *args: Any, **kwargs: Any) -> Any:
+        """Decode a packet."""
+        return self._json.loads(*args, **kwargs)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._json, name)
+
+
+class EventTimer:
+    """Observes the duration of an incoming event once its handler and all async handlers it started have finished."""
+
+    def __init__(self) -> None:
+        self.start = time.perf_counter()
+        self.pending = 1
+        self.is_finished = False
+
+    def defer(self) -> Callable[[], None]:
+        """Keep the event open until the returned callback is called."""
+        if self.is_finished:
+            return lambda: None
+        self.pending += 1
+        return self.finish
+
+    def finish(self) -> None:
+        """Close one pending part of the event and observe its duration after the last one."""
+        self.pending -= 1
+        if self.pending == 0 and not self.is_finished:
+            self.is_finished = True
+            event_duration.observe(time.perf_counter() - self.start)
+
+
+_instruments: List[Any] = []
+_event_timer: contextvars.ContextVar[Optional[EventTimer]] = contextvars.ContextVar('event_timer', default=None)
+
+emitted_bytes = Counter('nicegui_socket_emitted_bytes_total', 'Size of all JSON payloads emitted via Socket.IO')
+event_duration = Histogram('nicegui_event_handling_seconds',
+                           'Time to handle an incoming event, including the async handlers it awaits')
+binding_refresh_duration = Histogram('nicegui_binding_refresh_seconds',
+                                     'Duration of refreshing the active binding links')
+storage_write_duration = Histogram('nicegui_storage_write_seconds', 'Duration of writing persistent storage')
+
+
+@contextmanager
+def time_event() -> Iterator[None]:
+    """Observe the duration of handling an incoming event, including the async handlers started within."""
+    timer = EventTimer()
+    token = _event_timer.set(timer)
+    try:
+        yield
+    finally:
+        _event_timer.reset(token)
+        timer.finish()
+
+
+def defer_event() -> Callable[[], None]:
+    """Keep the current event open until the returned callback is called, e.g. when an async handler has finished."""
+    timer = _event_timer.get()
+    return timer.defer() if timer is not None else lambda: None
+
+
+def render() -> str:
+    """Collect all metrics and return them in the Prometheus text exposition format."""
+    from . import binding  # pylint: disable=import-outside-toplevel,cyclic-import
+    from .client import Client  # pylint: disable=import-outside-toplevel
+    from .event_limiter import EventLimiter  # pylint: disable=import-outside-toplevel
+    from .timer import scheduler  # pylint: disable=import-outside-toplevel
+
+    clients = list(Client.instances.values())
+    element_counts = [len(client.elements) for client in clients]
+    gauges: List[Tuple[str, str, List[Tuple[str, float]]]] = [
+        ('nicegui_clients', 'Number of clients', [('', len(clients))]),
+        ('nicegui_connected_clients', 'Number of clients with a socket connection',
+         [('', sum(client.has_socket_connection for client in clients))]),
+        ('nicegui_elements', 'Number of elements of all clients', [('', sum(element_counts))]),
+        ('nicegui_client_elements_max', 'Largest number of elements of a single client',
+         [('', max(element_counts, default=0))]),
+        ('nicegui_outbox_pending_updates', 'Number of element updates waiting to be sent',
+         [('', sum(len(client.outbox.updates) for client in clients))]),
+        ('nicegui_outbox_pending_messages', 'Number of messages waiting to be sent',
+         [('', sum(len(client.outbox.messages) for client in clients))]),
+        ('nicegui_outbox_history_messages', 'Number of sent messages kept for reconnecting clients',
+         [('', sum(len(client.outbox.message_history) for client in clients))]),
+        ('nicegui_binding_active_links', 'Number of bindings refreshed periodically',
+         [('', len(binding.active_links))]),
+        ('nicegui_binding_links', 'Number of bindings propagated on change',
+         [('', sum(len(links) for links in binding.bindings.values()))]),
+        ('nicegui_background_tasks', 'Number of background tasks', [('', len(background_tasks.running_tasks))]),
+        ('nicegui_task_group_tasks', 'Number of tasks per task group and state', [
+            *((f'{{group="{_escape(group.name)}",state="running"}}', group.running)
+              for group in background_tasks.groups.values()),
+            *((f'{{group="{_escape(group.name)}",state="waiting"}}', group.waiting)
+              for group in background_tasks.groups.values()),
+        ]),
+        ('nicegui_timers', 'Number of scheduled timers', [('', len(scheduler))]),
+        ('nicegui_event_loop_lag_seconds', 'Most recent event loop lag (requires the loop monitor)',
+         [('', core.app.loop_monitor.lag)]),
+    ]
+    counters: List[Tuple[str, str, float]] = [
+        ('nicegui_timer_wakeups_total', 'Number of wakeups of the timer scheduler', scheduler.wakeups),
+        ('nicegui_events_dropped_total', 'Number of events dropped by the server-side rate limit',
+         EventLimiter.total_dropped),
+        ('nicegui_events_coalesced_total', 'Number of value updates superseded by later ones',
+         EventLimiter.total_coalesced),
+    ]
+
+    lines: List[str] = []
+    for name, documentation, samples in gauges:
+        lines.extend(_header(name, documentation, 'gauge'))
+        lines.extend(f'{name}{labels} {_format(value)}' for labels, value in samples)
+    for name, documentation, value in counters:
+        lines.extend(_header(name, documentation, 'counter'))
+        lines.append(f'{name} {_format(value)}')
+    for instrument in _instruments:
+        lines.extend(instrument.render())
+    return '\n'.join(lines) + '\n'
+
+
+def get_metrics(_: Request) -> PlainTextResponse:
+    """Serve the metrics."""
+    return PlainTextResponse(render(), media_type=CONTENT_TYPE)
+
+
+def _header(name: str, documentation: str, type_: str) -> List[str]:
+    return [f'# HELP {name} {documentation}', f'# TYPE {name} {type_}']
+
+
+def _format(value: float) -> str:
+    if value == float('inf'):
+        return '+Inf'
+    return str(int(value)) if float(value).is_integer() else repr(float(value))
+
+
+def _escape(value: str) -> str:
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -1,4 +1,6 @@
 import asyncio
+import functools
+import hashlib
 import mimetypes
 import urllib.parse
 from contextlib import asynccontextmanager
@@ -7,18 +9,19 @@ from typing import Any, Dict
 
 import socketio
 from fastapi import HTTPException, Request
-from fastapi.responses import FileResponse, Response
+from fastapi.responses import FileResponse, Response, StreamingResponse
 
-from . import air, background_tasks, binding, core, favicon, helpers, json, run, welcome
+from . import air, background_tasks, binding, core, favicon, helpers, json, metrics, run, welcome
 from .app import App
 from .client import Client
 from .dependencies import js_components, libraries, resources
 from .error import error_content
+from .frame_stream import BOUNDARY, FrameStream
 from .json import NiceGUIJSONResponse
 from .logging import log
 from .page import page
 from .slot import Slot
-from .staticfiles import CacheControlledStaticFiles
+from .staticfiles import CacheControlledStaticFiles, asset_exists, get_asset_response
 from .version import __version__
 
 
@@ -44,7 +47,8 @@ class SocketIoApp(socketio.ASGIApp):
 
 core.app = app = App(default_response_class=NiceGUIJSONResponse, lifespan=_lifespan)
 core.app.storage.general.initialize_sync()
-core.sio = sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*', json=json)  # custom orjson wrapper
+core.sio = sio = socketio.AsyncServer(async_mode='asgi', cors_allowed_origins='*',
+                                     json=metrics.CountingJson(json))  # custom orjson wrapper
 sio_app = SocketIoApp(socketio_server=sio, socketio_path='/socket.io')
 app.mount('/_nicegui_ws/', sio_app)
 
@@ -55,6 +59,7 @@ mimetypes.add_type('text/css', '.css')
 static_files = CacheControlledStaticFiles(
     directory=(Path(__file__).parent / 'static').resolve(),
     follow_symlink=True,
+    immutable='dev' not in __version__,  # NOTE: the URL contains the version, so the content of releases never changes
 )
 app.mount(f'/_nicegui/{__version__}/static', static_files, name='static')
 
@@ -67,42 +72,75 @@ def _get_index(request: Request) -> Response:
 
 
 @app.get(f'/_nicegui/{__version__}' + '/libraries/{key:path}')
-def _get_library(key: str) -> FileResponse:
+def _get_library(request: Request, key: str) -> Response:
     is_map = key.endswith('.map')
     dict_key = key[:-4] if is_map else key
     if dict_key in libraries:
         path = libraries[dict_key].path
         if is_map:
             path = path.with_name(path.name + '.map')
-        if path.exists():
-            headers = {'Cache-Control': 'public, max-age=3600'}
-            return FileResponse(path, media_type='text/javascript', headers=headers)
+        if asset_exists(path):
+            return get_asset_response(path, request, media_type='text/javascript')
     raise HTTPException(status_code=404, detail=f'library "{key}" not found')
 
 
 @app.get(f'/_nicegui/{__version__}' + '/components/{key:path}')
-def _get_component(key: str) -> FileResponse:
-    if key in js_components and js_components[key].path.exists():
-        headers = {'Cache-Control': 'public, max-age=3600'}
-        return FileResponse(js_components[key].path, media_type='text/javascript', headers=headers)
+def _get_component(request: Request, key: str) -> Response:
+    if key in js_components and asset_exists(js_components[key].path):
+        return get_asset_response(js_components[key].path, request, media_type='text/javascript')
     raise HTTPException(status_code=404, detail=f'component "{key}" not found')
 
 
 @app.get(f'/_nicegui/{__version__}' + '/resources/{key}/{path:path}')
-def _get_resource(key: str, path: str) -> FileResponse:
+def _get_resource(request: Request, key: str, path: str) -> Response:
     if key in resources:
         filepath = resources[key].path / path
-        try:
-            filepath.resolve().relative_to(resources[key].path.resolve())  # NOTE: use is_relative_to() in Python 3.9
-        except ValueError as e:
-            raise HTTPException(status_code=403, detail='forbidden') from e
-        if filepath.exists():
-            headers = {'Cache-Control': 'public, max-age=3600'}
+        if not _is_within(filepath, resources[key].path):
+            raise HTTPException(status_code=403, detail='forbidden')
+        if asset_exists(filepath):
             media_type, _ = mimetypes.guess_type(filepath)
-            return FileResponse(filepath, media_type=media_type, headers=headers)
+            return get_asset_response(filepath, request, media_type=media_type)
     raise HTTPException(status_code=404, detail=f'resource "{key}" not found')
 
 
+@app.get('/_nicegui/frame_streams/{stream_id}')
+def _get_frame_stream(stream_id: str) -> Response:
+    stream = FrameStream.instances.get(stream_id)
+    if stream is None:
+        raise HTTPException(status_code=404, detail=f'frame stream "{stream_id}" not found')
+    return StreamingResponse(stream.iterate(), media_type=f'multipart/x-mixed-replace; boundary={BOUNDARY}',
+                             headers={'Cache-Control': 'no-store'})
+
+
+@app.get('/_nicegui/tasks')
+def _get_tasks() -> Dict[str, Any]:
+    if not core.app.config.task_introspection:
+        raise HTTPException(status_code=404, detail='task introspection is disabled')
+    return {
+        'tasks': [{
+            **info,
+            # NOTE: client IDs address per-client routes, so only a hash is exposed to correlate the tasks of a client
+            'client_id': info['client_id'] and hashlib.sha256(info['client_id'].encode()).hexdigest()[:16],
+        } for info in background_tasks.get_task_infos()],
+        'groups': [{
+            'name': group.name,
+            'limit': group.limit,
+            'client_limit': group.client_limit,
+            'running': group.running,
+            'waiting': group.waiting,
+        } for group in background_tasks.groups.values()],
+    }
+
+
+@functools.lru_cache(maxsize=1024)
+def _is_within(path: Path, directory: Path) -> bool:
+    try:
+        path.resolve().relative_to(directory.resolve())  # NOTE: use is_relative_to() in Python 3.9
+        return True
+    except ValueError:
+        return False
+
+
 async def _startup() -> None:
     """Handle the startup event."""
     if not app.config.has_run_config:
@@ -124,12 +162,16 @@ async def _startup() -> None:
             app.add_route('/favicon.ico', lambda _: favicon.get_favicon_response())
     else:
         app.add_route('/favicon.ico', lambda _: FileResponse(Path(__file__).parent / 'static' / 'favicon.ico'))
+    if core.app.config.metrics:
+        app.add_route('/metrics', metrics.get_metrics)
     core.loop = asyncio.get_running_loop()
     app.start()
     background_tasks.create(binding.refresh_loop(), name='refresh bindings')
     background_tasks.create(Client.prune_instances(), name='prune clients')
     background_tasks.create(Slot.prune_stacks(), name='prune slot stacks')
     background_tasks.create(core.app.storage.prune_tab_storage(), name='prune tab storage')
+    if core.app.config.loop_monitor:
+        core.app.loop_monitor.start()
     air.connect()
 
 
@@ -138,6 +180,9 @@ async def _shutdown() -> None:
     if app.native.main_window:
         app.native.main_window.signal_server_shutdown()
     air.disconnect()
+    app.loop_monitor.stop()
+    for stream in list(FrameStream.instances.values()):
+        stream.close()
     app.stop()
     run.tear_down()
 
@@ -1,16 +1,37 @@
 from __future__ import annotations
 
 import abc
+import operator
 import time
+from contextlib import contextmanager
 from copy import deepcopy
-from typing import Any, Callable, Collection, Dict, Iterable, List, Optional, Set, SupportsIndex, Union
+from typing import (
+    Any,
+    Callable,
+    Collection,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    SupportsIndex,
+    Tuple,
+    Union,
+)
 
 from typing_extensions import Self
 
 from . import events
 
+Operation = Literal['set', 'delete', 'insert', 'replace']
+
+_MISSING = object()
+
 
 class ObservableCollection(abc.ABC):  # noqa: B024
+    _generation = 0  # incremented whenever a parent link changes, invalidating all cached ancestor chains
 
     def __init__(self, *,
                  factory: Callable,
@@ -20,38 +41,136 @@ class ObservableCollection(abc.ABC):  # noqa: B024
                  ) -> None:
         super().__init__(factory() if data is None else data)  # type: ignore
         self._parent = _parent
+        self._key: Any = None
         self.last_modified = time.time()
         self._change_handlers: List[Callable] = [on_change] if on_change else []
+        self._chain: List[ObservableCollection] = []
+        self._chain_generation = -1
+        self._batch_depth = 0
+        self._batch_operations: Set[Operation] = set()
+        self._batch_keys: Dict[Any, None] = {}
+        self._batch_replaced = False
 
     @property
     def change_handlers(self) -> List[Callable]:
         """Return a list of all change handlers registered on this collection and its parents."""
-        change_handlers = self._change_handlers[:]
-        if self._parent is not None:
-            change_handlers.extend(self._parent.change_handlers)
-        return change_handlers
-
-    def _handle_change(self) -> None:
-        self.last_modified = time.time()
-        for handler in self.change_handlers:
-            events.handle_event(handler, events.ObservableChangeEventArguments(sender=self))
+        return [handler for collection in self._ancestors() for handler in collection._change_handlers]
+
+    def _ancestors(self) -> List[ObservableCollection]:
+        """Return this collection and all of its parents (cached until a parent link changes)."""
+        if self._chain_generation != ObservableCollection._generation:
+            self._chain = [self] if self._parent is None else [self, *self._parent._ancestors()]
+            self._chain_generation = ObservableCollection._generation
+        return self._chain
+
+    def _handle_change(self, operation: Operation = 'replace', keys: Tuple[Any, ...] = ()) -> None:
+        """Notify the change handlers of this collection and its parents.
+
+        Each handler receives the path from the collection it was registered on to the modified collection,
+        the kind of operation and the affected keys (dict keys, list indices or set items).
+        """
+        now = time.time()
+        path: Tuple[Any, ...] = ()
+        ancestors = self._ancestors()
+        located = 0  # number of ancestors whose position within their parent is already part of the path
+        for i, collection in enumerate(ancestors):
+            collection.last_modified = now
+            if not collection._change_handlers and not collection._batch_depth:
+                continue
+            while located < i:
+                key = ancestors[located + 1]._key_of(ancestors[located])
+                if key is _MISSING:  # NOTE: detached copies keep their parent but cannot be located within it
+                    path, operation, keys = (), 'replace', ()
+                    located = len(ancestors)  # NOTE: outer ancestors cannot locate the change either
+                    break
+                path = (key, *path)
+                located += 1
+            if collection._batch_depth:
+                collection._record_change(path, operation, keys)
+                return
+            arguments = events.ObservableChangeEventArguments(sender=self, path=path, operation=operation, keys=keys)
+            for handler in collection._change_handlers[:]:
+                events.handle_event(handler, arguments)
+
+    def _record_change(self, path: Tuple[Any, ...], operation: Operation, keys: Tuple[Any, ...]) -> None:
+        if path:
+            operation, keys = 'set', path[:1]
+        self._batch_operations.add(operation)
+        if operation == 'replace' and not keys:
+            self._batch_replaced = True
+        self._batch_keys.update(dict.fromkeys(keys))
+
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect all changes within this context and notify the change handlers only once when leaving it.
+
+        Handlers of this collection and its parents receive a single change event with the union of all changed keys.
+        If the collection is modified in different ways, the event's operation is "replace".
+        Batches can be nested; the notification is emitted when the outermost batch is left.
+        """
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth and self._batch_operations:
+                operations = self._batch_operations
+                keys = () if self._batch_replaced else tuple(self._batch_keys)
+                self._batch_operations, self._batch_keys, self._batch_replaced = set(), {}, False
+                self._handle_change(operations.pop() if len(operations) == 1 else 'replace', keys)
+
+    def _key_of(self, child: ObservableCollection) -> Any:
+        """Return the key or index under which the given child collection is stored."""
+        if isinstance(self, dict):
+            if dict.get(self, child._key, _MISSING) is child:
+                return child._key
+            return next((key for key, value in dict.items(self) if value is child), _MISSING)
+        if isinstance(self, list):
+            if isinstance(child._key, int) and 0 <= child._key < len(self) and list.__getitem__(self, child._key) is child:
+                return child._key
+            return next((i for i, item in enumerate(list.__iter__(self)) if item is child), _MISSING)
+        return _MISSING
 
     def on_change(self, handler: Callable) -> None:
         """Register a handler to be called when the collection changes."""
         self._change_handlers.append(handler)
 
     def _observe(self, data: Any) -> Any:
-        if isinstance(data, ObservableCollection):
-            data.on_change(self._handle_change)
-            return data
-        if isinstance(data, dict):
-            return ObservableDict(data, _parent=self)
-        if isinstance(data, list):
-            return ObservableList(data, _parent=self)
-        if isinstance(data, set):
-            return ObservableSet(data, _parent=self)
+        """Prepare a value for being stored in this collection.
+
+        Plain dicts, lists and sets are stored as they are and only wrapped when they are accessed (see `_wrap`).
+        Observable collections without parent are adopted so that their changes are propagated to this collection.
+        """
+        if isinstance(data, ObservableCollection) and data is not self:
+            if data._parent is None:
+                data._parent = self
+                ObservableCollection._generation += 1
+            elif data._parent is not self:
+                data.on_change(self._handle_change)
         return data
 
+    def _wrap(self, key: Any, value: Any) -> Any:
+        """Wrap a plain nested dict, list or set into an observable collection and store it under the given key."""
+        observable = self._to_observable(key, value)
+        if observable is not value:
+            super().__setitem__(key, observable)  # type: ignore # pylint: disable=no-member
+        return observable
+
+    def _to_observable(self, key: Any, value: Any) -> Any:
+        """Turn a plain nested dict, list or set into an observable collection with this collection as parent."""
+        if isinstance(value, ObservableCollection):
+            return value
+        if isinstance(value, dict):
+            observable: ObservableCollection = ObservableDict(value, _parent=self)
+        elif isinstance(value, list):
+            observable = ObservableList(value, _parent=self)
+        elif isinstance(value, set):
+            observable = ObservableSet(value, _parent=self)
+        else:
+            return value
+        observable._key = key
+        return observable
+
     def __copy__(self) -> Self:
         if isinstance(self, dict):
             return ObservableDict(self, _parent=self._parent)
@@ -80,53 +199,86 @@ class ObservableDict(ObservableCollection, dict):
                  _parent: Optional[ObservableCollection] = None,
                  ) -> None:
         super().__init__(factory=dict, data=data, on_change=on_change, _parent=_parent)
-        for key, value in self.items():
-            super().__setitem__(key, self._observe(value))
+        for value in dict.values(self):
+            self._observe(value)
+
+    def __getitem__(self, __key: Any) -> Any:
+        return self._wrap(__key, super().__getitem__(__key))
+
+    def get(self, __key: Any, __default: Any = None) -> Any:
+        return self[__key] if __key in self else __default
+
+    def __iter__(self) -> Iterator:
+        # NOTE: overriding __iter__ makes dict(self) and {**self} read the values via __getitem__, which wraps them
+        return super().__iter__()
+
+    def copy(self) -> Dict:
+        self._wrap_all()
+        return super().copy()
+
+    def values(self) -> Any:
+        self._wrap_all()
+        return super().values()
+
+    def items(self) -> Any:
+        self._wrap_all()
+        return super().items()
+
+    def _wrap_all(self) -> None:
+        for key, value in list(super().items()):
+            if isinstance(value, (dict, list, set)):
+                self._wrap(key, value)
 
     def pop(self, k: Any, d: Any = None) -> Any:
-        item = super().pop(k, d)
-        self._handle_change()
+        item = self._to_observable(k, super().pop(k, d))
+        self._handle_change('delete', (k,))
         return item
 
     def popitem(self) -> Any:
-        item = super().popitem()
-        self._handle_change()
-        return item
+        key, value = super().popitem()
+        self._handle_change('delete', (key,))
+        return key, self._to_observable(key, value)
 
     def update(self, *args: Any, **kwargs: Any) -> None:
-        super().update(self._observe(dict(*args, **kwargs)))
-        self._handle_change()
+        data = dict(*args, **kwargs)
+        for value in data.values():
+            self._observe(value)
+        super().update(data)
+        self._handle_change('set', tuple(data))
 
     def clear(self) -> None:
         super().clear()
-        self._handle_change()
+        self._handle_change('replace')
 
     def setdefault(self, __key: Any, __default: Any = None) -> Any:
-        item = super().setdefault(__key, self._observe(__default))
-        self._handle_change()
-        return item
+        super().setdefault(__key, self._observe(__default))
+        self._handle_change('set', (__key,))
+        return self[__key]
 
     def __setitem__(self, __key: Any, __value: Any) -> None:
         super().__setitem__(__key, self._observe(__value))
-        self._handle_change()
+        self._handle_change('set', (__key,))
 
     def __delitem__(self, __key: Any) -> None:
         super().__delitem__(__key)
-        self._handle_change()
+        self._handle_change('delete', (__key,))
 
     def __or__(self, other: Any) -> Any:
+        self._wrap_all()
         try:
             return super().__or__(other)  # type: ignore # pylint: disable=no-member
         except TypeError:
             return ObservableDict({**self, **other})  # NOTE: remove this when switching to Python 3.9
 
     def __ior__(self, other: Any) -> Any:
-        other_dict = self._observe(dict(other))
+        other_dict = dict(other)
+        for value in other_dict.values():
+            self._observe(value)
         try:
             super().__ior__(other_dict)  # type: ignore # pylint: disable=no-member
         except TypeError:
-            self.update(other_dict)  # NOTE: remove this when switching to Python 3.9
-        self._handle_change()
+            dict.update(self, other_dict)  # NOTE: remove this when switching to Python 3.9
+        self._handle_change('set', tuple(other_dict))
         return self
 
 
@@ -139,56 +291,99 @@ class ObservableList(ObservableCollection, list):
                  _parent: Optional[ObservableCollection] = None,
                  ) -> None:
         super().__init__(factory=list, data=data, on_change=on_change, _parent=_parent)
-        for i, item in enumerate(self):
-            super().__setitem__(i, self._observe(item))
+        for item in list.__iter__(self):
+            self._observe(item)
+
+    def __getitem__(self, key: Union[SupportsIndex, slice]) -> Any:
+        if isinstance(key, slice):
+            return [self[i] for i in range(*key.indices(len(self)))]
+        index = operator.index(key)
+        return self._wrap(index if index >= 0 else index + len(self), super().__getitem__(index))
+
+    def __iter__(self) -> Iterator:
+        self._wrap_all()
+        return super().__iter__()
+
+    def __reversed__(self) -> Iterator:
+        self._wrap_all()
+        return super().__reversed__()
+
+    def _wrap_all(self) -> None:
+        for i, item in enumerate(super().__iter__()):
+            if isinstance(item, (dict, list, set)):
+                self._wrap(i, item)
+
+    def copy(self) -> List:
+        self._wrap_all()
+        return super().copy()
+
+    def _index(self, index: SupportsIndex) -> int:
+        index = operator.index(index)
+        return index if index >= 0 else max(index + len(self), 0)
 
     def append(self, item: Any) -> None:
         super().append(self._observe(item))
-        self._handle_change()
+        self._handle_change('insert', (len(self) - 1,))
 
     def extend(self, iterable: Iterable) -> None:
-        super().extend(self._observe(list(iterable)))
-        self._handle_change()
+        start = len(self)
+        super().extend([self._observe(item) for item in iterable])
+        self._handle_change('insert', tuple(range(start, len(self))))
 
     def insert(self, index: SupportsIndex, obj: Any) -> None:
+        index = min(self._index(index), len(self))
         super().insert(index, self._observe(obj))
-        self._handle_change()
+        self._handle_change('insert', (index,))
 
     def remove(self, value: Any) -> None:
-        super().remove(value)
-        self._handle_change()
+        index = self.index(value)
+        super().__delitem__(index)
+        self._handle_change('delete', (index,))
 
     def pop(self, index: SupportsIndex = -1) -> Any:
+        index = operator.index(index)
         item = super().pop(index)
-        self._handle_change()
-        return item
+        index = index if index >= 0 else index + len(self) + 1
+        self._handle_change('delete', (index,))
+        return self._to_observable(index, item)
 
     def clear(self) -> None:
         super().clear()
-        self._handle_change()
+        self._handle_change('replace')
 
     def sort(self, **kwargs: Any) -> None:
         super().sort(**kwargs)
-        self._handle_change()
+        self._handle_change('replace')
 
     def reverse(self) -> None:
         super().reverse()
-        self._handle_change()
+        self._handle_change('replace')
 
     def __delitem__(self, key: Union[SupportsIndex, slice]) -> None:
-        super().__delitem__(key)
-        self._handle_change()
+        if isinstance(key, slice):
+            super().__delitem__(key)
+            self._handle_change('replace')
+        else:
+            index = self._index(key)
+            super().__delitem__(key)
+            self._handle_change('delete', (index,))
 
     def __setitem__(self, key: Union[SupportsIndex, slice], value: Any) -> None:
-        super().__setitem__(key, self._observe(value))
-        self._handle_change()
+        if isinstance(key, slice):
+            super().__setitem__(key, [self._observe(item) for item in value])
+            self._handle_change('replace')
+        else:
+            super().__setitem__(key, self._observe(value))
+            self._handle_change('set', (self._index(key),))
 
     def __add__(self, other: Any) -> Any:
+        self._wrap_all()
         return super().__add__(other)
 
     def __iadd__(self, other: Any) -> Any:
-        super().__iadd__(self._observe(other))
-        self._handle_change()
+        start = len(self)
+        super().__iadd__([self._observe(item) for item in other])
+        self._handle_change('insert', tuple(range(start, len(self))))
         return self
 
 
@@ -201,74 +396,73 @@ class ObservableSet(ObservableCollection, set):
                  _parent: Optional[ObservableCollection] = None,
                  ) -> None:
         super().__init__(factory=set, data=data, on_change=on_change, _parent=_parent)
-        for item in self:
-            super().add(self._observe(item))
 
     def add(self, item: Any) -> None:
-        super().add(self._observe(item))
-        self._handle_change()
+        super().add(item)
+        self._handle_change('insert', (item,))
 
     def remove(self, item: Any) -> None:
         super().remove(item)
-        self._handle_change()
+        self._handle_change('delete', (item,))
 
     def discard(self, item: Any) -> None:
         super().discard(item)
-        self._handle_change()
+        self._handle_change('delete', (item,))
 
     def pop(self) -> Any:
         item = super().pop()
-        self._handle_change()
+        self._handle_change('delete', (item,))
         return item
 
     def clear(self) -> None:
         super().clear()
-        self._handle_change()
+        self._handle_change('replace')
 
     def update(self, *s: Iterable[Any]) -> None:
-        super().update(self._observe(set(*s)))
-        self._handle_change()
+        items = set().union(*s)
+        super().update(items)
+        self._handle_change('insert', tuple(items))
 
     def intersection_update(self, *s: Iterable[Any]) -> None:
         super().intersection_update(*s)
-        self._handle_change()
+        self._handle_change('replace')
 
     def difference_update(self, *s: Iterable[Any]) -> None:
         super().difference_update(*s)
-        self._handle_change()
+        self._handle_change('replace')
 
     def symmetric_difference_update(self, *s: Iterable[Any]) -> None:
         super().symmetric_difference_update(*s)
-        self._handle_change()
+        self._handle_change('replace')
 
     def __or__(self, other: Any) -> Any:
         return super().__or__(other)
 
     def __ior__(self, other: Any) -> Any:
-        super().__ior__(self._observe(other))
-        self._handle_change()
+        super().__ior__(other)
+        self._handle_change('insert', tuple(other))
         return self
 
     def __and__(self, other: Any) -> set:
         return super().__and__(other)
 
     def __iand__(self, other: Any) -> Any:
-        super().__iand__(self._observe(other))
-        self._handle_change()
+        super().__iand__(other)
+        self._handle_change('replace')
         return self
 
     def __sub__(self, other: Any) -> set:
         return super().__sub__(other)
 
     def __isub__(self, other: Any) -> Any:
-        super().__isub__(self._observe(other))
-        self._handle_change()
+        super().__isub__(other)
+        self._handle_change('replace')
         return self
 
     def __xor__(self, other: Any) -> set:
         return super().__xor__(other)
 
     def __ixor__(self, other: Any) -> Any:
-        super().__ixor__(self._observe(other))
-        self._handle_change()
+        super().__ixor__(other)
+        self._handle_change('replace')
         return self
@@ -3,8 +3,10 @@ from typing import Literal, Set
 _optional_features: Set[str] = set()
 
 FEATURE = Literal[
+    'brotli',
     'highcharts',
     'matplotlib',
+    'numpy',
     'pandas',
     'pillow',
     'plotly',
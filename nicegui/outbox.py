@@ -88,6 +88,9 @@ class Outbox:
                         element_id: None if element is None else element._to_dict()  # pylint: disable=protected-access
                         for element_id, element in self.updates.items()
                     }
+                    for element in self.updates.values():
+                        if element is not None:
+                            element._handle_update_sent()  # pylint: disable=protected-access
                     coros.append(self._emit((self.client.id, 'update', data)))
                     self.updates.clear()
 
@@ -114,14 +114,16 @@ class page:
             request = dec_kwargs['request']
             # NOTE cleaning up the keyword args so the signature is consistent with "func" again
             dec_kwargs = {k: v for k, v in dec_kwargs.items() if k in parameters_of_decorated_func}
+            monitor = core.app.loop_monitor
             with Client(self, request=request) as client:
                 if any(p.name == 'client' for p in inspect.signature(func).parameters.values()):
                     dec_kwargs['client'] = client
-                result = func(*dec_args, **dec_kwargs)
+                with monitor.measure('page', monitor.get_name(func), route=self.path):
+                    result = func(*dec_args, **dec_kwargs)
             if helpers.is_coroutine_function(func):
                 async def wait_for_result() -> None:
                     with client:
-                        return await result
+                        return await monitor.measure_steps(result, 'page', monitor.get_name(func), route=self.path)
                 task = background_tasks.create(wait_for_result())
                 task_wait_for_connection = background_tasks.create(
                     client._waiting_for_connection.wait(),  # pylint: disable=protected-access
@@ -140,8 +142,9 @@ class page:
                     task.add_done_callback(check_for_late_return_value)
             if isinstance(result, Response):  # NOTE if setup returns a response, we don't need to render the page
                 return result
-            binding._refresh_step()  # pylint: disable=protected-access
-            return client.build_response(request)
+            with monitor.measure('build response', monitor.get_name(func), route=self.path):
+                binding._refresh_step()  # pylint: disable=protected-access
+                return client.build_response(request)
 
         parameters = [p for p in inspect.signature(func).parameters.values() if p.name != 'client']
         # NOTE adding request as a parameter so we can pass it to the client in the decorated function
@@ -3,7 +3,7 @@ from typing import Optional
 
 import aiofiles
 
-from nicegui import background_tasks, core, json
+from nicegui import background_tasks, core, json, metrics
 from nicegui.logging import log
 
 from .persistent_dict import PersistentDict
@@ -46,10 +46,11 @@ class FilePersistentDict(PersistentDict):
             self.filepath.parent.mkdir(exist_ok=True)
 
         async def backup() -> None:
-            async with aiofiles.open(self.filepath, 'w', encoding=self.encoding) as f:
-                await f.write(json.dumps(self, indent=self.indent))
+            with metrics.storage_write_duration.time():
+                async with aiofiles.open(self.filepath, 'w', encoding=self.encoding) as f:
+                    await f.write(json.dumps(self, indent=self.indent))
         if core.loop:
-            background_tasks.create_lazy(backup(), name=self.filepath.stem)
+            background_tasks.create_lazy(backup(), name=self.filepath.stem, group='storage')
         else:
             core.app.on_startup(backup())
 
@@ -1,4 +1,4 @@
-from .. import background_tasks, core, json, optional_features
+from .. import background_tasks, core, json, metrics, optional_features
 from ..logging import log
 from .persistent_dict import PersistentDict
 
@@ -69,12 +69,13 @@ class RedisPersistentDict(PersistentDict):
     def publish(self) -> None:
         """Publish the data to Redis and notify other instances."""
         async def backup() -> None:
-            pipeline = self.redis_client.pipeline()
-            pipeline.set(self.key, json.dumps(self))
-            pipeline.publish(self.key + 'changes', json.dumps(self))
-            await pipeline.execute()
+            with metrics.storage_write_duration.time():
+                pipeline = self.redis_client.pipeline()
+                pipeline.set(self.key, json.dumps(self))
+                pipeline.publish(self.key + 'changes', json.dumps(self))
+                await pipeline.execute()
         if core.loop:
-            background_tasks.create_lazy(backup(), name=f'redis-{self.key}')
+            background_tasks.create_lazy(backup(), name=f'redis-{self.key}', group='storage')
         else:
             core.app.on_startup(backup())
 
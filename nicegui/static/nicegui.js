@@ -279,17 +279,17 @@ function ack() {
 
 async function loadDependencies(element, prefix, version) {
   if (element.component) {
-    const { name, key, tag } = element.component;
+    const { name, key, tag, hash } = element.component;
     if (!loaded_components.has(name) && !key.endsWith(".vue")) {
-      const component = await import(`${prefix}/_nicegui/${version}/components/${key}`);
+      const component = await import(`${prefix}/_nicegui/${version}/components/${key}?v=${hash}`);
       app.component(tag, component.default);
       loaded_components.add(name);
     }
   }
   if (element.libraries) {
-    for (const { name, key } of element.libraries) {
+    for (const { name, key, hash } of element.libraries) {
       if (loaded_libraries.has(name)) continue;
-      await import(`${prefix}/_nicegui/${version}/libraries/${key}`);
+      await import(`${prefix}/_nicegui/${version}/libraries/${key}?v=${hash}`);
       loaded_libraries.add(name);
     }
   }
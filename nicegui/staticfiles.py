@@ -1,15 +1,286 @@
-from starlette.responses import Response
+import functools
+import gzip
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Optional, Tuple
+
+import anyio
+from starlette.datastructures import Headers
+from starlette.requests import Request
+from starlette.responses import FileResponse, Response
 from starlette.staticfiles import StaticFiles
 from starlette.types import Scope
 
+from . import core, optional_features
+
+try:
+    import brotli
+    optional_features.register('brotli')
+except ImportError:
+    pass
+
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+COMPRESSIBLE_MEDIA_TYPES = ('text/', 'application/javascript', 'application/json', 'image/svg+xml')
+MIN_COMPRESSIBLE_SIZE = 1024
+
 
 class CacheControlledStaticFiles(StaticFiles):
 
-    def __init__(self, *args, max_cache_age: int = 3600, **kwargs) -> None:
+    def __init__(self, *args, max_cache_age: int = 3600, immutable: bool = False, **kwargs) -> None:
         self.max_cache_age = max_cache_age
+        self.immutable = immutable
+        self._resolved_paths: Dict[str, Tuple[Path, Optional[str]]] = {}
         super().__init__(*args, **kwargs)
 
     async def get_response(self, path: str, scope: Scope) -> Response:
+        cache_control = IMMUTABLE_CACHE_CONTROL if self.immutable else f'public, max-age={self.max_cache_age}'
+        if path in self._resolved_paths and asset_cache.max_size:
+            # NOTE: skip the file lookup of StaticFiles for assets which have already been resolved and are in memory
+            full_path, media_type = self._resolved_paths[path]
+            if asset_cache.get(full_path) is not None:
+                return await anyio.to_thread.run_sync(functools.partial(
+                    get_asset_response, full_path, Request(scope), media_type=media_type, cache_control=cache_control,
+                ))
         response = await super().get_response(path, scope)
-        response.headers['Cache-Control'] = f'public, max-age={self.max_cache_age}'
+        if isinstance(response, FileResponse) and response.status_code == 200:
+            full_path = Path(response.path)
+            if asset_cache.max_size:
+                self._resolved_paths[path] = (full_path, response.media_type)
+            return await anyio.to_thread.run_sync(functools.partial(
+                get_asset_response, full_path, Request(scope), media_type=response.media_type, cache_control=cache_control,
+            ))
+        response.headers['Cache-Control'] = cache_control
         return response
+
+
+class CachedAsset:
+
+    def __init__(self, data: bytes, mtime_ns: int, content_hash: str) -> None:
+        self.data = data
+        self.mtime_ns = mtime_ns
+        self.content_hash = content_hash
+        self.variants: Dict[str, bytes] = {}
+        self.validated = time.time()
+
+    @property
+    def size(self) -> int:
+        """Total number of bytes held by this asset including its compressed variants."""
+        return len(self.data) + sum(len(variant) for variant in self.variants.values())
+
+
+class AssetCache:
+    """Bounded in-memory LRU cache of asset contents and their compressed variants.
+
+    The cache is enabled by passing `asset_cache_size` to `ui.run()`.
+    Entries are validated against the file's modification time at most once per `validation_interval`,
+    so that bursts of requests for the same assets do not result in file system calls.
+    """
+
+    def __init__(self, *, max_file_size: int = 8 * 1024 * 1024, validation_interval: float = 1.0) -> None:
+        self.max_file_size = max_file_size
+        self.validation_interval = validation_interval
+        self._assets: OrderedDict[str, CachedAsset] = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()  # NOTE: assets are served from multiple threads of the thread pool
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of bytes to keep in memory (0 disables the cache)."""
+        return core.app.config.asset_cache_size
+
+    @property
+    def size(self) -> int:
+        """Number of bytes currently held in memory."""
+        return self._size
+
+    def get(self, path: Path) -> Optional[CachedAsset]:
+        """Get the cached asset for the given path, loading it if necessary.
+
+        Returns None if the cache is disabled, the file does not exist or is too large to be cached.
+        """
+        if not self.max_size:
+            return None
+        key = str(path)
+        with self._lock:
+            asset = self._assets.get(key)
+            if asset is not None and time.time() < asset.validated + self.validation_interval:
+                self._assets.move_to_end(key)
+                return asset
+        try:
+            stat_result = os.stat(key)
+        except OSError:
+            self._remove(key)
+            return None
+        if asset is not None and asset.mtime_ns == stat_result.st_mtime_ns and len(asset.data) == stat_result.st_size:
+            asset.validated = time.time()
+            return asset
+        if stat_result.st_size > min(self.max_file_size, self.max_size):
+            self._remove(key)
+            return None
+        with open(key, 'rb') as f:
+            data = f.read()
+        asset = CachedAsset(data, stat_result.st_mtime_ns, hashlib.md5(data).hexdigest()[:16])
+        self._store(key, asset)
+        return asset
+
+    def get_variant(self, path: Path, asset: CachedAsset, encoding: str) -> bytes:
+        """Get the compressed variant of a cached asset, creating and caching it if necessary."""
+        variant = asset.variants.get(encoding)
+        if variant is None:
+            variant = _compress(str(path), encoding)
+            asset.variants[encoding] = variant
+            with self._lock:
+                if self._assets.get(str(path)) is asset:
+                    self._size += len(variant)
+                    self._evict()
+        return variant
+
+    def clear(self) -> None:
+        """Remove all assets from the cache."""
+        with self._lock:
+            self._assets.clear()
+            self._size = 0
+
+    def _store(self, key: str, asset: CachedAsset) -> None:
+        with self._lock:
+            old_asset = self._assets.pop(key, None)
+            if old_asset is not None:
+                self._size -= old_asset.size
+            self._assets[key] = asset
+            self._size += asset.size
+            self._evict()
+
+    def _remove(self, key: str) -> None:
+        with self._lock:
+            asset = self._assets.pop(key, None)
+            if asset is not None:
+                self._size -= asset.size
+
+    def _evict(self) -> None:
+        while self._size > self.max_size and self._assets:
+            _, asset = self._assets.popitem(last=False)
+            self._size -= asset.size
+
+
+asset_cache = AssetCache()
+
+
+def asset_exists(path: Path) -> bool:
+    """Check whether the asset exists, avoiding file system calls for recently validated cached assets."""
+    return asset_cache.get(path) is not None or path.is_file()
+
+
+def get_content_hash(path: Path) -> str:
+    """Get a hash of the file's content which changes whenever the file is modified."""
+    stat_result = path.stat()
+    return _get_content_hash(str(path), stat_result.st_mtime_ns, stat_result.st_size)
+
+
+class ContentHash:
+    """Content hash of a file which is validated against the file system at most once per `validation_interval`.
+
+    This keeps file system calls out of hot paths like serializing elements with their components and libraries.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self._value = ''
+        self._validated = float('-inf')
+
+    @property
+    def value(self) -> str:
+        """The current content hash."""
+        now = time.time()
+        if now >= self._validated + asset_cache.validation_interval:
+            self._value = get_content_hash(self.path)
+            self._validated = now
+        return self._value
+
+
+@functools.lru_cache(maxsize=1024)
+def _get_content_hash(path: str, mtime_ns: int, size: int) -> str:  # pylint: disable=unused-argument
+    with open(path, 'rb') as f:
+        return hashlib.md5(f.read()).hexdigest()[:16]
+
+
+def get_asset_response(path: Path, request: Request, *,
+                       media_type: Optional[str] = None,
+                       cache_control: str = 'public, max-age=3600') -> Response:
+    """Get a response for a static asset which is compressed according to the "Accept-Encoding" header.
+
+    The content hash is used as ETag to answer conditional requests with "304 Not Modified".
+    If the request's query parameter "v" matches the content hash, the asset is cached as immutable for a year.
+    Brotli (if installed) and gzip variants are taken from pre-compressed files next to the asset (e.g. "lib.js.br")
+    or created on the first request and kept in memory.
+    If the asset cache is enabled, the content is served from memory.
+    """
+    asset = asset_cache.get(path)
+    if asset is not None:
+        content_hash, size = asset.content_hash, len(asset.data)
+    else:
+        stat_result = path.stat()
+        content_hash = _get_content_hash(str(path), stat_result.st_mtime_ns, stat_result.st_size)
+        size = stat_result.st_size
+    if request.query_params.get('v') == content_hash:
+        cache_control = IMMUTABLE_CACHE_CONTROL
+    encoding = _choose_encoding(request.headers, media_type, size)
+    e_tag = f'"{content_hash}-{encoding}"' if encoding else f'"{content_hash}"'
+    headers = {'Cache-Control': cache_control, 'ETag': e_tag, 'Vary': 'Accept-Encoding'}
+    if _matches_e_tag(request.headers.get('If-None-Match', ''), e_tag):
+        return Response(status_code=304, headers=headers)
+    if encoding is None:
+        if asset is not None:
+            return Response(asset.data, media_type=media_type, headers=headers)
+        return FileResponse(path, media_type=media_type, headers=headers)
+    headers['Content-Encoding'] = encoding
+    if asset is not None:
+        return Response(asset_cache.get_variant(path, asset, encoding), media_type=media_type, headers=headers)
+    return Response(_get_compressed(str(path), content_hash, encoding), media_type=media_type, headers=headers)
+
+
+def _matches_e_tag(if_none_match: str, e_tag: str) -> bool:
+    """Check whether the "If-None-Match" header matches the ETag (using the weak comparison of RFC 9110)."""
+    tags = [tag.strip() for tag in if_none_match.split(',')]
+    return any(tag == '*' or (tag[2:] if tag.startswith('W/') else tag) == e_tag for tag in tags)
+
+
+def _choose_encoding(headers: Headers, media_type: Optional[str], size: int) -> Optional[str]:
+    if size < MIN_COMPRESSIBLE_SIZE or not media_type or not media_type.startswith(COMPRESSIBLE_MEDIA_TYPES):
+        return None
+    accepted = set()
+    for item in headers.get('Accept-Encoding', '').split(','):
+        name, _, params = item.partition(';')
+        params = params.strip()
+        try:
+            weight = float(params[2:]) if params.startswith('q=') else 1.0
+        except ValueError:
+            weight = 0.0
+        if weight > 0:
+            accepted.add(name.strip().lower())
+    if 'br' in accepted and optional_features.has('brotli'):
+        return 'br'
+    if 'gzip' in accepted:
+        return 'gzip'
+    return None
+
+
+@functools.lru_cache(maxsize=64)
+def _get_compressed(path: str, content_hash: str, encoding: str) -> bytes:  # pylint: disable=unused-argument
+    return _compress(path, encoding)
+
+
+def _compress(path: str, encoding: str) -> bytes:
+    precompressed_path = path + ('.br' if encoding == 'br' else '.gz')
+    try:
+        if os.stat(precompressed_path).st_mtime_ns >= os.stat(path).st_mtime_ns:
+            with open(precompressed_path, 'rb') as f:
+                return f.read()
+    except OSError:
+        pass  # no pre-compressed file available
+    with open(path, 'rb') as f:
+        data = f.read()
+    return brotli.compress(data, quality=6) if encoding == 'br' else gzip.compress(data, compresslevel=9)
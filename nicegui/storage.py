@@ -3,9 +3,10 @@ import contextvars
 import os
 import time
 import uuid
+from contextlib import ExitStack, contextmanager
 from datetime import timedelta
 from pathlib import Path
-from typing import Dict, Optional, Union
+from typing import Dict, Iterator, List, Optional, Union
 
 from starlette.middleware import Middleware
 from starlette.middleware.base import BaseHTTPMiddleware, RequestResponseEndpoint
@@ -191,6 +192,33 @@ class Storage:
                     del self._tabs[tab_id]
             await asyncio.sleep(PURGE_INTERVAL)
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Collect changes to general storage and the current user and tab storage and notify (and persist) each once.
+
+        This is useful for bulk updates like populating `app.storage.user` in a loop.
+        Storage of other users and tabs is not affected.
+        Use the `batch` method of a single storage (e.g. `app.storage.user.batch()`) to restrict the context to it.
+        """
+        with ExitStack() as stack:
+            for storage in [self._general, *self._get_current_storages()]:
+                stack.enter_context(storage.batch())
+            yield
+
+    def _get_current_storages(self) -> List[ObservableDict]:
+        """Return the user and tab storage of the current context if they exist."""
+        storages: List[ObservableDict] = []
+        request: Optional[Request] = request_contextvar.get()
+        if request is not None and 'id' in request.session and request.session['id'] in self._users:
+            storages.append(self._users[request.session['id']])
+        try:
+            client = context.client
+        except RuntimeError:
+            return storages  # no UI context
+        if client.tab_id is not None and client.tab_id in self._tabs:
+            storages.append(self._tabs[client.tab_id])
+        return storages
+
     def clear(self) -> None:
         """Clears all storage."""
         self._general.clear()
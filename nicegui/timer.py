@@ -1,13 +1,127 @@
 import asyncio
-import time
+import heapq
+import itertools
+import math
+import random
 from contextlib import nullcontext
-from typing import Any, Awaitable, Callable, ContextManager, Optional
+from typing import Any, Awaitable, Callable, ContextManager, List, Optional
 
 from . import background_tasks, core
 from .awaitable_response import AwaitableResponse
 from .binding import BindableProperty
 
 
+class Scheduler:
+    """Runs the callbacks of all timers in a single task, which only wakes up when the next timer is due.
+
+    Periodic timers with the same interval can be aligned to common points in time, so that they share their wakeups.
+    """
+
+    def __init__(self) -> None:
+        self._queue: List[List[Any]] = []  # NOTE: heap of [due, sequence number, timer or None if unscheduled]
+        self._sequence = itertools.count()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+        self._wakeup: Optional[asyncio.Future] = None
+        self._count = 0
+        self.wakeups = 0
+        """Total number of wakeups of the scheduler task"""
+        self._window_start = 0.0
+        self._window_wakeups = 0
+        self._wakeups_per_second = 0.0
+
+    def __len__(self) -> int:
+        """Number of scheduled timers."""
+        return self._count
+
+    @property
+    def wakeups_per_second(self) -> float:
+        """Number of wakeups per second, measured over the last full second."""
+        if self._loop is None or self._loop.time() - self._window_start > 2.0:
+            return 0.0
+        return self._wakeups_per_second
+
+    def time(self) -> float:
+        """Return the current time of the event loop."""
+        assert core.loop is not None
+        return core.loop.time()
+
+    def schedule(self, timer: 'Timer', due: float) -> None:
+        """Schedule the given timer to run at the given event loop time."""
+        self._ensure_running()
+        self.unschedule(timer)
+        if self._wakeup is not None and not self._wakeup.done() and (not self._queue or due < self._queue[0][0]):
+            self._wakeup.set_result(None)
+        entry = [due, next(self._sequence), timer]
+        timer._entry = entry  # pylint: disable=protected-access
+        heapq.heappush(self._queue, entry)
+        self._count += 1
+
+    def unschedule(self, timer: 'Timer') -> None:
+        """Remove the given timer from the schedule."""
+        entry = timer._entry  # pylint: disable=protected-access
+        if entry is not None:
+            entry[2] = None
+            timer._entry = None  # pylint: disable=protected-access
+            self._count -= 1
+
+    def _ensure_running(self) -> None:
+        if self._loop is not core.loop:
+            self._queue.clear()  # NOTE: timers of a previous event loop cannot run anymore
+            self._count = 0
+            self._loop = core.loop
+            self._task = None
+            self._wakeup = None
+        if self._task is None or self._task.done():
+            self._task = background_tasks.create(self._run(), name='timer scheduler')
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while self._queue:
+            due = self._queue[0][0]
+            if due > loop.time():
+                self._wakeup = loop.create_future()
+                handle = loop.call_at(due, _resolve, self._wakeup)
+                try:
+                    await self._wakeup
+                finally:
+                    handle.cancel()
+                    self._wakeup = None
+                continue  # NOTE: an earlier timer might have been scheduled in the meantime
+
+            self._run_due_timers(loop.time())
+            await asyncio.sleep(0)  # NOTE: let other tasks run even if timers are overdue
+
+    def _run_due_timers(self, now: float) -> None:
+        # NOTE: this is no coroutine, so that no reference to the last timer is kept while waiting for the next one
+        self._count_wakeup(now)
+        while self._queue and self._queue[0][0] <= now:
+            _, _, timer = heapq.heappop(self._queue)
+            if timer is not None:
+                timer._entry = None  # pylint: disable=protected-access
+                self._count -= 1
+                try:
+                    timer._run()  # pylint: disable=protected-access
+                except Exception as e:
+                    core.app.handle_exception(e)
+
+    def _count_wakeup(self, now: float) -> None:
+        self.wakeups += 1
+        self._window_wakeups += 1
+        if now - self._window_start >= 1.0:
+            self._wakeups_per_second = self._window_wakeups / (now - self._window_start) if self._window_start else 0.0
+            self._window_start = now
+            self._window_wakeups = 0
+
+
+def _resolve(future: asyncio.Future) -> None:
+    if not future.done():
+        future.set_result(None)
+
+
+scheduler = Scheduler()
+
+
 class Timer:
     active = BindableProperty()
     interval = BindableProperty()
@@ -18,6 +132,8 @@ class Timer:
                  active: bool = True,
                  once: bool = False,
                  immediate: bool = True,
+                 align: bool = False,
+                 jitter: float = 0.0,
                  ) -> None:
         """Timer
 
@@ -25,24 +141,33 @@ class Timer:
         for example to show a graph with incoming measurements.
         A timer will execute a callback repeatedly with a given interval.
 
+        All timers are run by a single scheduler task.
+        Periodic timers with the same interval can be aligned to share the scheduler's wakeups (*added in version 2.15.0*).
+
         :param interval: the interval in which the timer is called (can be changed during runtime)
         :param callback: function or coroutine to execute when interval elapses
         :param active: whether the callback should be executed or not (can be changed during runtime)
         :param once: whether the callback is only executed once after a delay specified by `interval` (default: `False`)
         :param immediate: whether the callback should be executed immediately (default: `True`, ignored if `once` is `True`, *added in version 2.9.0*)
+        :param align: whether to align periodic runs with other aligned timers of the same interval (default: `False`, *added in version 2.15.0*)
+        :param jitter: maximum random delay in seconds added to each run to spread the load (default: 0.0, *added in version 2.15.0*)
         """
         super().__init__()
         self.interval = interval
         self.callback: Optional[Callable[..., Any]] = callback
         self.active = active
         self._is_canceled = False
+        self._once = once
         self._immediate = immediate
+        self._align = align
+        self._jitter = jitter
+        self._entry: Optional[List[Any]] = None
+        self._due = 0.0
 
-        coroutine = self._run_once if once else self._run_in_loop
         if core.app.is_started:
-            background_tasks.create(coroutine(), name=str(callback))
+            self._start()
         else:
-            core.app.on_startup(coroutine)
+            core.app.on_startup(self._start)
 
     def _get_context(self) -> ContextManager:
         return nullcontext()
@@ -60,50 +185,73 @@ class Timer:
         """Cancel the timer."""
         self._is_canceled = True
 
-    async def _run_once(self) -> None:
-        try:
-            if not await self._can_start():
-                return
-            with self._get_context():
-                await asyncio.sleep(self.interval)
-                if self.active and not self._should_stop():
-                    await self._invoke_callback()
-        finally:
-            self._cleanup()
+    def _start(self) -> None:
+        now = scheduler.time()
+        if self._once:
+            self._schedule(now + self.interval)
+        elif self._immediate:
+            self._schedule(now)
+        else:
+            self._schedule(self._get_next_due(now))
 
-    async def _run_in_loop(self) -> None:
-        try:
-            if not self._immediate:
-                await asyncio.sleep(self.interval)
-            if not await self._can_start():
-                return
-            with self._get_context():
-                while not self._should_stop():
-                    try:
-                        start = time.time()
-                        if self.active:
-                            await self._invoke_callback()
-                        dt = time.time() - start
-                        await asyncio.sleep(self.interval - dt)
-                    except asyncio.CancelledError:
-                        break
-                    except Exception as e:
-                        core.app.handle_exception(e)
-                        await asyncio.sleep(self.interval)
-        finally:
-            self._cleanup()
+    def _schedule(self, due: float) -> None:
+        self._due = due
+        scheduler.schedule(self, due + (random.uniform(0, self._jitter) if self._jitter > 0 else 0))
 
-    async def _invoke_callback(self) -> None:
+    def _get_next_due(self, last_due: float) -> float:
+        interval = self.interval
+        due = last_due + interval
+        if self._align and interval > 0:
+            # NOTE: timers with the same interval wake up together; rounding up keeps at least one interval between runs
+            due = math.ceil(due / interval - 1e-9) * interval
+        now = scheduler.time()
+        if due < now:
+            due = math.ceil(now / interval) * interval if self._align and interval > 0 else now
+        return due
+
+    def _run(self) -> None:
+        if self._should_stop():
+            self._cleanup()
+            return
+        if not self.active or self._is_paused():
+            if self._once and self.active:
+                self._schedule(scheduler.time() + 0.1)  # NOTE: retry when the timer is not paused anymore
+            elif self._once:
+                self._cleanup()
+            else:
+                self._schedule(self._get_next_due(self._due))
+            return
+        monitor = core.app.loop_monitor
         try:
             assert self.callback is not None
-            result = self.callback()
-            if isinstance(result, Awaitable) and not isinstance(result, AwaitableResponse):
-                await result
+            with self._get_context(), monitor.measure('timer', monitor.get_name(self.callback)):
+                result = self.callback()
         except Exception as e:
             core.app.handle_exception(e)
+            result = None
+        if isinstance(result, Awaitable) and not isinstance(result, AwaitableResponse):
+            background_tasks.create(self._await_result(result), name=str(self.callback), group='timers')
+        else:
+            self._finish_run()
+
+    async def _await_result(self, result: Awaitable) -> None:
+        monitor = core.app.loop_monitor
+        try:
+            with self._get_context():
+                await monitor.measure_steps(result, 'timer', monitor.get_name(self.callback))
+        except Exception as e:
+            core.app.handle_exception(e)
+        finally:
+            self._finish_run()
+
+    def _finish_run(self) -> None:
+        if self._once or self._should_stop():
+            self._cleanup()
+        else:
+            self._schedule(self._get_next_due(self._due))
 
-    async def _can_start(self) -> bool:
-        return True
+    def _is_paused(self) -> bool:
+        return False
 
     def _should_stop(self) -> bool:
         return (
@@ -113,4 +261,5 @@ class Timer:
         )
 
     def _cleanup(self) -> None:
+        scheduler.unschedule(self)
         self.callback = None
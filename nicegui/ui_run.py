@@ -11,7 +11,7 @@ from uvicorn.supervisors import ChangeReload, Multiprocess
 
 import __main__
 
-from . import core, helpers
+from . import background_tasks, core, helpers
 from . import native as native_module
 from .air import Air
 from .client import Client
@@ -73,6 +73,12 @@ def run(*,
         endpoint_documentation: Literal['none', 'internal', 'page', 'all'] = 'none',
         storage_secret: Optional[str] = None,
         show_welcome_message: bool = True,
+        asset_cache_size: int = 0,
+        max_event_rate: float = 0.0,
+        max_concurrent_event_handlers: int = 0,
+        task_introspection: bool = False,
+        loop_monitor: bool = False,
+        metrics: bool = False,
         **kwargs: Any,
         ) -> None:
     """ui.run
@@ -107,6 +113,12 @@ def run(*,
     :param endpoint_documentation: control what endpoints appear in the autogenerated OpenAPI docs (default: 'none', options: 'none', 'internal', 'page', 'all')
     :param storage_secret: secret key for browser-based storage (default: `None`, a value is required to enable ui.storage.individual and ui.storage.browser)
     :param show_welcome_message: whether to show the welcome message (default: `True`)
+    :param asset_cache_size: maximum number of bytes of libraries, components and static files to keep in memory (default: `0`, i.e. disabled, *added in version 2.15.0*)
+    :param max_event_rate: maximum number of events per second the server accepts per event listener (default: `0`, i.e. only the listener's `throttle` is enforced, *added in version 2.15.0*)
+    :param max_concurrent_event_handlers: maximum number of async event handlers running concurrently per client (default: `0`, i.e. unlimited, *added in version 2.15.0*)
+    :param task_introspection: whether to list all background tasks by name and age at `/_nicegui/tasks` (default: `False`, *added in version 2.15.0*)
+    :param loop_monitor: whether to sample the event loop lag and log callbacks blocking the loop, see `app.loop_monitor` (default: `False`, *added in version 2.15.0*)
+    :param metrics: whether to serve runtime metrics in the Prometheus text format at `/metrics` (default: `False`, *added in version 2.15.0*)
     :param kwargs: additional keyword arguments are passed to `uvicorn.run`
     """
     core.app.config.add_run_config(
@@ -124,6 +136,12 @@ def run(*,
         show_welcome_message=show_welcome_message,
     )
     core.app.config.endpoint_documentation = endpoint_documentation
+    core.app.config.asset_cache_size = asset_cache_size
+    core.app.config.max_event_rate = max_event_rate
+    core.app.config.task_introspection = task_introspection
+    core.app.config.loop_monitor = loop_monitor
+    core.app.config.metrics = metrics
+    background_tasks.configure_group('event handlers', client_limit=max_concurrent_event_handlers)
     if not helpers.is_pytest():
         core.app.add_middleware(GZipMiddleware)
     core.app.add_middleware(RedirectWithPrefixMiddleware)
@@ -0,0 +1,53 @@
+import asyncio
+from typing import List
+
+import pytest
+
+from nicegui import app, background_tasks
+from nicegui.testing import User
+
+
+async def test_group_limits(user: User):
+    background_tasks.configure_group('test', limit=2, client_limit=1)
+    release = asyncio.Event()
+    started: List[str] = []
+
+    async def work(name: str) -> None:
+        started.append(name)
+        await release.wait()
+
+    try:
+        tasks = [background_tasks.create(work(name), name=name, group='test', client_id=client_id)
+                 for name, client_id in [('A1', 'A'), ('A2', 'A'), ('B1', 'B'), ('C1', 'C')]]
+        await asyncio.sleep(0.1)
+        assert started == ['A1', 'B1'], 'A2 waits for the client limit, C1 for the group limit'
+        infos = {info['name']: info for info in background_tasks.get_task_infos()}
+        assert [infos[name]['state'] for name in ['A1', 'A2', 'B1', 'C1']] == \
+            ['running', 'waiting', 'running', 'waiting']
+
+        tasks[3].cancel()
+        release.set()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        assert started == ['A1', 'B1', 'A2']
+        assert background_tasks.groups['test'].running == 0
+        assert background_tasks.groups['test'].waiting == 0
+    finally:
+        background_tasks.groups.pop('test')
+
+
+async def test_task_introspection(user: User, caplog: pytest.LogCaptureFixture):
+    response = await user.http_client.get('/_nicegui/tasks')
+    assert response.status_code == 404
+    assert [record.message for record in caplog.records] == ['http://test/_nicegui/tasks not found']
+    caplog.clear()
+
+    app.config.task_introspection = True
+    try:
+        background_tasks.create(asyncio.sleep(0.5), name='sleeping task', client_id='secret-client-id')
+        response = await user.http_client.get('/_nicegui/tasks')
+        assert response.status_code == 200
+        tasks = {task['name']: task for task in response.json()['tasks']}
+        assert 'sleeping task' in tasks
+        assert tasks['sleeping task']['client_id'] not in {None, 'secret-client-id'}, 'client IDs are not exposed'
+    finally:
+        app.config.task_introspection = False
@@ -1,4 +1,5 @@
-from typing import Generator
+import asyncio
+from typing import Generator, List
 
 import pytest
 from pyecharts import options
@@ -6,7 +7,7 @@ from pyecharts.charts import Bar
 from pyecharts.commons import utils
 
 from nicegui import app, ui
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 @pytest.fixture
@@ -154,3 +155,45 @@ def test_theme_url(screen: Screen, test_route: str):  # pylint: disable=redefine
 
     screen.open('/')
     assert screen.find_by_tag('rect').value_of_css_property('fill') == 'rgb(254, 248, 239)'
+
+
+async def test_sending_patches(user: User):
+    @ui.page('/')
+    def page():
+        ui.echart({
+            'xAxis': {'type': 'value'},
+            'yAxis': {'type': 'value'},
+            'series': [{'type': 'line', 'data': [[0, 0], [1, 1]]}],
+        })
+
+    await user.open('/')
+    chart = user.find(ui.echart).elements.pop()
+    calls: List[str] = []
+    chart.client.run_javascript = lambda code, **_: calls.append(code)  # type: ignore
+
+    chart.update()
+    assert chart.id in chart.client.outbox.updates, 'the first update is sent completely'
+    await asyncio.sleep(0.1)
+    assert chart.id not in chart.client.outbox.updates
+
+    chart.append_data(0, [[2, 4], [3, 9]])
+    assert len(calls) == 1
+    assert '["append",["series",0,"data"],[[2,4],[3,9]]]' in calls[-1].replace(' ', '')
+
+    chart.options['xAxis']['name'] = 'x'
+    del chart.options['yAxis']['type']
+    chart.update()
+    assert '[["set",["xAxis","name"],"x"],["delete",["yAxis","type"]]]' in calls[-1].replace(' ', '')
+
+    chart.update()
+    assert len(calls) == 2, 'nothing is sent if nothing changed'
+
+    chart.classes('w-full')
+    assert len(calls) == 2, 'other changes trigger a full update'
+    assert chart.id in chart.client.outbox.updates
+    await asyncio.sleep(0.1)
+
+    chart.options['xAxis']['name'] = 'y'
+    chart._to_dict()  # pylint: disable=protected-access  # NOTE: like serializing the page for another browser
+    chart.update()
+    assert '[["set",["xAxis","name"],"y"]]' in calls[-1].replace(' ', ''), 'serializing does not reset the baseline'
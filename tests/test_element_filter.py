@@ -94,6 +94,34 @@ def test_find_marker():
     assert texts(ElementFilter(marker='important bar')) == ['button D']
 
 
+def test_find_with_index():
+    with ui.column():
+        for i in range(20):
+            ui.label(f'label {i}')
+        with ui.row() as row:
+            button_c = ui.button('button C').mark('important')
+            ui.button('button A')
+        ui.button('button B').mark('important')
+
+    assert texts(ElementFilter(kind=ui.button)) == ['button C', 'button A', 'button B']
+    assert texts(ElementFilter(marker='important')) == ['button C', 'button B']
+
+    row.move(target_index=0)
+    button_c.mark()
+    assert texts(ElementFilter(marker='important')) == ['button B']
+    button_c.mark('important')
+    ui.button('button D').mark('important')
+    assert texts(ElementFilter(marker='important')) == ['button C', 'button B', 'button D']
+
+    row.delete()
+    assert texts(ElementFilter(kind=ui.button)) == ['button B', 'button D']
+
+    button_c.mark('important')
+    assert texts(ElementFilter(marker='important')) == ['button B', 'button D']
+    candidates = button_c.client.element_index.find(None, ['important']) or []
+    assert button_c not in candidates, 'deleted elements are not indexed again'
+
+
 def test_find_within_marker():
     ui.button('button A')
     ui.label('label A')
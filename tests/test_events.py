@@ -1,12 +1,14 @@
 import asyncio
-from typing import Literal
+import inspect
+import json
+from typing import List, Literal
 
 import pytest
 from selenium.webdriver.common.by import By
 
 from nicegui import ui
 from nicegui.events import ClickEventArguments
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def click_sync_no_args():
@@ -210,3 +212,51 @@ def test_delegated_event(screen: Screen) -> None:
         screen.selenium.find_element(By.CSS_SELECTOR, f'li:nth-child({i+1})').click()
 
     assert clicked == list(range(len(data)))
+
+
+def test_handler_signature_is_inspected_once(screen: Screen, monkeypatch):
+    calls = []
+    original_signature = inspect.signature
+    monkeypatch.setattr(inspect, 'signature', lambda func: calls.append(func) or original_signature(func))
+    counter = {'with_args': 0, 'without_args': 0}
+
+    def with_args(_):
+        counter['with_args'] += 1
+
+    def without_args():
+        counter['without_args'] += 1
+
+    button = ui.button('Button').on('mousemove', with_args).on('mousemove', without_args)
+
+    screen.open('/')
+    calls.clear()
+    for listener in button._event_listeners.values():  # pylint: disable=protected-access
+        for _ in range(1000):
+            button._handle_event({'listener_id': listener.id, 'args': None})  # pylint: disable=protected-access
+    assert counter == {'with_args': 1000, 'without_args': 1000}
+    assert not calls
+
+
+async def test_server_side_event_limit(user: User):
+    clicks: List[None] = []
+    values: List[int] = []
+
+    @ui.page('/')
+    def page():
+        ui.button('Click').on('click', lambda: clicks.append(None), throttle=10)
+        ui.input().on('update:model-value', lambda e: values.append(e.args), throttle=0.1)
+
+    await user.open('/')
+    assert user.client is not None
+    for element in [user.find(ui.button).elements.pop(), user.find(ui.input).elements.pop()]:
+        listeners = element._event_listeners.values()  # pylint: disable=protected-access
+        listener = next(li for li in listeners if li.throttle)
+        for i in range(10):
+            user.client.handle_event({'id': element.id, 'listener_id': listener.id, 'args': [json.dumps(i)]})
+    assert len(clicks) == 5, 'events exceeding the burst are dropped'
+    assert values == [0, 1, 2, 3, 4]
+    assert user.client.event_limiter.dropped == 5
+    assert user.client.event_limiter.coalesced == 4
+
+    await asyncio.sleep(0.2)
+    assert values == [0, 1, 2, 3, 4, 9], 'the latest value update is delivered later'
@@ -0,0 +1,41 @@
+import asyncio
+
+from nicegui import FrameStream, ui
+from nicegui.testing import User
+
+
+async def test_frame_stream_as_source(user: User):
+    stream = FrameStream()
+    image = ui.interactive_image(stream)
+    await user.open('/')
+    assert image.props['src'] == stream.url
+
+
+async def test_dropping_stale_frames():
+    stream = FrameStream()
+    stream.push(b'frame 1')
+    chunks = stream.iterate()
+    assert (await chunks.__anext__()).endswith(b'frame 1\r\n')
+    assert stream.viewers == 1
+
+    next_chunk = asyncio.ensure_future(chunks.__anext__())
+    await asyncio.sleep(0)
+    assert not next_chunk.done()
+    stream.push(b'frame 2')
+    stream.push(b'frame 3')
+    chunk = await next_chunk
+    assert chunk.startswith(b'--nicegui-frame\r\nContent-Type: image/jpeg\r\nContent-Length: 7\r\n')
+    assert chunk.endswith(b'frame 3\r\n')
+    assert stream.dropped_frames == 1
+
+    stream.close()
+    assert [chunk async for chunk in chunks] == []
+    assert stream.viewers == 0
+
+
+async def test_push_from_thread(user: User):
+    stream = FrameStream()
+    await asyncio.get_running_loop().run_in_executor(None, stream.push, b'frame')
+    await asyncio.sleep(0)
+    assert stream.frame == b'frame'
+    assert stream.frame_count == 1
@@ -1,4 +1,6 @@
 import contextlib
+import functools
+import inspect
 import socket
 import time
 import webbrowser
@@ -96,3 +98,28 @@ def test_event_type_to_camel_case():
     assert helpers.event_type_to_camel_case('keydown.enter') == 'keydown.enter'
     assert helpers.event_type_to_camel_case('keydown.+') == 'keydown.+'
     assert helpers.event_type_to_camel_case('keydown.-') == 'keydown.-'
+
+
+def test_get_signature(monkeypatch):
+    calls = []
+    original_signature = inspect.signature
+    monkeypatch.setattr(inspect, 'signature', lambda func: calls.append(func) or original_signature(func))
+
+    class Handler:
+        def method(self, a, b=1):
+            pass
+
+        def __call__(self, a):
+            pass
+
+    def function(a, b):
+        pass
+
+    partial = functools.partial(function, 1)
+    for _ in range(3):
+        assert list(helpers.get_signature(function).parameters) == ['a', 'b']
+        assert list(helpers.get_signature(partial).parameters) == ['b']
+        assert list(helpers.get_signature(Handler().method).parameters) == ['a', 'b']
+        assert list(helpers.get_signature(Handler.method).parameters) == ['self', 'a', 'b']
+        assert list(helpers.get_signature(Handler()).parameters) == ['a']
+    assert len(calls) == 4 + 3, 'callable instances are cached per instance'
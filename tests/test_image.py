@@ -1,7 +1,12 @@
+import asyncio
 from pathlib import Path
 
+import pytest
+from PIL import Image
+
 from nicegui import app, ui
-from nicegui.testing import Screen
+from nicegui.elements import image as image_module
+from nicegui.testing import Screen, User
 
 example_file = Path(__file__).parent / '../examples/slideshow/slides/slide1.jpg'
 example_data = ('data:image/png;base64,'
@@ -96,3 +101,62 @@ def test_force_reload(screen: Screen):
     screen.click('Reload 2')
     screen.wait(0.5)
     screen.assert_py_logger('WARNING', 'ui.image: force_reload() only works with network sources (not base64)')
+
+
+async def test_pil_image_conversion(user: User):
+    small_image = Image.new('RGB', (10, 10), 'red')
+    large_image = Image.new('RGBA', (1000, 1000), 'blue')
+
+    @ui.page('/')
+    def page():
+        ui.image(small_image)
+
+    await user.open('/')
+    img = user.find(ui.image).elements.pop()
+    assert img.props['src'].startswith('data:image/png;base64,')
+    assert img.props['src'] == image_module.pil_to_base64(Image.new('RGB', (10, 10), 'red'), 'PNG')
+
+    img.PIL_CONVERT_FORMAT = 'JPEG'
+    img.PIL_CONVERT_QUALITY = 50
+    img.set_source(large_image)
+    assert img.props['src'].startswith('data:image/png;base64,'), 'large images are converted in the background'
+    for _ in range(100):
+        if img.props['src'].startswith('data:image/jpeg;base64,'):
+            break
+        await asyncio.sleep(0.01)
+    assert img.props['src'] == image_module.pil_to_base64(large_image, 'JPEG', 50)
+
+
+async def test_replacing_local_file_with_pil_image(user: User):
+    @ui.page('/')
+    def page():
+        ui.image(example_file)
+
+    await user.open('/')
+    img = user.find(ui.image).elements.pop()
+    route = img.auto_route
+    assert route is not None
+    assert any(getattr(r, 'path', None) == route for r in app.routes)
+
+    img.set_source(Image.new('RGB', (1000, 1000), 'blue'))
+    for _ in range(100):
+        if img.props['src'].startswith('data:image/png;base64,'):
+            break
+        await asyncio.sleep(0.01)
+    assert img.auto_route is None
+    assert not any(getattr(r, 'path', None) == route for r in app.routes), 'the route of the file should be removed'
+
+
+def test_pil_image_cache_is_bounded_by_size(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(image_module, '_cache', image_module._DataUrlCache())  # pylint: disable=protected-access
+    monkeypatch.setattr(image_module, 'CACHE_MAX_SIZE', 2000)
+    monkeypatch.setattr(image_module, 'CACHE_MAX_ENTRY_SIZE', 1000)
+    cache = image_module._cache  # pylint: disable=protected-access
+
+    for i in range(20):
+        image_module.pil_to_base64(Image.new('RGB', (10, 10), (i, 0, 0)), 'PNG')
+    assert 0 < cache.size <= 2000, 'least recently used images should be evicted'
+
+    size = cache.size
+    image_module.pil_to_base64(Image.effect_noise((100, 100), 50), 'PNG')
+    assert cache.size == size, 'images exceeding the entry size should not be cached'
@@ -1,7 +1,10 @@
+import asyncio
 import time
+from typing import List, Optional, Tuple
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.events import GenericEventArguments
+from nicegui.testing import Screen, User
 
 
 def test_leaflet(screen: Screen):
@@ -36,3 +39,110 @@ def test_leaflet(screen: Screen):
 
     screen.click('London')
     screen.should_contain('Center: 51.505, -0.090')
+
+
+async def test_batched_layers_and_tiled_geo_json(user: User):
+    features = [
+        {'type': 'Feature', 'properties': {'name': 'Berlin'}, 'geometry': {'type': 'Point', 'coordinates': [13.40, 52.52]}},
+        {'type': 'Feature', 'properties': {'name': 'London'}, 'geometry': {'type': 'Point', 'coordinates': [-0.09, 51.51]}},
+    ]
+
+    @ui.page('/')
+    def page():
+        ui.leaflet(center=(52.52, 13.40), zoom=10)
+
+    await user.open('/')
+    m = user.find(ui.leaflet).elements.pop()
+    calls: List[str] = []
+    m.client.run_javascript = lambda code, **_: calls.append(code)  # type: ignore
+    m._handle_init(GenericEventArguments(sender=m, client=m.client, args={
+        'socket_id': 'test', 'bounds': [[52.3, 13.0], [52.7, 13.8]],
+    }))
+    assert len(calls) == 1
+
+    calls.clear()
+    markers = [m.marker(latlng=(52.5, 13.4 + i * 0.01)) for i in range(10)]
+    layer = m.geo_json(data={'type': 'FeatureCollection', 'features': features}, tiled=True)
+    await asyncio.sleep(0)
+    assert len(calls) == 2, 'all layers are added with a single message, followed by the visible features'
+    assert '"update_layers"' in calls[0] and '"Berlin"' not in calls[0]
+    assert '"addData"' in calls[1] and '"Berlin"' in calls[1] and '"London"' not in calls[1]
+
+    calls.clear()
+    m._handle_moveend(GenericEventArguments(sender=m, client=m.client, args={
+        'center': [51.5, 0.0], 'zoom': 10, 'bounds': [[51.3, -0.4], [51.7, 0.4]], 'socket_id': 'test',
+    }))
+    assert len(calls) == 1
+    assert '"addData"' in calls[0] and '"London"' in calls[0] and '"Berlin"' not in calls[0]
+    m._handle_zoomend(GenericEventArguments(sender=m, client=m.client, args={
+        'zoom': 10, 'bounds': [[51.3, -0.4], [51.7, 0.4]], 'socket_id': 'test',
+    }))
+    assert len(calls) == 1, 'features are only sent once'
+
+    calls.clear()
+    m.remove_layers([*markers, layer])
+    await asyncio.sleep(0)
+    assert len(calls) == 1
+    assert layer.id in calls[0] and markers[0].id in calls[0]
+
+    calls.clear()
+    marker = m.marker(latlng=(52.5, 13.4))
+    m._handle_init(GenericEventArguments(sender=m, client=m.client, args={
+        'socket_id': 'other', 'bounds': [[52.3, 13.0], [52.7, 13.8]],
+    }))
+    assert len(calls) == 2, 'pending layers are flushed to all maps before initializing the new one'
+    assert marker.id in calls[0] and marker.id in calls[1]
+    await asyncio.sleep(0)
+    assert len(calls) == 2
+
+
+async def test_tiled_geo_json_with_multiple_browser_tabs(user: User):
+    features = [
+        {'type': 'Feature', 'properties': {'name': 'Berlin'}, 'geometry': {'type': 'Point', 'coordinates': [13.40, 52.52]}},
+        {'type': 'Feature', 'properties': {'name': 'London'}, 'geometry': {'type': 'Point', 'coordinates': [-0.09, 51.51]}},
+    ]
+    berlin = [[52.3, 13.0], [52.7, 13.8]]
+    london = [[51.3, -0.4], [51.7, 0.4]]
+
+    @ui.page('/')
+    def page():
+        ui.leaflet(center=(52.52, 13.40), zoom=10)
+
+    await user.open('/')
+    m = user.find(ui.leaflet).elements.pop()
+    calls: List[Tuple[Optional[str], str]] = []
+    m.client.run_javascript = lambda code, **_: calls.append((m.client._temporary_socket_id, code))  # type: ignore
+    for socket_id in ['socket-a', 'socket-b']:
+        m.client.handle_handshake(socket_id, f'document-{socket_id[-1]}', None)
+
+    def init(socket_id: str, bounds: List[List[float]]) -> None:
+        m._handle_init(GenericEventArguments(sender=m, client=m.client, args={'socket_id': socket_id, 'bounds': bounds}))
+
+    def move(socket_id: str, bounds: List[List[float]]) -> None:
+        m._handle_moveend(GenericEventArguments(sender=m, client=m.client, args={
+            'center': [0, 0], 'zoom': 10, 'bounds': bounds, 'socket_id': socket_id,
+        }))
+
+    init('socket-a', berlin)
+    m.geo_json(data={'type': 'FeatureCollection', 'features': features}, tiled=True)
+    await asyncio.sleep(0)
+
+    calls.clear()
+    init('socket-b', london)
+    assert [socket_id for socket_id, _ in calls] == ['socket-b', 'socket-b']
+    assert '"London"' in calls[1][1] and '"Berlin"' not in calls[1][1], 'each tab gets the features of its own viewport'
+
+    calls.clear()
+    move('socket-a', berlin)
+    move('socket-b', london)
+    assert not calls, 'a new tab does not reset the features sent to the other tabs'
+
+    move('socket-a', london)
+    assert len(calls) == 1
+    assert calls[0][0] == 'socket-a'
+    assert '"London"' in calls[0][1] and '"Berlin"' not in calls[0][1]
+
+    calls.clear()
+    m.client.handle_handshake('socket-c', 'document-a', None)
+    move('socket-c', berlin)
+    assert not calls, 'a reconnected tab keeps its features'
@@ -0,0 +1,79 @@
+import asyncio
+import time
+
+import pytest
+
+from nicegui import app, ui
+from nicegui.testing import User
+
+
+@pytest.fixture
+def monitor():
+    app.loop_monitor.sample_interval = 0.01
+    app.loop_monitor.start()
+    yield app.loop_monitor
+    app.loop_monitor.stop()
+    app.loop_monitor.reset()
+    app.loop_monitor.sample_interval = 0.1
+
+
+async def test_slow_event_handler_is_recorded(user: User, monitor, caplog: pytest.LogCaptureFixture):
+    def block():
+        time.sleep(0.1)
+
+    @ui.page('/')
+    def page():
+        ui.button('Block', on_click=block)
+
+    await user.open('/')
+    user.find('Block').click()
+    await asyncio.sleep(0.2)
+    stats = monitor.get_stats()
+    assert stats['samples'] > 0
+    assert stats['max_lag'] >= 0.05
+    callback = next(callback for callback in stats['slow_callbacks'] if callback['kind'] == 'event')
+    assert callback['name'].endswith('block')
+    assert callback['element'] == 'Button'
+    assert callback['route'] == '/'
+    assert callback['duration'] >= 0.1
+    assert [record.message for record in caplog.records] == \
+        [f'event "{callback["name"]}" blocked the event loop for {callback["duration"]:.3f} s (element Button, route /)']
+    caplog.clear()
+
+
+async def test_async_steps_are_measured(user: User, monitor, caplog: pytest.LogCaptureFixture):
+    async def handler():
+        await asyncio.sleep(0.05)
+        time.sleep(0.06)
+        await asyncio.sleep(0.05)
+
+    @ui.page('/')
+    def page():
+        ui.button('Run', on_click=handler)
+
+    await user.open('/')
+    user.find('Run').click()
+    await asyncio.sleep(0.3)
+    durations = [callback['duration'] for callback in monitor.get_stats()['slow_callbacks']
+                 if callback['name'].endswith('handler')]
+    assert len(durations) == 1
+    assert 0.06 <= durations[0] < 0.1, 'only the longest step counts, not the time spent awaiting'
+    assert len(caplog.records) == 1
+    caplog.clear()
+
+
+async def test_async_page_is_measured(user: User, monitor, caplog: pytest.LogCaptureFixture):
+    @ui.page('/')
+    async def page():
+        await asyncio.sleep(0.01)
+        time.sleep(0.06)
+        ui.label('Hello')
+
+    await user.open('/')
+    await user.should_see('Hello')
+    callbacks = [callback for callback in monitor.get_stats()['slow_callbacks'] if callback['kind'] == 'page']
+    assert len(callbacks) == 1
+    assert callbacks[0]['route'] == '/'
+    assert callbacks[0]['duration'] >= 0.06
+    assert len(caplog.records) == 1
+    caplog.clear()
@@ -0,0 +1,67 @@
+import asyncio
+import re
+
+import pytest
+
+from nicegui import metrics, ui
+from nicegui.testing import User
+
+
+def get_value(text: str, name: str) -> float:
+    match = re.search(rf'^{re.escape(name)} (\S+)$', text, re.MULTILINE)
+    assert match, f'metric {name} not found'
+    return float(match.group(1))
+
+
+async def test_metrics(user: User):
+    @ui.page('/')
+    def page():
+        ui.button('Click', on_click=lambda: ui.label('clicked'))
+
+    await user.open('/')
+    assert user.client is not None
+    count = get_value(metrics.render(), 'nicegui_event_handling_seconds_count')
+    button = user.find(ui.button).elements.pop()
+    listener_id = next(iter(button._event_listeners))  # pylint: disable=protected-access
+    user.client.handle_event({'id': button.id, 'listener_id': listener_id, 'args': []})
+    await user.should_see('clicked')
+
+    text = metrics.render()
+    assert get_value(text, 'nicegui_clients') >= 1
+    assert get_value(text, 'nicegui_elements') >= 1
+    assert get_value(text, 'nicegui_event_handling_seconds_count') == count + 1
+    assert get_value(text, 'nicegui_event_handling_seconds_bucket{le="+Inf"}') == count + 1
+    assert '# TYPE nicegui_storage_write_seconds histogram' in text
+
+
+async def test_async_handler_is_measured_until_it_finishes(user: User):
+    async def handle_click():
+        await asyncio.sleep(0.1)
+        ui.label('clicked')
+
+    @ui.page('/')
+    def page():
+        ui.button('Click', on_click=handle_click)
+
+    await user.open('/')
+    text = metrics.render()
+    count = get_value(text, 'nicegui_event_handling_seconds_count')
+    total = get_value(text, 'nicegui_event_handling_seconds_sum')
+    assert user.client is not None
+    button = user.find(ui.button).elements.pop()
+    listener_id = next(iter(button._event_listeners))  # pylint: disable=protected-access
+    user.client.handle_event({'id': button.id, 'listener_id': listener_id, 'args': []})
+    assert get_value(metrics.render(), 'nicegui_event_handling_seconds_count') == count
+    await user.should_see('clicked')
+    await asyncio.sleep(0.01)
+
+    text = metrics.render()
+    assert get_value(text, 'nicegui_event_handling_seconds_count') == count + 1
+    assert get_value(text, 'nicegui_event_handling_seconds_sum') - total >= 0.1
+
+
+async def test_metrics_route_is_disabled_by_default(user: User, caplog: pytest.LogCaptureFixture):
+    response = await user.http_client.get('/metrics')
+    assert response.status_code == 404
+    assert [record.message for record in caplog.records] == ['http://test/metrics not found']
+    caplog.clear()
@@ -166,3 +166,99 @@ def test_copy():
     assert a == [[0, 2, 3], [4, 5, 6], [7, 8, 9]]
     assert b == [[0, 2, 3], [4, 5, 6]]
     assert c == [[1, 2, 3], [4, 5, 6]]
+
+
+def test_change_event_arguments():
+    changes = []
+    data = ObservableDict({'a': {'b': [1, {'c': 2}]}}, on_change=lambda e: changes.append((e.path, e.operation, e.keys)))
+    data['a']['b'][1]['c'] = 3
+    assert changes[-1] == (('a', 'b', 1), 'set', ('c',))
+    data['a']['b'].append(4)
+    assert changes[-1] == (('a', 'b'), 'insert', (2,))
+    data['a']['b'].insert(0, 0)
+    assert changes[-1] == (('a', 'b'), 'insert', (0,))
+    data['a']['b'][2]['c'] = 4
+    assert changes[-1] == (('a', 'b', 2), 'set', ('c',))
+    data['a']['b'].pop()
+    assert changes[-1] == (('a', 'b'), 'delete', (3,))
+    del data['a']
+    assert changes[-1] == ((), 'delete', ('a',))
+    data.clear()
+    assert changes[-1] == ((), 'replace', ())
+
+    data['a'] = {'b': [1]}
+    detached = copy.copy(data['a']['b'])
+    detached.append(2)
+    assert changes[-1] == ((), 'replace', ())
+
+
+def test_lazy_wrapping():
+    data = ObservableDict({'a': {'b': [1, 2, 3]}})
+    assert type(dict.__getitem__(data, 'a')) is dict  # pylint: disable=unidiomatic-typecheck
+    assert isinstance(data['a'], ObservableDict)
+    assert isinstance(data['a']['b'], ObservableList)
+    assert all(isinstance(value, ObservableDict) for value in ObservableList([{}, {}]))
+
+
+def test_copies_of_lazily_wrapped_collections():
+    reset_counter()
+    data = ObservableDict({'a': {'b': 1}, 'c': [{'d': 1}]}, on_change=increment_counter)
+    data.copy()['a']['b'] = 2
+    assert count == 1
+    dict(data)['a']['c'] = 3
+    assert count == 2
+    {**data}['a']['e'] = 4
+    assert count == 3
+    data['c'].copy()[0]['d'] = 2
+    assert count == 4
+    (data['c'] + [])[0]['d'] = 3
+    assert count == 5
+
+
+def test_popped_collections_are_observed():
+    reset_counter()
+    data = ObservableDict({'a': {'b': 1}, 'c': [{'d': 1}]}, on_change=increment_counter)
+    item = data['c'].pop()
+    assert count == 1
+    item['d'] = 2
+    assert count == 2
+    data.pop('a')['b'] = 2
+    assert count == 4
+
+
+def test_adopting_observables():
+    reset_counter()
+    data = ObservableDict(on_change=increment_counter)
+    data['a'] = ObservableList()
+    assert count == 1
+    data['a'].append(1)
+    assert count == 2
+
+
+def test_batch():
+    changes = []
+    data = ObservableDict({'a': {'x': 1}}, on_change=lambda e: changes.append((e.path, e.operation, e.keys)))
+    with data.batch():
+        data['b'] = 2
+        data['a']['x'] = 3
+        with data.batch():
+            data.update(c=3, b=4)
+        assert not changes
+    assert changes == [((), 'set', ('b', 'a', 'c'))]
+
+    changes.clear()
+    with data.batch():
+        data['d'] = 5
+        del data['b']
+    assert changes == [((), 'replace', ('d', 'b'))]
+
+    changes.clear()
+    with data['a'].batch():
+        data['a']['y'] = 1
+        data['a']['z'] = 2
+    assert changes == [(('a',), 'set', ('y', 'z'))]
+
+    changes.clear()
+    with data.batch():
+        pass
+    assert not changes
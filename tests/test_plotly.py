@@ -1,8 +1,11 @@
+from typing import List
+
 import numpy as np
 import plotly.graph_objects as go
+import pytest
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def test_plotly(screen: Screen):
@@ -47,3 +50,72 @@ def test_create_dynamically(screen: Screen):
     screen.open('/')
     screen.click('Create')
     assert screen.find_by_tag('svg')
+
+
+async def test_streaming_operations(user: User):
+    fig = go.Figure(go.Scatter(x=np.array([0.0, 1.0]), y=np.array([0.0, 1.0])))
+
+    @ui.page('/')
+    def page():
+        ui.plotly(fig)
+
+    await user.open('/')
+    plot = user.find(ui.plotly).elements.pop()
+    trace_json = plot._props['options']['data'][0]
+    calls: List[str] = []
+    plot.client.run_javascript = lambda code, **_: calls.append(code)  # type: ignore
+    plot.extend_traces({'x': [np.array([2.0, 3.0])], 'y': [np.array([4.0, 9.0])]}, [0], max_points=3)
+    assert len(calls) == 1
+    assert '"extend_traces"' in calls[0] and '"dtype":"f8"' in calls[0].replace(' ', '')
+    assert fig.data[0].x.tolist() == [1.0, 2.0, 3.0]
+    assert fig.data[0].y.tolist() == [1.0, 4.0, 9.0]
+
+    plot.restyle({'marker.color': 'red'}, [0])
+    plot.relayout({'title.text': 'Streaming'})
+    assert len(calls) == 3
+    assert fig.data[0].marker.color == 'red'
+    assert fig.layout.title.text == 'Streaming'
+
+    plot.update()
+    assert plot._props['options']['data'][0] is not trace_json
+    assert plot._props['options'] == fig.to_plotly_json()
+
+    trace_json = plot._props['options']['data'][0]
+    plot.update()
+    assert plot._props['options']['data'][0] is trace_json, 'unchanged traces are not converted again'
+
+
+async def test_unchanged_traces_are_not_converted(user: User, monkeypatch: pytest.MonkeyPatch):
+    fig = go.Figure([go.Scatter(y=np.arange(10.0)), go.Bar(y=[1, 2, 3])])
+
+    @ui.page('/')
+    def page():
+        ui.plotly(fig)
+
+    await user.open('/')
+    plot = user.find(ui.plotly).elements.pop()
+    converted: List[str] = []
+    for cls in [go.Scatter, go.Bar]:
+        original = cls.to_plotly_json
+        monkeypatch.setattr(cls, 'to_plotly_json',
+                            lambda self, original=original: converted.append(self.type) or original(self))
+
+    plot.update()
+    assert not converted, 'unchanged traces are not converted again'
+
+    fig.data[1].marker.color = 'red'
+    plot.update()
+    assert converted == ['bar']
+    assert plot._props['options']['data'][1]['marker']['color'] == 'red'
+
+    converted.clear()
+    plot.restyle({'name': 'line'}, [0])
+    plot.update()
+    assert converted == ['scatter']
+    assert plot._props['options']['data'][0]['name'] == 'line'
+
+    converted.clear()
+    fig.add_trace(go.Bar(y=[4, 5]))
+    plot.update()
+    assert converted == ['bar']
+    assert len(plot._props['options']['data']) == 3
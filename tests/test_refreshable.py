@@ -1,7 +1,9 @@
 import asyncio
+from functools import partial
+from typing import Callable
 
 from nicegui import ui
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def test_refreshable(screen: Screen) -> None:
@@ -219,3 +221,131 @@ def test_refreshable_with_return_value(screen: Screen):
 
     screen.open('/')
     screen.should_contain('42')
+
+
+def test_reconciling_refreshable(screen: Screen):
+    items = ['A', 'B', 'C']
+
+    @partial(ui.refreshable, reconcile=True)
+    def rows():
+        for item in items:
+            ui.label(f'Row {item}').mark(f'row-{item}')
+
+    rows()
+    ui.button('Refresh', on_click=rows.refresh)
+
+    screen.open('/')
+    screen.should_contain('Row C')
+    a, b, _ = rows.targets[0].container
+
+    items[:] = ['A', 'X', 'B']
+    screen.click('Refresh')
+    screen.should_contain('Row X')
+    screen.should_not_contain('Row C')
+    new_a, x, new_b = rows.targets[0].container
+    assert new_a is not a and new_a.id == a.id, 'a new element with the old ID was created'
+    assert new_b.id == b.id
+    assert x.id not in {a.id, b.id}
+
+
+async def test_reconciling_refreshable_only_sends_changes(user: User):
+    items = ['A', 'B', 'C']
+
+    @partial(ui.refreshable, reconcile=True)
+    def rows():
+        for item in items:
+            ui.label(f'Row {item}')
+            ui.button(item).on('click', lambda: None, throttle=0.5 if item == 'B' else 1.0)
+
+    @ui.page('/')
+    def page():
+        rows()
+
+    await user.open('/')
+    await asyncio.sleep(0.1)
+    client = user.client
+    assert client is not None
+    container = rows.targets[0].container
+    label_b, button_b = list(container)[2:4]
+    button_a, button_c = list(container)[1], list(container)[5]
+    for button in [button_a, button_b, button_c]:
+        client.handle_event({'id': button.id, 'listener_id': next(iter(button._event_listeners)), 'args': []})
+    listener_ids = [next(iter(button._event_listeners)) for button in [button_a, button_b, button_c]]
+    assert all(listener_id in client.event_limiter._buckets for listener_id in listener_ids)
+    assert not client.outbox.updates
+
+    items[1] = 'X'
+    rows.refresh()
+    assert set(client.outbox.updates) == {label_b.id, button_b.id}, 'only the changed row is sent'
+    assert listener_ids[0] in client.event_limiter._buckets, 'adopted listeners keep their rate limit state'
+    assert listener_ids[1] not in client.event_limiter._buckets, 'replaced listeners are forgotten'
+    assert listener_ids[2] in client.event_limiter._buckets
+    await user.should_see('Row X')
+    await asyncio.sleep(0.1)
+    assert not client.outbox.updates
+
+    items.append('D')
+    rows.refresh()
+    label_d, button_d = list(container)[6:8]
+    assert set(client.outbox.updates) == {container.id, label_d.id, button_d.id}, 'the container gets the new row'
+    await user.should_see('Row D')
+
+
+def test_reconciling_refreshable_with_state(screen: Screen):
+    @partial(ui.refreshable, reconcile=True)
+    def counter():
+        count, set_count = ui.state(0)
+        ui.label(f'Count: {count}')
+        ui.button('Increment', on_click=lambda: set_count(count + 1))
+
+    counter()
+
+    screen.open('/')
+    screen.click('Increment')
+    screen.should_contain('Count: 1')
+    screen.click('Increment')
+    screen.should_contain('Count: 2')
+
+
+async def test_refresh_current_client(create_user: Callable[[], User]):
+    count = {'value': 0}
+
+    @ui.refreshable
+    def counter():
+        ui.label(f'Count: {count["value"]}')
+
+    @ui.page('/')
+    def page():
+        counter()
+
+        def increment():
+            count['value'] += 1
+            counter.refresh_current_client()
+        ui.button('Increment', on_click=increment)
+
+    userA = create_user()
+    userB = create_user()
+    await userA.open('/')
+    await userB.open('/')
+    assert len(counter.targets) == 2
+
+    userA.find('Increment').click()
+    await userA.should_see('Count: 1')
+    await userB.should_see('Count: 0')
+
+
+def test_targets_are_removed_with_their_container(screen: Screen):
+    @ui.refreshable
+    def content():
+        ui.label('content')
+
+    with ui.card() as card:
+        content()
+    ui.button('Delete', on_click=card.delete)
+
+    screen.open('/')
+    assert len(content.targets) == 1
+
+    screen.click('Delete')
+    screen.should_not_contain('content')
+    assert not content.targets
@@ -1,11 +1,14 @@
+import asyncio
+import json
 from typing import List
 
 import numpy as np
+import pytest
 from selenium.common.exceptions import JavascriptException
 
 from nicegui import ui
 from nicegui.elements.scene_object3d import Object3D
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 
 def test_moving_sphere_with_timer(screen: Screen):
@@ -158,3 +161,88 @@ def test_gltf(screen: Screen):
     screen.open('/')
     screen.wait(1.0)
     assert screen.selenium.execute_script(f'return scene_c{scene.id}.children.length') == 5
+
+
+async def test_batched_updates(user: User):
+    @ui.page('/')
+    def page():
+        with ui.scene() as scene:
+            for _ in range(3):
+                scene.box()
+
+    await user.open('/')
+    scene = user.find(ui.scene).elements.pop()
+    calls: List[str] = []
+    scene.client.run_javascript = lambda code, **_: calls.append(code)  # type: ignore
+
+    with scene.batch():
+        for i, obj in enumerate(scene.objects.values()):
+            obj.move(i, 0, 0).scale(2)
+        await asyncio.sleep(0.01)
+        assert not calls, 'updates are held back within a batch'
+    assert len(calls) == 1
+    assert '"apply_updates"' in calls[0]
+
+    calls.clear()
+    box = next(iter(scene.objects.values()))
+    box.move(1, 2, 3)
+    box.move(4, 5, 6)
+    assert not calls, 'updates are collected until the next event loop iteration'
+    await asyncio.sleep(0)
+    assert len(calls) == 1
+    assert f'"move":[["{box.id}"],[4,5,6]]' in calls[0].replace(' ', '')
+
+
+async def test_point_cloud_and_instanced_mesh_buffers(user: User):
+    import base64
+    from array import array
+
+    def unpack(data: str) -> List[float]:
+        return array('f', base64.b64decode(data)).tolist()
+
+    @ui.page('/')
+    def page():
+        with ui.scene() as scene:
+            scene.point_cloud(np.array([[0, 1, 2], [3, 4, 5]]), [[1, 0, 0], [0, 1, 0]])
+            scene.instanced_mesh('sphere', [0.5], positions=[[0, 0, 0], [1, 1, 1], [2, 2, 2]])
+
+    await user.open('/')
+    scene = user.find(ui.scene).elements.pop()
+    cloud, mesh = scene.objects.values()
+    assert unpack(cloud.data[3][0]) == [0, 1, 2, 3, 4, 5]
+    assert unpack(mesh.data[3][5]) == [1] * 9
+
+    calls: List[str] = []
+    scene.client.run_javascript = lambda code, **_: calls.append(code)  # type: ignore
+    cloud.update_points(1, points=np.array([[6, 7, 8]]))
+    assert unpack(cloud.data[3][0]) == [0, 1, 2, 6, 7, 8]
+    assert '"update_points"' in calls[-1]
+    mesh.update_instances(2, scales=[[2, 2, 2]])
+    assert unpack(mesh.data[3][5]) == [1] * 6 + [2] * 3
+    assert '"update_instances"' in calls[-1]
+
+    with pytest.raises(ValueError):
+        mesh.update_instances(2, positions=[[0, 0, 0], [1, 1, 1]])
+    with pytest.raises(ValueError):
+        mesh.update_instances(0, colors=[[1, 0, 0]])
+
+
+async def test_cached_snapshot(user: User):
+    @ui.page('/')
+    def page():
+        with ui.scene() as scene:
+            scene.box().move(1, 2, 3)
+            scene.sphere().with_name('ball')
+
+    await user.open('/')
+    scene = user.find(ui.scene).elements.pop()
+    box, sphere = scene.objects.values()
+    snapshot = scene._get_snapshot()  # pylint: disable=protected-access
+    assert snapshot is scene._get_snapshot(), 'the snapshot is cached'  # pylint: disable=protected-access
+    assert json.loads(snapshot) == [
+        ['box', box.id, 'scene', [1.0, 1.0, 1.0, False], {'move': [1, 2, 3]}],
+        ['sphere', sphere.id, 'scene', [1.0, 32, 16, False], {'name': ['ball']}],
+    ]
+
+    sphere.move(z=1)
+    assert json.loads(scene._get_snapshot())[1][4] == {'name': ['ball'], 'move': [0, 0, 1]}  # pylint: disable=protected-access
@@ -205,3 +205,37 @@ def test_invalid_value(screen: Screen):
         ui.select(['A', 'B', 'C'], value='X')
 
     screen.open('/')
+
+
+def test_server_side_search(screen: Screen):
+    select = ui.select([f'SKU-{i}' for i in range(10_000)], search=True, search_limit=5, search_debounce=0)
+    ui.label().bind_text_from(select, 'value', lambda v: f'value = {v}')
+
+    screen.open('/')
+    screen.find_by_tag('input').click()
+    screen.should_contain('SKU-0')
+    screen.should_not_contain('SKU-5')
+    assert len(select.props['options']) == 5
+
+    screen.find_by_tag('input').send_keys('SKU-1234')
+    screen.wait(0.5)
+    screen.should_contain('SKU-1234')
+    screen.should_not_contain('SKU-0')
+
+    screen.click('SKU-1234')
+    screen.should_contain('value = SKU-1234')
+
+
+def test_server_side_search_callback(screen: Screen):
+    async def search(query: str):
+        return {i: f'Item {i}' for i in range(3) if query in str(i)}
+    select = ui.select({1: 'Item 1'}, value=1, search=search, search_debounce=0)
+
+    screen.open('/')
+    screen.should_contain('Item 1')
+
+    screen.find_by_tag('input').send_keys('2')
+    screen.wait(0.5)
+    screen.click('Item 2')
+    screen.wait(0.5)
+    assert select.value == 2
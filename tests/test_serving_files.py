@@ -1,4 +1,5 @@
 
+import os
 import re
 from pathlib import Path
 
@@ -6,7 +7,9 @@ import httpx
 import pytest
 import requests
 
-from nicegui import __version__, app, ui
+from nicegui import __version__, app, staticfiles, ui
+from nicegui.dependencies import Library
+from nicegui.staticfiles import AssetCache
 from nicegui.testing import Screen
 
 from .test_helpers import TEST_DIR
@@ -118,3 +121,95 @@ def test_mimetypes_of_static_files(screen: Screen):
     response = requests.get(f'http://localhost:{Screen.PORT}/_nicegui/{__version__}/static/nicegui.css', timeout=5)
     assert response.status_code == 200
     assert response.headers['Content-Type'].startswith('text/css')
+
+
+def test_media_file_conditional_and_multi_range_requests(screen: Screen):
+    url_path = app.add_media_file(local_file=VIDEO_FILE)
+
+    screen.open('/')
+    with httpx.Client() as http_client:
+        url = f'http://localhost:{Screen.PORT}{url_path}'
+        r = http_client.get(url)
+        assert r.status_code == 200
+        assert r.content == VIDEO_FILE.read_bytes()
+        e_tag = r.headers['ETag']
+
+        r = http_client.get(url, headers={'If-None-Match': e_tag})
+        assert r.status_code == 304
+
+        r = http_client.get(url, headers={'Range': 'bytes=0-9', 'If-Range': e_tag})
+        assert r.status_code == 206
+        r = http_client.get(url, headers={'Range': 'bytes=0-9', 'If-Range': '"outdated"'})
+        assert r.status_code == 200
+
+        r = http_client.get(url, headers={'Range': 'bytes=0-9, 100-199'})
+        assert r.status_code == 206
+        assert r.headers['Content-Type'].startswith('multipart/byteranges; boundary=')
+        assert r.headers['Content-Length'] == str(len(r.content))
+
+        r = http_client.get(url, headers={'Range': 'bytes=100000000-'})
+        assert r.status_code == 416
+
+
+def test_compressed_and_conditional_static_files(screen: Screen):
+    screen.open('/')
+
+    url = f'http://localhost:{Screen.PORT}/_nicegui/{__version__}/static/quasar.umd.prod.js'
+    with httpx.Client() as http_client:
+        r = http_client.get(url, headers={'Accept-Encoding': 'gzip'})
+        assert r.status_code == 200
+        assert r.headers['Content-Encoding'] == 'gzip'
+        assert 'Accept-Encoding' in r.headers['Vary']
+
+        e_tag = r.headers['ETag']
+        r = http_client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': e_tag})
+        assert r.status_code == 304
+        r = http_client.get(url, headers={'Accept-Encoding': 'gzip', 'If-None-Match': f'"other", W/{e_tag}'})
+        assert r.status_code == 304
+
+        r = http_client.get(url, headers={'Accept-Encoding': 'identity'})
+        assert r.status_code == 200
+        assert 'Content-Encoding' not in r.headers
+
+
+def test_asset_cache(tmp_path: Path):
+    asset_cache = AssetCache(validation_interval=0)
+    app.config.asset_cache_size = 1000
+    try:
+        small_file = tmp_path / 'small.js'
+        small_file.write_text('a' * 100)
+        asset = asset_cache.get(small_file)
+        assert asset is not None and asset.data == b'a' * 100
+        assert asset_cache.get(small_file) is asset, 'unchanged files should be served from memory'
+
+        small_file.write_text('b' * 200)
+        os.utime(small_file, ns=(asset.mtime_ns + 1_000_000, asset.mtime_ns + 1_000_000))
+        asset = asset_cache.get(small_file)
+        assert asset is not None and asset.data == b'b' * 200, 'modified files should be reloaded'
+
+        large_file = tmp_path / 'large.js'
+        large_file.write_text('c' * 2000)
+        assert asset_cache.get(large_file) is None, 'files exceeding the cache size should not be cached'
+
+        for i in range(10):
+            (tmp_path / f'{i}.js').write_text('d' * 300)
+            asset_cache.get(tmp_path / f'{i}.js')
+        assert asset_cache.size <= 1000, 'least recently used assets should be evicted'
+
+        small_file.unlink()
+        assert asset_cache.get(small_file) is None
+    finally:
+        app.config.asset_cache_size = 0
+
+
+def test_library_hash_follows_file_changes(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    path = tmp_path / 'lib.js'
+    path.write_text('a')
+    library = Library(key='lib', name='lib', path=path, expose=False)
+    content_hash = library.content_hash
+
+    path.write_text('bb')
+    assert library.content_hash == content_hash, 'the hash should only be validated once per validation interval'
+
+    monkeypatch.setattr(staticfiles.asset_cache, 'validation_interval', 0.0)
+    assert library.content_hash != content_hash, 'modified files should get a new hash'
@@ -5,6 +5,7 @@ import pytest
 
 from nicegui import app, ui
 from nicegui.testing import Screen, User
+from nicegui.timer import scheduler
 
 
 class Counter:
@@ -173,3 +174,17 @@ def test_app_timer(screen: Screen):
     screen.open('/')
     screen.wait(0.5)
     assert counter.value > value, 'timer is also incrementing when opening another page'
+
+
+def test_timers_share_wakeups(screen: Screen):
+    counter = Counter()
+    for _ in range(100):
+        ui.timer(0.1, counter.increment, align=True)
+
+    screen.open('/')
+    screen.wait(0.5)
+    value = counter.value
+    wakeups = scheduler.wakeups
+    screen.wait(1.0)
+    assert counter.value - value >= 500, 'all timers are running'
+    assert scheduler.wakeups - wakeups <= 15, 'timers with the same interval share their wakeups'
@@ -125,3 +125,39 @@ def test_filter(screen: Screen):
     screen.should_contain('Apple')
     screen.should_contain('Banana')
     screen.should_not_contain('Cherry')
+
+
+def test_lazy_loading(screen: Screen):
+    async def load_children(node):
+        return [{'id': f'{node["id"]}.{i}'} for i in range(2)]
+    tree = ui.tree([{'id': 'root', 'lazy': True}], label_key='id', load_children=load_children)
+
+    screen.open('/')
+    screen.should_contain('root')
+    screen.should_not_contain('root.0')
+
+    screen.find_by_class('q-icon').click()
+    screen.should_contain('root.0')
+    screen.should_contain('root.1')
+    assert tree.props['nodes'] == [{'id': 'root', 'children': [{'id': 'root.0'}, {'id': 'root.1'}]}]
+    assert tree._find_node_keys() == {'root', 'root.0', 'root.1'}  # pylint: disable=protected-access
+
+
+def test_node_patches(screen: Screen):
+    tree = ui.tree([{'id': 'numbers', 'label': 'Numbers', 'children': [{'id': '1', 'label': 'One'}]}]).expand()
+    ui.button('Add', on_click=lambda: tree.add_nodes([{'id': '2', 'label': 'Two'}], parent_key='numbers'))
+    ui.button('Rename', on_click=lambda: tree.update_node('1', {'label': 'First'}))
+    ui.button('Remove', on_click=lambda: tree.remove_nodes(['2']))
+
+    screen.open('/')
+    screen.should_contain('One')
+
+    screen.click('Add')
+    screen.should_contain('Two')
+
+    screen.click('Rename')
+    screen.should_contain('First')
+
+    screen.click('Remove')
+    screen.should_not_contain('Two')
+    assert tree.props['nodes'] == [{'id': 'numbers', 'label': 'Numbers', 'children': [{'id': '1', 'label': 'First'}]}]
@@ -2,7 +2,7 @@ from pathlib import Path
 from typing import List
 
 from nicegui import events, ui
-from nicegui.testing import Screen
+from nicegui.testing import Screen, User
 
 test_path1 = Path('tests/test_upload.py').resolve()
 test_path2 = Path('tests/test_scene.py').resolve()
@@ -107,3 +107,29 @@ def test_multi_upload_event(screen: Screen):
     assert results[0].names == [test_path1.name, test_path2.name]
     assert results[0].contents[0].read() == test_path1.read_bytes()
     assert results[0].contents[1].read() == test_path2.read_bytes()
+
+
+async def test_streaming_upload(user: User):
+    chunks: List[events.UploadChunkEventArguments] = []
+    results: List[events.UploadEventArguments] = []
+    progress: List[events.UploadProgressEventArguments] = []
+    rejected: List[events.UiEventArguments] = []
+    upload = ui.upload(on_chunk=chunks.append, on_upload=results.append, on_progress=progress.append,
+                       on_rejected=rejected.append, max_file_size=100_000)
+
+    await user.open('/')
+    url = upload.props['url']
+    response = await user.http_client.post(url, files={'file': ('test.py', test_path1.read_bytes(), 'text/x-python')})
+    assert response.status_code == 200
+    assert b''.join(chunk.chunk for chunk in chunks) == test_path1.read_bytes()
+    assert [chunk.final for chunk in chunks] == [False] * (len(chunks) - 1) + [True]
+    assert chunks[-1].name == 'test.py'
+    assert results[0].name == 'test.py'
+    assert results[0].type == 'text/x-python'
+    assert results[0].content.read() == test_path1.read_bytes()
+    assert progress[-1].bytes_received == progress[-1].total_bytes
+
+    response = await user.http_client.post(url, files={'file': ('large.bin', bytes(200_000), 'application/octet-stream')})
+    assert response.status_code == 413
+    assert len(results) == 1
+    assert len(rejected) == 1
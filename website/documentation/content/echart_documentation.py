@@ -47,6 +47,29 @@ def dynamic_properties() -> None:
     })
 
 
+@doc.demo('Appending data', '''
+    When calling `update()`, only the parts of the options which changed since the last update are sent to the browser.
+    The `append_data` method adds data points to a series and sends only the new points,
+    which is useful for long, growing time series.
+
+    *Added in version 2.15.0*
+''')
+def append_data():
+    import random
+
+    chart = ui.echart({
+        'xAxis': {'type': 'value'},
+        'yAxis': {'type': 'value'},
+        'series': [{'type': 'line', 'data': [[0, 0]], 'showSymbol': False}],
+    })
+
+    def add_point():
+        x, y = chart.options['series'][0]['data'][-1]
+        chart.append_data(0, [[x + 1, y + random.uniform(-1, 1)]])
+
+    ui.timer(0.2, add_point)
+
+
 @doc.demo('EChart with custom theme', '''
     You can apply custom themes created with the [Theme Builder](https://echarts.apache.org/en/theme-builder.html).
 
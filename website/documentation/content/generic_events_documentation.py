@@ -137,3 +137,18 @@ def pure_javascript() -> None:
         .on('click', js_handler='''() => {
             navigator.clipboard.writeText("Hello, NiceGUI!");
         }''')
+
+
+doc.text('Server-side event limits', '''
+    The `throttle` of an event listener is also enforced on the server,
+    so that a misbehaving browser cannot flood the server with events.
+    Each listener may send a short burst of events, after which further events are dropped
+    until the rate allowed by its `throttle` is reached again.
+    Value updates ("update:model-value") are not dropped: the latest value is delivered as soon as the rate allows.
+
+    With `ui.run(max_event_rate=...)` you can limit the number of events per second for all listeners
+    and with `ui.run(max_concurrent_event_handlers=...)` the number of async event handlers running concurrently per client.
+    The number of dropped events is available as `client.event_limiter.dropped`.
+
+    *Added in version 2.15.0*
+''')
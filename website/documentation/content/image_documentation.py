@@ -25,6 +25,13 @@ def base64():
 
 @doc.demo('PIL image', '''
     You can also use a PIL image as image source.
+    It is converted to PNG by default.
+    You can choose another format and quality by setting the `PIL_CONVERT_FORMAT` and `PIL_CONVERT_QUALITY` attributes
+    of an image element or of the `ui.image` class, e.g. "WEBP" with a quality of 80 for photographic content.
+    Converted images are cached by content, so the same image is only encoded once, even if it is shown on many pages.
+    Larger images are converted in a separate thread to keep the event loop responsive.
+
+    *Format quality and background conversion added in version 2.15.0*
 ''')
 def pil():
     import numpy as np
@@ -102,4 +102,31 @@ def svg_content():
     ''').on('svg:pointerdown', lambda e: ui.notify(f'SVG clicked: {e.args}'))
 
 
+@doc.demo('Frame streams', '''
+    For video-like content you can pass a `FrameStream` as source and push frames to it.
+    The frames are sent as one continuous HTTP response which is rendered natively by the browser.
+    Each frame is encoded only once for all clients and slow clients skip stale frames.
+    See the [OpenCV Webcam example](https://github.com/zauberzeug/nicegui/tree/main/examples/opencv_webcam/main.py) for a complete application.
+
+    *Added in version 2.15.0*
+''')
+def frame_stream():
+    import time
+
+    from PIL import Image, ImageDraw
+
+    from nicegui import FrameStream
+
+    stream = FrameStream()
+
+    def push_frame():
+        image = Image.new('RGB', (320, 180), 'white')
+        x = int(time.time() * 100) % 320
+        ImageDraw.Draw(image).rectangle((x - 10, 80, x + 10, 100), fill='red')
+        stream.push(image)
+
+    ui.interactive_image(stream)
+    ui.timer(0.1, push_frame)
+
+
 doc.reference(ui.interactive_image)
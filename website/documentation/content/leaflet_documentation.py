@@ -87,6 +87,34 @@ def vector_layers() -> None:
     m.generic_layer(name='circle', args=[m.center, {'color': 'red', 'radius': 300}])
 
 
+@doc.demo('Many Layers and Large GeoJSON', '''
+    Layers which are added or removed within one event loop iteration are sent to the client in a single message.
+    Use `remove_layers` to remove many layers at once
+    and `with m.batch():` to hold back layer changes even across `await` statements.
+
+    Large GeoJSON data can be added with `geo_json(..., tiled=True)`.
+    The features are indexed by map tiles on the server
+    and only features within the current viewport are sent, more of them as the map is moved or zoomed.
+
+    *Added in version 2.15.0*
+''')
+def many_layers() -> None:
+    import random
+
+    m = ui.leaflet(center=(51.505, -0.09), zoom=11).classes('h-32')
+    m.geo_json(data={
+        'type': 'FeatureCollection',
+        'features': [
+            {
+                'type': 'Feature',
+                'geometry': {'type': 'Point', 'coordinates': [random.uniform(-10, 10), random.uniform(45, 55)]},
+                'properties': {},
+            }
+            for _ in range(10_000)
+        ],
+    }, tiled=True)
+
+
 @doc.demo('Disable Pan and Zoom', '''
     There are [several options to configure the map in Leaflet](https://leafletjs.com/reference.html#map).
     This demo disables the pan and zoom controls.
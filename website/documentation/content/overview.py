@@ -446,6 +446,8 @@ def map_of_nicegui():
 
         - `create()`: create a background task
         - `create_lazy()`: prevent two tasks with the same name from running at the same time
+        - `configure_group()`: limit the number of running tasks of a group in total and per client
+        - `get_task_infos()`: list all tasks with their name, group, client ID, age and state
 
         #### `run`
 
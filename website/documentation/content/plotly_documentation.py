@@ -67,6 +67,29 @@ def plot_updates():
     ui.button('Add trace', on_click=add_trace)
 
 
+@doc.demo('Streaming data', '''
+    Instead of sending the whole figure with every update,
+    you can use `extend_traces`, `restyle` and `relayout` to only send the changes.
+    They correspond to the Plotly.js functions of the same name and also update the figure on the server.
+    NumPy arrays are sent as binary typed arrays.
+
+    *Added in version 2.15.0*
+''')
+def plot_streaming():
+    import numpy as np
+    import plotly.graph_objects as go
+
+    fig = go.Figure(go.Scatter(x=np.arange(10), y=np.random.randn(10)))
+    fig.update_layout(margin=dict(l=0, r=0, t=0, b=0))
+    plot = ui.plotly(fig).classes('w-full h-40')
+
+    def add_points():
+        start = len(fig.data[0].x)
+        plot.extend_traces({'x': [np.arange(start, start + 5)], 'y': [np.random.randn(5)]}, [0], max_points=50)
+
+    ui.timer(0.5, add_points)
+
+
 @doc.demo('Plot events', r'''
     This demo shows how to handle Plotly events.
     Try clicking on a data point to see the event data.
@@ -181,4 +181,50 @@ def local_scope_c():
     ui.link('Open demo', demo)
 
 
+@doc.demo('Reconciliation', '''
+    By default, `refresh` deletes all elements and recreates them.
+    With `reconcile=True`, new elements take over the IDs of matching old ones
+    and only elements which have changed are sent to the browser.
+    Elements are matched by type, tag and markers in order of appearance.
+    Mark elements with a key to keep them matched when items are inserted or reordered.
+    This is only supported for synchronous functions.
+
+    *Added in version 2.15.0*
+''')
+def reconciliation_demo():
+    from functools import partial
+
+    numbers = list(range(1, 6))
+
+    @partial(ui.refreshable, reconcile=True)
+    def number_list():
+        for n in numbers:
+            ui.label(f'Number {n}').mark(f'number-{n}')
+
+    def insert():
+        numbers.insert(0, numbers[0] - 1)
+        number_list.refresh()
+
+    number_list()
+    ui.button('Insert', on_click=insert)
+
+
+@doc.demo('Refresh for the current client only', '''
+    When a refreshable function is used on pages of many clients, `refresh` rebuilds the elements of all of them.
+    `refresh_current_client` only rebuilds the elements of the current client.
+    Elements created by `ui.state` are refreshed the same way: only the affected container is rebuilt.
+
+    *Added in version 2.15.0*
+''')
+def refresh_current_client_demo():
+    from datetime import datetime
+
+    @ui.refreshable
+    def time():
+        ui.label(f'Time: {datetime.now():%X}')
+
+    time()
+    ui.button('Refresh', on_click=time.refresh_current_client)
+
+
 doc.reference(ui.refreshable)
@@ -144,6 +144,8 @@ def immediate_updates() -> None:
     You can render point clouds using the `point_cloud` method.
     The `points` argument is a list of point coordinates, and the `colors` argument is a list of RGB colors (0..1).
     You can update the cloud using its `set_points()` method.
+    To change only some of the points, use `update_points()` with the index of the first point to change
+    (*added in version 2.15.0*).
 ''')
 def point_clouds() -> None:
     import numpy as np
@@ -163,6 +165,30 @@ def point_clouds() -> None:
         .on_value_change(lambda e: point_cloud.set_points(*generate_data(e.value)))
 
 
+@doc.demo('Instanced meshes', '''
+    To render many copies of the same geometry, you can use an instanced mesh.
+    Positions, rotations, scales and colors are passed as lists or NumPy arrays with one row per instance
+    and transmitted as binary buffers.
+    With `update_instances()` you can change a range of instances without re-sending all of them.
+
+    *Added in version 2.15.0*
+''')
+def instanced_meshes() -> None:
+    import numpy as np
+
+    positions = np.random.uniform(-3, 3, (1000, 3)) + [0, 0, 3]
+    colors = np.random.uniform(0, 1, (1000, 3))
+
+    with ui.scene().classes('w-full h-64') as scene:
+        mesh = scene.instanced_mesh('box', [0.1, 0.1, 0.1], positions=positions, colors=colors)
+
+    def shuffle():
+        start = np.random.randint(0, 900)
+        mesh.update_instances(start, positions=np.random.uniform(-3, 3, (100, 3)) + [0, 0, 3])
+
+    ui.button('Shuffle 100 boxes', on_click=shuffle)
+
+
 @doc.demo('Wait for Initialization', '''
     You can wait for the scene to be initialized with the `initialized` method.
     This demo animates a camera movement after the scene has been fully loaded.
@@ -291,4 +317,28 @@ def attach_detach() -> None:
     ui.button('Attach', on_click=lambda: a.attach(group))
 
 
+@doc.demo('Batched updates', '''
+    Changes of the position, rotation, scale, material, name, visibility and draggability of objects
+    are collected and sent to the browser as one packed update per event loop iteration.
+    Within a `scene.batch()` context they are held back until leaving the context,
+    even if the code in between awaits other operations.
+
+    *Added in version 2.15.0*
+''')
+def batched_updates() -> None:
+    import math
+    import time
+
+    with ui.scene().classes('w-full h-64') as scene:
+        spheres = [scene.sphere(0.1) for _ in range(200)]
+
+    def animate():
+        t = time.time()
+        with scene.batch():
+            for i, sphere in enumerate(spheres):
+                sphere.move(math.cos(i + t) * i / 50, math.sin(i + t) * i / 50, 0.1)
+
+    ui.timer(0.05, animate)
+
+
 doc.reference(ui.scene)
@@ -81,6 +81,32 @@ def env_var_demo():
     ui.label(f'Markdown content cache size is {markdown.prepare_content.cache_info().maxsize}')
 
 
+doc.text('Loop Monitor', '''
+    All event handlers, timers and page builds share a single event loop.
+    With `ui.run(loop_monitor=True)` NiceGUI samples how late the loop wakes up sleeping tasks ("loop lag")
+    and logs a warning for every callback blocking the loop longer than `app.loop_monitor.slow_callback_threshold` (default: 0.05 seconds),
+    attributed to the element type and page route.
+    The monitor can also be started and stopped at runtime:
+
+    ```py
+    app.loop_monitor.start()
+    ...
+    stats = app.loop_monitor.get_stats()  # lag statistics and the slowest callbacks
+    app.loop_monitor.stop()
+    ```
+
+    *Added in version 2.15.0*
+''')
+
+doc.text('Metrics', '''
+    With `ui.run(metrics=True)` NiceGUI serves runtime metrics in the Prometheus text format at `/metrics`,
+    e.g. the number of clients and elements, pending outbox updates, binding links, background tasks and timers,
+    as well as histograms of event handling, binding refresh and storage write durations.
+    No additional package is required.
+
+    *Added in version 2.15.0*
+''')
+
 doc.text('Custom Vue Components', '''
     You can create custom components by subclassing `ui.element` and implementing a corresponding Vue component.
     The ["Custom Vue components" example](https://github.com/zauberzeug/nicegui/tree/main/examples/custom_vue_component)
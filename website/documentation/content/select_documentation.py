@@ -50,4 +50,17 @@ def update_selection():
         ui.button('1, 2, 3', on_click=lambda: select.set_options([1, 2, 3], value=1))
 
 
+@doc.demo('Server-side search', '''
+    For very large numbers of options, `search=True` filters the options on the server
+    and only sends the first `search_limit` matches to the browser.
+    More matches are loaded when scrolling to the end of the list.
+    You can also pass a (possibly async) callback which returns the matching options, e.g. from a database.
+
+    *Added in version 2.15.0*
+''')
+def server_side_search():
+    skus = [f'SKU-{i:06d}' for i in range(200_000)]
+    ui.select(skus, label='Product', search=True).classes('w-64')
+
+
 doc.reference(ui.select)
@@ -181,6 +181,16 @@ doc.text('Indentation', '''
 ''')
 
 
+doc.text('Batch updates', '''
+    Every modification of a storage notifies its observers and schedules a write to the persistence layer.
+    When changing many entries at once, you can wrap the modifications in `with app.storage.user.batch():`
+    (or `with app.storage.batch():` for the general storage and the current user and tab storage)
+    to emit a single change with all modified keys when leaving the context.
+
+    *Added in version 2.15.0*
+''')
+
+
 doc.text('Redis storage', '''
     You can use [Redis](https://redis.io/) for storage as an alternative to the default file storage.
     This is useful if you have multiple NiceGUI instances and want to share data across them.
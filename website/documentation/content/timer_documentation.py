@@ -64,4 +64,22 @@ def app_timer_demo():
     page()  # HIDE
 
 
+@doc.demo('Alignment and jitter', '''
+    All timers are run by a single scheduler task.
+    Periodic timers with the same interval and `align=True` are aligned,
+    so that the scheduler wakes up only once for all of them.
+    Use `jitter` to add a random delay to each run, e.g. to spread the load of many expensive timers.
+    While a client is disconnected, its timers are paused.
+
+    *Added in version 2.15.0*
+''')
+def alignment_and_jitter_demo():
+    from datetime import datetime
+
+    aligned = ui.label()
+    ui.timer(1.0, lambda: aligned.set_text(f'aligned: {datetime.now():%X.%f}'), align=True)
+    jittered = ui.label()
+    ui.timer(1.0, lambda: jittered.set_text(f'jittered: {datetime.now():%X.%f}'), jitter=0.5)
+
+
 doc.reference(ui.timer)
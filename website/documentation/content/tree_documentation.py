@@ -106,4 +106,20 @@ def filter_nodes():
     ui.input('filter').bind_value_to(t, 'filter')
 
 
+@doc.demo('Lazy loading', '''
+    Nodes with `lazy: True` get their children from the `load_children` callback when they are expanded for the first time.
+    This way, even huge trees like file systems can be displayed without sending all nodes at once.
+    Nodes can also be added, removed and updated with `add_nodes()`, `remove_nodes()` and `update_node()`,
+    which only send the changed nodes to the client.
+
+    *Added in version 2.15.0*
+''')
+def lazy_loading():
+    def load_children(node: dict) -> list:
+        return [{'id': f'{node["id"]}.{i}', 'lazy': True} for i in range(1, 4)]
+
+    t = ui.tree([{'id': '1', 'lazy': True}], label_key='id', load_children=load_children)
+    ui.button('Add root node', on_click=lambda: t.add_nodes([{'id': str(len(t.props['nodes']) + 1), 'lazy': True}]))
+
+
 doc.reference(ui.tree)
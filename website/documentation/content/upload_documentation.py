@@ -37,20 +37,31 @@ def show_file_content() -> None:
 
 
 @doc.demo('Uploading large files', '''
-    Large file uploads may encounter issues due to the default file size parameter set within the underlying Starlette library.
-    To ensure smooth uploads of larger files, it is recommended to increase the `max_file_size` parameter in Starlette's `MultiPartParser` class from the default of `1024 * 1024` (1 MB) to a higher limit that aligns with the expected file sizes.
+    The upload is parsed while it is being received.
+    Files are only kept in a temporary buffer (in memory up to 1 MB, on disk beyond that) if there are `on_upload` or `on_multi_upload` handlers.
+    To process large files without buffering them, you can register an `on_chunk` handler instead.
+    It is called for every chunk of a file as soon as it arrives and may be async, e.g. to write the data to a file or a cloud storage.
+    The `on_progress` handler reports the number of bytes received so far.
 
-    This demo increases Starlette Multiparser's `max_file_size` to be kept in RAM to 5 MB.
-    This change allows the system to handle larger files more efficiently by keeping them in RAM, thus avoiding the need to write data to temporary files on disk and preventing upload "stuttering".
-
-    However, be mindful of the potential impact on your server when allowing users to upload large files and retaining them in RAM.
+    *Added in version 2.15.0*
 ''')
 def uploading_large_files() -> None:
-    from starlette.formparsers import MultiPartParser
+    import hashlib
 
-    MultiPartParser.max_file_size = 1024 * 1024 * 5  # 5 MB
+    from nicegui import events
 
-    ui.upload(on_upload=lambda e: ui.notify(f'Uploaded {e.name}')).classes('max-w-full')
+    hashes = {}
+
+    def handle_chunk(e: events.UploadChunkEventArguments):
+        hashes.setdefault(e.name, hashlib.sha256()).update(e.chunk)
+        if e.final:
+            ui.notify(f'{e.name}: {hashes.pop(e.name).hexdigest()[:16]}')
+
+    def handle_progress(e: events.UploadProgressEventArguments):
+        progress.value = e.bytes_received / (e.total_bytes or 1)
+
+    ui.upload(on_chunk=handle_chunk, on_progress=handle_progress).classes('max-w-full')
+    progress = ui.linear_progress(value=0, show_value=False)
 
 
 doc.reference(ui.upload)